@@ -0,0 +1,100 @@
+"""Benchmark parsing large volumetric data files with Chgcar.from_file, on a generated
+spin-polarized CHGCAR with random grids, against converting the same grid lines one
+line at a time.
+
+Usage:
+    python benchmark_chgcar_parsing.py [--grid 160] [--repeat 3] [--gzip] [--keep FILE]
+
+--grid sets the number of points along each lattice vector, so that each of the total
+and diff grids holds grid**3 values.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+from monty.io import zopen
+
+from pymatgen.core import Structure
+from pymatgen.io.vasp.inputs import Poscar
+from pymatgen.io.vasp.outputs import Chgcar
+from pymatgen.util.testing import VASP_IN_DIR
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-19"
+
+
+def write_chgcar(filename: str, grid: int) -> None:
+    """Write a spin-polarized CHGCAR with random total and diff grids of grid**3 points,
+    in the format of VASP with 5 values per line.
+    """
+    poscar = Poscar(Structure.from_file(f"{VASP_IN_DIR}/POSCAR"))
+    rng = np.random.default_rng(0)
+    with zopen(filename, mode="wt", encoding="utf-8") as file:
+        file.write(f"{poscar.get_str()}\n")
+        for _ in ("total", "diff"):
+            file.write(f"   {grid}   {grid}   {grid}\n")
+            values = rng.random(grid**3)
+            n_full = len(values) // 5 * 5
+            np.savetxt(file, values[:n_full].reshape(-1, 5), fmt="%18.11E", delimiter="")
+            if n_full < len(values):
+                file.write("".join(f"{val:18.11E}" for val in values[n_full:]) + "\n")
+
+
+def parse_line_by_line(filename: str, n_values: int) -> np.ndarray:
+    """Convert the lines of the first grid one at a time, for comparison."""
+    values: list[float] = []
+    with zopen(filename, mode="rt", encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                break
+        next(file)
+        for line in file:
+            values.extend(float(val) for val in line.split())
+            if len(values) >= n_values:
+                break
+    return np.array(values[:n_values])
+
+
+def best_time(func, *args, repeat: int) -> float:
+    """Best time of repeat calls of func."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--grid", type=int, default=160, help="Number of grid points along each lattice vector.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs, the best time is reported.")
+    parser.add_argument("--gzip", action="store_true", help="Write and parse a gzipped CHGCAR.")
+    parser.add_argument("--keep", help="Write the generated CHGCAR to this file instead of a temporary one.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = args.keep or os.path.join(tmp_dir, "CHGCAR.gz" if args.gzip else "CHGCAR")
+        start = time.perf_counter()
+        write_chgcar(filename, args.grid)
+        n_values = args.grid**3
+        size = os.path.getsize(filename) / 1e6
+        print(f"{filename}: 2 x {n_values:,} values, {size:.1f} MB, written in {time.perf_counter() - start:.1f} s")
+
+        chgcar = Chgcar.from_file(filename)
+        if not chgcar.is_spin_polarized or chgcar.data["diff"].shape != (args.grid,) * 3:
+            raise RuntimeError(f"{filename} was not parsed as a spin-polarized {args.grid}^3 grid")
+
+        elapsed = best_time(Chgcar.from_file, filename, repeat=args.repeat)
+        print(f"  {'Chgcar.from_file':<18} {elapsed:8.3f} s {2 * n_values / elapsed / 1e6:8.1f} M values/s")
+        elapsed = best_time(parse_line_by_line, filename, n_values, repeat=args.repeat)
+        print(f"  {'line by line':<18} {elapsed:8.3f} s {n_values / elapsed / 1e6:8.1f} M values/s (total grid only)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark the conversion of the numeric blocks of vasprun.xml files, i.e. the DOS,
+eigenvalues and projected eigenvalues (LORBIT) of the final calculation, as well as
+parsing the whole file with Vasprun.
+
+Usage:
+    python benchmark_vasprun_parsing.py [vasprun.xml ...] [--repeat 3] [--scale 10]
+
+--scale repeats the k-points of the projected eigenvalues to emulate a large LORBIT run.
+Defaults to the LORBIT vasprun.xml of the test files.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import time
+from xml.etree import ElementTree as ET
+
+from monty.io import zopen
+
+from pymatgen.io.vasp.outputs import Vasprun
+from pymatgen.util.testing import VASP_OUT_DIR
+
+__author__ = "Pymatgen Development Team"
+__date__ = "2026-10-18"
+
+BLOCKS = {
+    "dos": Vasprun._parse_dos,
+    "eigenvalues": Vasprun._parse_eigen,
+    "projected": Vasprun._parse_projected_eigen,
+}
+
+
+def best_time(func, elem: ET.Element, repeat: int) -> float:
+    """Best time of parsing a copy of an element, as the parsers clear it."""
+    times = []
+    for _ in range(repeat):
+        elem_copy = copy.deepcopy(elem)
+        start = time.perf_counter()
+        func(elem_copy)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def scale_kpoints(projected: ET.Element, scale: int) -> None:
+    """Repeat the k-points of all spins of a <projected> block in place."""
+    for spin in projected.find("array").find("set").findall("set"):
+        kpoints = spin.findall("set")
+        for _ in range(scale - 1):
+            spin.extend(copy.deepcopy(kpoints))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", default=[f"{VASP_OUT_DIR}/vasprun.xml.gz"])
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs, the best time is reported.")
+    parser.add_argument("--scale", type=int, default=1, help="Factor to repeat the projected k-points by.")
+    args = parser.parse_args()
+
+    for filename in args.files:
+        print(filename)
+        with zopen(filename, mode="rb") as file:
+            calculation = ET.parse(file).getroot().findall("calculation")[-1]
+
+        for tag, func in BLOCKS.items():
+            if (elem := calculation.find(tag)) is None:
+                continue
+            if tag == "projected" and args.scale > 1:
+                scale_kpoints(elem, args.scale)
+            n_values = sum(len(row.text.split()) for row in elem.iter("r"))
+            elapsed = best_time(func, elem, args.repeat)
+            print(f"  {tag:<12} {n_values:>12,} values {elapsed:8.3f} s {n_values / elapsed / 1e6:8.1f} M values/s")
+
+        start = time.perf_counter()
+        Vasprun(filename, parse_projected_eigen=True, parse_potcar_file=False)
+        print(f"  {'Vasprun':<12} {time.perf_counter() - start:29.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,9 +32,10 @@ import numpy as np
 import plotly.express as px
 from monty.json import MSONable
 from plotly.graph_objects import Figure, Mesh3d, Scatter, Scatter3d
+from scipy.optimize import linprog
 from scipy.spatial import ConvexHull, HalfspaceIntersection
 
-from pymatgen.analysis.phase_diagram import PDEntry, PhaseDiagram
+from pymatgen.analysis.phase_diagram import PDEntry, PhaseDiagram, _get_qhull_data_and_facets
 from pymatgen.core import PKG_DIR
 from pymatgen.core.composition import Composition, Element
 from pymatgen.util.coord import Simplex
@@ -118,6 +119,8 @@ class ChemicalPotentialDiagram(MSONable):
         self._entry_dict = {ent.reduced_formula: ent for ent in self._min_entries}
         self._border_hyperplanes = self._get_border_hyperplanes()
         self._hyperplanes, self._hyperplane_entries = self._get_hyperplanes_and_entries()
+        self._slice_domains: dict[tuple[tuple[Element, float], ...], dict[str, np.ndarray]] = {}
+        self._subsystem_diagrams: dict[tuple[Element, ...], ChemicalPotentialDiagram] = {}
 
         if self.dim < 2:
             raise ValueError("ChemicalPotentialDiagram currently requires phase diagrams with 2 or more elements!")
@@ -184,13 +187,7 @@ class ChemicalPotentialDiagram(MSONable):
                 element_padding=element_padding,
             )
         elif len(elems) == 2 and self.dim > 2:
-            entries = [e for e in self.entries if set(e.elements).issubset(elems)]
-            cpd = ChemicalPotentialDiagram(
-                entries=entries,
-                limits=self.limits,
-                default_min_limit=self.default_min_limit,
-                formal_chempots=self.formal_chempots,
-            )
+            cpd = self._get_subsystem_diagram(tuple(sorted(elems)))
             fig = cpd.get_plot(elements=elems, label_stable=label_stable)  # type: ignore[arg-type]
         else:
             fig = self._get_3d_plot(
@@ -205,27 +202,130 @@ class ChemicalPotentialDiagram(MSONable):
 
         return fig
 
+    def get_slice_domains(self, chempots: dict[Element | str, float]) -> dict[str, np.ndarray]:
+        """Get the domains of a lower-dimensional slice through the diagram, in which
+        the chemical potentials of some elements are held fixed.
+
+        The slice is computed directly from the halfspaces of the stable entries,
+        restricted to the remaining elements, without constructing the domains of the
+        full-dimensional diagram. Results are cached for each set of fixed chemical
+        potentials, so the returned arrays are read-only.
+
+        Args:
+            chempots (dict[Element | str, float]): Fixed chemical potentials of one or
+                more elements, on the same scale as the diagram (i.e. formal chemical
+                potentials if formal_chempots is True). At least two elements must be
+                left free.
+
+        Returns:
+            dict[str, np.ndarray]: Mapping of formulas to arrays of domain boundary
+                points, given in the full chemical potential space so that the fixed
+                chemical potentials appear as constant columns.
+        """
+        fixed = tuple(sorted((Element(str(el)), float(mu)) for el, mu in chempots.items()))
+        if unknown := {el for el, _ in fixed} - set(self.elements):
+            raise ValueError(f"Elements {unknown} are not in the chemical system {self.chemical_system}")
+        if self.dim - len(fixed) < 2:
+            raise ValueError("At least two elements must have free chemical potentials in a slice!")
+
+        if fixed not in self._slice_domains:
+            domains = self._get_slice_domains(fixed)
+            for pts in domains.values():
+                pts.flags.writeable = False
+            self._slice_domains[fixed] = domains
+        return dict(self._slice_domains[fixed])
+
+    def _get_slice_domains(self, fixed: tuple[tuple[Element, float], ...]) -> dict[str, np.ndarray]:
+        """Get the domains of a slice at fixed chemical potentials."""
+        hyperplanes, entries = self._get_stable_hyperplanes_and_entries()
+        fixed_indices = [self.elements.index(el) for el, _ in fixed]
+        free_indices = [idx for idx in range(self.dim) if idx not in fixed_indices]
+        fixed_mus = np.array([mu for _, mu in fixed])
+
+        # Move the fixed chemical potential terms of each hyperplane into its offset
+        offsets = hyperplanes[:, -1] + hyperplanes[:, fixed_indices] @ fixed_mus
+        free_hyperplanes = np.column_stack([hyperplanes[:, free_indices], offsets])
+
+        # Entries made up of fixed elements only constrain the fixed chemical potentials
+        has_free_els = np.abs(hyperplanes[:, free_indices]).sum(axis=1) > PhaseDiagram.numerical_tol
+        if np.any(offsets[~has_free_els] > PhaseDiagram.numerical_tol):
+            raise ValueError(f"No entries are stable at the fixed chemical potentials {dict(fixed)}")
+        free_hyperplanes = free_hyperplanes[has_free_els]
+        entries = [entry for entry, keep in zip(entries, has_free_els, strict=True) if keep]
+
+        border_rows = [row for idx in free_indices for row in (2 * idx, 2 * idx + 1)]
+        border_hyperplanes = self._border_hyperplanes[border_rows][:, [*free_indices, -1]]
+
+        hs_hyperplanes = np.vstack([free_hyperplanes, border_hyperplanes])
+        interior_point = _get_chebyshev_center(hs_hyperplanes)
+        domains = self._get_halfspace_domains(hs_hyperplanes, interior_point, entries)
+
+        for formula, pts in domains.items():
+            full_pts = np.empty((len(pts), self.dim))
+            full_pts[:, free_indices] = pts
+            full_pts[:, fixed_indices] = fixed_mus
+            domains[formula] = full_pts
+
+        return domains
+
     def _get_domains(self) -> dict[str, np.ndarray]:
         """Get a dictionary of domains as {formula: np.ndarray}."""
-        hyperplanes = self._hyperplanes
-        border_hyperplanes = self._border_hyperplanes
-        entries = self._hyperplane_entries
+        hyperplanes, entries = self._get_stable_hyperplanes_and_entries()
 
-        hs_hyperplanes = np.vstack([hyperplanes, border_hyperplanes])
+        hs_hyperplanes = np.vstack([hyperplanes, self._border_hyperplanes])
         interior_point = np.min(self.lims, axis=1) + 1e-1
+
+        return self._get_halfspace_domains(hs_hyperplanes, interior_point, entries)
+
+    @staticmethod
+    def _get_halfspace_domains(
+        hs_hyperplanes: np.ndarray,
+        interior_point: np.ndarray,
+        entries: list[PDEntry],
+    ) -> dict[str, np.ndarray]:
+        """Get the domains of the entries corresponding to the first len(entries)
+        halfspaces from their intersection with the remaining (border) halfspaces.
+        """
         hs_int = HalfspaceIntersection(hs_hyperplanes, interior_point)
 
-        domains: dict[str, list] = {entry.reduced_formula: [] for entry in entries}
+        formulas = [entry.reduced_formula for entry in entries]
+        domains: dict[str, list] = {formula: [] for formula in formulas}
 
         for intersection, facet in zip(hs_int.intersections, hs_int.dual_facets, strict=True):
             for v in facet:
                 if v < len(entries):
-                    this_entry = entries[v]
-                    formula = this_entry.reduced_formula
-                    domains[formula].append(intersection)
+                    domains[formulas[v]].append(intersection)
 
         return {k: np.array(v) for k, v in domains.items() if v}
 
+    @lru_cache(maxsize=1)  # noqa: B019
+    def _get_stable_hyperplanes_and_entries(self) -> tuple[np.ndarray, list[PDEntry]]:
+        """Get the hyperplanes and entries of the phases stable on the compositional
+        phase diagram, i.e. the vertices of the lower hull facets computed the same
+        way as in PhaseDiagram. Only these can have domains of nonzero measure, so
+        halfspaces of unstable phases are dropped before any halfspace intersection.
+        """
+        hyperplanes, entries = self._hyperplanes, self._hyperplane_entries
+        data = np.column_stack([hyperplanes[:, :-1], -hyperplanes[:, -1]])
+        entry_indices = {id(entry): row for row, entry in enumerate(entries)}
+        el_ref_indices = [entry_indices[id(self.el_refs[el])] for el in self.elements]
+
+        idx, _qhull_data, facets = _get_qhull_data_and_facets(data, el_ref_indices)
+        stable = sorted({idx[vertex] for facet in facets for vertex in facet if vertex < len(idx)})
+
+        return hyperplanes[stable], [entries[row] for row in stable]
+
+    def _get_subsystem_diagram(self, elements: tuple[Element, ...]) -> ChemicalPotentialDiagram:
+        """Get the (cached) diagram of a chemical subsystem, used for plotting."""
+        if elements not in self._subsystem_diagrams:
+            self._subsystem_diagrams[elements] = type(self)(
+                entries=[e for e in self.entries if set(e.elements).issubset(elements)],
+                limits=self.limits,
+                default_min_limit=self.default_min_limit,
+                formal_chempots=self.formal_chempots,
+            )
+        return self._subsystem_diagrams[elements]
+
     def _get_border_hyperplanes(self) -> np.ndarray:
         """Get an array of the bounding hyperplanes given by elemental limits."""
         border_hyperplanes = np.array([[0] * (self.dim + 1)] * (2 * self.dim))
@@ -721,6 +821,26 @@ def get_2d_orthonormal_vector(line_pts: np.ndarray) -> np.ndarray:
     return np.array([np.sin(theta), np.cos(theta)])
 
 
+def _get_chebyshev_center(hs_hyperplanes: np.ndarray) -> np.ndarray:
+    """Get the point deepest inside an intersection of halfspaces given in the
+    (A, b) form used by HalfspaceIntersection, i.e. A @ x + b <= 0.
+    """
+    normals, offsets = hs_hyperplanes[:, :-1], hs_hyperplanes[:, -1]
+    norms = np.linalg.norm(normals, axis=1)
+    cost = np.zeros(normals.shape[1] + 1)
+    cost[-1] = -1  # maximize the radius of the inscribed ball
+    result = linprog(
+        cost,
+        A_ub=np.column_stack([normals, norms]),
+        b_ub=-offsets,
+        bounds=[(None, None)] * normals.shape[1] + [(0, None)],
+    )
+    if not result.success or result.x[-1] <= 0:
+        raise ValueError("The halfspaces do not enclose a region of nonzero volume!")
+
+    return result.x[:-1]
+
+
 def _renormalize_entry(entry: PDEntry, renormalization_energy_per_atom: float) -> PDEntry:
     """Regenerate the input entry with an energy per atom decreased by renormalization_energy_per_atom."""
     renormalized_entry_dict = entry.as_dict()
@@ -5,8 +5,10 @@ solids, with or without an open element (e.g., flowing O2).
 
 from __future__ import annotations
 
+import itertools
 import json
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING
 
 import matplotlib.pyplot as plt
@@ -15,7 +17,7 @@ from monty.json import MSONable
 from pandas import DataFrame
 from plotly.graph_objects import Figure, Scatter
 
-from pymatgen.analysis.phase_diagram import GrandPotentialPhaseDiagram, PhaseDiagram
+from pymatgen.analysis.phase_diagram import GrandPotentialPhaseDiagram, PhaseDiagram, _locate_in_facets
 from pymatgen.analysis.reaction_calculator import Reaction
 from pymatgen.core import PKG_DIR
 from pymatgen.core.composition import Composition
@@ -24,7 +26,8 @@ from pymatgen.util.plotting import pretty_plot
 from pymatgen.util.string import htmlify, latexify
 
 if TYPE_CHECKING:
-    from typing import Literal
+    from collections.abc import Callable, Sequence
+    from typing import Any, Literal
 
 __author__ = "Yihan Xiao, Matthew McDermott"
 __maintainer__ = "Matthew McDermott"
@@ -90,6 +93,9 @@ class InterfacialReactivity(MSONable):
                 warning message.
         """
         bypass_grand_warning = kwargs.get("bypass_grand_warning", False)
+        # Energies (e1, e2) of the processed reactant compositions, precomputed for
+        # all pairs at once by batch screening. Not stored, so not part of as_dict().
+        reactant_energies: tuple[float, float] | None = kwargs.get("reactant_energies")
 
         if isinstance(pd, GrandPotentialPhaseDiagram) and not bypass_grand_warning:
             raise TypeError(
@@ -122,7 +128,9 @@ class InterfacialReactivity(MSONable):
             self.comp1 = self.comp1.fractional_composition
             self.comp2 = self.comp2.fractional_composition
 
-        if not bypass_grand_warning:
+        if reactant_energies is not None:
+            self.e1, self.e2 = reactant_energies
+        elif not bypass_grand_warning:
             # Computes energies for reactants in different scenarios.
             if self.use_hull_energy:
                 self.e1 = self.pd.get_hull_energy(self.comp1)
@@ -197,6 +205,210 @@ class InterfacialReactivity(MSONable):
             )
         )
 
+    @classmethod
+    def get_kinks_batch(
+        cls,
+        pairs: Sequence[tuple[Composition, Composition]],
+        pd: PhaseDiagram,
+        norm: bool = True,
+        use_hull_energy: bool = False,
+        n_jobs: int = 1,
+    ) -> list[list[tuple[int, float, float, Reaction, float]]]:
+        """Screen many reactant pairs against the same phase diagram. This gives
+        the same result as calling get_kinks() on an InterfacialReactivity for each
+        pair, but the tie-line intersections with all facets, the hull energies and
+        the decompositions at the kinks are evaluated for all pairs at once using the
+        cached facet inverses of the phase diagram.
+
+        Args:
+            pairs (list[tuple[Composition, Composition]]): (c1, c2) reactant pairs.
+            pd (PhaseDiagram): Phase diagram containing all elements in the pairs.
+            norm (bool): Whether or not the total number of atoms in composition
+                of reactant will be normalized to 1.
+            use_hull_energy (bool): Whether or not use the convex hull energy for
+                the reactants. See __init__().
+            n_jobs (int): Number of processes to split the pairs over. The phase
+                diagram is sent to each worker only once. Defaults to 1.
+
+        Returns:
+            list: For each pair, the kinks in the format of get_kinks().
+        """
+        if n_jobs > 1 and len(pairs) > 1:
+            return _run_interface_batch(
+                cls.get_kinks_batch, pairs, pd, norm=norm, use_hull_energy=use_hull_energy, n_jobs=n_jobs
+            )
+
+        all_kinks = []
+        for interface, (mixing_ratios, energies, n_atoms, products) in zip(
+            *cls._get_kink_data_batch(pairs, pd, norm, use_hull_energy, with_products=True), strict=True
+        ):
+            if products is None:  # both reactants have the same composition
+                all_kinks.append(interface.get_kinks())
+                continue
+
+            kinks = []
+            for idx, (ratio, energy, num_atoms, product) in enumerate(
+                zip(mixing_ratios, energies, n_atoms, products, strict=True), start=1
+            ):
+                rxn = interface._get_reaction_with_products(ratio, product)
+                rxn_energy = energy * interface._get_elem_amt_in_rxn(rxn) / num_atoms
+                kinks.append(
+                    (
+                        idx,
+                        interface._convert(ratio, interface.factor1, interface.factor2),
+                        energy,
+                        rxn,
+                        rxn_energy * cls.EV_TO_KJ_PER_MOL,
+                    )
+                )
+            all_kinks.append(kinks)
+
+        return all_kinks
+
+    @classmethod
+    def get_minimum_batch(
+        cls,
+        pairs: Sequence[tuple[Composition, Composition]],
+        pd: PhaseDiagram,
+        norm: bool = True,
+        use_hull_energy: bool = False,
+        n_jobs: int = 1,
+    ) -> np.ndarray:
+        """Vectorized version of the minimum property for many reactant pairs.
+        Unlike get_kinks_batch(), no Reaction objects are built.
+
+        Args:
+            pairs (list[tuple[Composition, Composition]]): (c1, c2) reactant pairs.
+            pd (PhaseDiagram): Phase diagram containing all elements in the pairs.
+            norm (bool): See get_kinks_batch().
+            use_hull_energy (bool): See get_kinks_batch().
+            n_jobs (int): See get_kinks_batch().
+
+        Returns:
+            np.ndarray: of shape (n_pairs, 2) holding (x_min, E_min) for each pair.
+        """
+        if n_jobs > 1 and len(pairs) > 1:
+            return np.vstack(
+                _run_interface_batch(
+                    cls.get_minimum_batch, pairs, pd, norm=norm, use_hull_energy=use_hull_energy, n_jobs=n_jobs
+                )
+            )
+
+        minima = np.zeros((len(pairs), 2))
+        for idx, (interface, (mixing_ratios, energies, _n_atoms, _products)) in enumerate(
+            zip(*cls._get_kink_data_batch(pairs, pd, norm, use_hull_energy), strict=True)
+        ):
+            if mixing_ratios is None:  # both reactants have the same composition
+                minima[idx] = interface.minimum
+                continue
+            # first minimum along the kinks, as in the minimum property
+            min_idx = np.argmin(energies)
+            minima[idx] = interface._convert(mixing_ratios[min_idx], interface.factor1, interface.factor2)
+            minima[idx, 1] = energies[min_idx]
+
+        return minima
+
+    @classmethod
+    def _get_kink_data_batch(
+        cls,
+        pairs: Sequence[tuple[Composition, Composition]],
+        pd: PhaseDiagram,
+        norm: bool,
+        use_hull_energy: bool,
+        with_products: bool = False,
+    ) -> tuple[list[InterfacialReactivity], list[tuple]]:
+        """Get the mixing ratios, reaction energies, numbers of atoms and
+        (optionally) decomposition products at the kinks of many reactant pairs.
+
+        Returns:
+            tuple: The InterfacialReactivity of each pair and, for each pair, a tuple of
+                arrays (mixing ratios, energies, n_atoms) in the order of get_kinks() plus
+                a list of product compositions for each kink (None if not requested).
+                Everything but the InterfacialReactivity is None for pairs with identical
+                reactant compositions, which are left to get_kinks().
+        """
+        if isinstance(pd, GrandPotentialPhaseDiagram):
+            raise TypeError("Batch screening is only implemented for InterfacialReactivity with a PhaseDiagram!")
+
+        # reactant compositions as processed by __init__
+        reactants = [comp.fractional_composition if norm else comp for pair in pairs for comp in pair]
+        if use_hull_energy:
+            reactant_energies = pd.get_hull_energy_per_atom_batch(reactants) * [comp.num_atoms for comp in reactants]
+        else:
+            min_energies: dict[str, float] = {}
+            for entry in pd.qhull_entries:
+                formula = entry.reduced_formula
+                min_energies[formula] = min(entry.energy_per_atom, min_energies.get(formula, np.inf))
+            # compositions that don't match by formula, e.g. non-integer ones, are
+            # compared to all entries by _get_entry_energy() once per formula
+            for comp in reactants:
+                if comp.reduced_formula not in min_energies:
+                    min_energies[comp.reduced_formula] = cls._get_entry_energy(pd, comp) / comp.num_atoms
+            reactant_energies = np.array([min_energies[comp.reduced_formula] * comp.num_atoms for comp in reactants])
+        interfaces = [
+            cls(
+                c1=c1,
+                c2=c2,
+                pd=pd,
+                norm=norm,
+                use_hull_energy=use_hull_energy,
+                reactant_energies=(float(e1), float(e2)),
+            )
+            for (c1, c2), e1, e2 in zip(pairs, reactant_energies[::2], reactant_energies[1::2], strict=True)
+        ]
+
+        coords, valid = pd._get_pd_coords_batch(reactants)
+        if not valid.all():
+            raise ValueError("All reactant compositions must be within the chemical system of the phase diagram!")
+        c1_coords, c2_coords = coords[::2], coords[1::2]
+        same = (c1_coords == c2_coords).all(axis=1)
+        ratios = _get_tie_line_kink_ratios(pd, c1_coords, c2_coords, same)
+
+        # Locate all kinks of all pairs in the phase diagram at once
+        n_kinks = [len(ratio) for ratio in ratios]
+        pair_idx = np.repeat(np.arange(len(pairs)), n_kinks)
+        t_all = np.concatenate([*ratios, np.zeros(0)])
+        kink_coords = c1_coords[pair_idx] + t_all[:, None] * (c2_coords - c1_coords)[pair_idx]
+        facet_idx, bary = _locate_in_facets(pd._get_facet_bary_inverses(), kink_coords)
+        if (facet_idx < 0).any():
+            raise ValueError("No valid decomposition found for some of the interfacial reaction kinks!")
+
+        facets = np.asarray(pd.facets, dtype=int).reshape(len(pd.facets), -1)[facet_idx]
+        qhull_energies = np.array([entry.energy_per_atom for entry in pd.qhull_entries])
+        hull_energies = np.sum(bary * qhull_energies[facets], axis=1)
+
+        data: list[tuple] = []
+        start = 0
+        for idx, interface in enumerate(interfaces):
+            if same[idx]:
+                data.append((None, None, None, None))
+                continue
+            kinks = slice(start, start + n_kinks[idx])
+            start += n_kinks[idx]
+
+            n1, n2 = interface.comp1.num_atoms, interface.comp2.num_atoms
+            # kinks in the order of get_kinks(), i.e. increasing fraction of comp1
+            mixing_ratios = (1 - ratios[idx])[::-1]
+            mixing_ratios = mixing_ratios * n2 / (n1 + mixing_ratios * (n2 - n1))
+            n_atoms = mixing_ratios * n1 + (1 - mixing_ratios) * n2
+            energies = (
+                hull_energies[kinks][::-1] * n_atoms - interface.e1 * mixing_ratios - interface.e2 * (1 - mixing_ratios)
+            )
+
+            products = None
+            if with_products:
+                products = [
+                    [
+                        Composition(pd.qhull_entries[entry_idx].name)
+                        for entry_idx, amt in zip(kink_facet, kink_bary, strict=True)
+                        if abs(amt) > PhaseDiagram.numerical_tol
+                    ]
+                    for kink_facet, kink_bary in zip(facets[kinks][::-1], bary[kinks][::-1], strict=True)
+                ]
+            data.append((mixing_ratios, energies, n_atoms, products))
+
+        return interfaces, data
+
     def plot(self, backend: Literal["plotly", "matplotlib"] = "plotly") -> Figure | plt.Figure:
         """
         Plots reaction energy as a function of mixing ratio x in self.c1 - self.c2 tie line.
@@ -306,9 +518,13 @@ class InterfacialReactivity(MSONable):
         mix_comp = self.comp1 * x + self.comp2 * (1 - x)
         decomp = self.pd.get_decomposition(mix_comp)
 
-        reactants = self._get_reactants(x)
+        return self._get_reaction_with_products(x, [Composition(entry.name) for entry in decomp])
 
-        product = [Composition(entry.name) for entry in decomp]
+    def _get_reaction_with_products(self, x: float, product: list[Composition]) -> Reaction:
+        """Generate balanced reaction at mixing ratio x : (1-x) for
+        self.comp1 : self.comp2 given the decomposition products at x.
+        """
+        reactants = self._get_reactants(x)
         reaction = Reaction(reactants, product)
 
         x_original = self._get_original_composition_ratio(reaction)
@@ -728,3 +944,106 @@ class GrandPotentialInterfacialReactivity(InterfacialReactivity):
             grand_potential /= sum(composition[el] for el in composition if el not in self.pd.chempots)
 
         return grand_potential
+
+
+# Phase diagram shared with batch screening worker processes, set once per
+# worker by the pool initializer
+_INTERFACE_PD: dict[str, PhaseDiagram] = {}
+
+
+def _init_interface_worker(pd: PhaseDiagram) -> None:
+    """Pool initializer storing the phase diagram in the worker."""
+    _INTERFACE_PD["pd"] = pd
+
+
+def _interface_worker(
+    func: Callable, pairs: Sequence[tuple[Composition, Composition]], norm: bool, use_hull_energy: bool
+) -> Any:
+    """Run a batch screening method on a chunk of pairs in a worker."""
+    return func(pairs, _INTERFACE_PD["pd"], norm=norm, use_hull_energy=use_hull_energy)
+
+
+def _run_interface_batch(
+    func: Callable,
+    pairs: Sequence[tuple[Composition, Composition]],
+    pd: PhaseDiagram,
+    *,
+    norm: bool,
+    use_hull_energy: bool,
+    n_jobs: int,
+) -> list:
+    """Split pairs over a process pool and concatenate the results of func."""
+    n_chunks = min(len(pairs), 4 * n_jobs)
+    bounds = np.linspace(0, len(pairs), n_chunks + 1).astype(int)
+    chunks = [list(pairs[start:stop]) for start, stop in itertools.pairwise(bounds)]
+
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_interface_worker, initargs=(pd,)) as executor:
+        results = executor.map(
+            _interface_worker,
+            itertools.repeat(func),
+            chunks,
+            itertools.repeat(norm),
+            itertools.repeat(use_hull_energy),
+        )
+        return [item for result in results for item in result]
+
+
+def _get_tie_line_kink_ratios(
+    pd: PhaseDiagram,
+    c1_coords: np.ndarray,
+    c2_coords: np.ndarray,
+    skip: np.ndarray,
+) -> list[np.ndarray]:
+    """Find where the tie lines between pairs of points cross facet boundaries.
+
+    This is a vectorized version of PhaseDiagram.get_critical_compositions() for
+    many tie lines. A tie line c1 + t * (c2 - c1) has barycentric coordinates that
+    are linear in t in every facet, so the crossings with all facets follow from
+    the barycentric coordinates of both endpoints.
+
+    Args:
+        pd (PhaseDiagram): Phase diagram.
+        c1_coords (np.ndarray): Reduced dimension coordinates of the first endpoints.
+        c2_coords (np.ndarray): Reduced dimension coordinates of the second endpoints.
+        skip (np.ndarray): Boolean mask of tie lines to skip (e.g. zero length).
+
+    Returns:
+        list[np.ndarray]: Sorted, unique fractions t of the way from c1 to c2 at
+            which the decomposition changes, including both endpoints. Empty for
+            skipped tie lines.
+    """
+    aug_inv = pd._get_facet_bary_inverses()
+    n_facets, dim = aug_inv.shape[:2]
+    lengths = np.linalg.norm(c2_coords - c1_coords, axis=1)
+
+    ratios: list[np.ndarray] = []
+    # bound the (chunk, n_facets, dim, dim) intermediate to ~32 MB
+    chunk_size = max(1, 2**22 // (n_facets * dim * dim))
+    for start in range(0, len(c1_coords), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        ones = np.ones((len(c1_coords[chunk]), 1))
+        b1 = np.einsum("pi,fij->pfj", np.hstack([c1_coords[chunk], ones]), aug_inv)
+        b2 = np.einsum("pi,fij->pfj", np.hstack([c2_coords[chunk], ones]), aug_inv)
+        line = b1 - b2
+
+        # don't use barycentric dimension where line is parallel to face
+        valid = np.abs(line) > 1e-10
+        t = np.divide(b1, line, out=np.full_like(b1, np.nan), where=valid)
+        # it's only an intersection if it is in the simplex
+        possible = b1[:, :, None, :] - t[..., None] * line[:, :, None, :]
+        in_simplex = valid & (possible >= -1e-8).all(axis=-1)
+
+        for t_pair, in_pair, length, skip_pair in zip(t, in_simplex, lengths[chunk], skip[chunk], strict=True):
+            if skip_pair:
+                ratios.append(np.zeros(0))
+                continue
+            # only take compositions between endpoints
+            proj = np.concatenate([[0, length], t_pair[in_pair] * length])
+            proj = proj[(proj > -PhaseDiagram.numerical_tol) & (proj < length + PhaseDiagram.numerical_tol)]
+            proj.sort()
+            # only unique compositions
+            unique = np.ones(len(proj), dtype=bool)
+            unique[1:] = proj[1:] > proj[:-1] + PhaseDiagram.numerical_tol
+            ratios.append(proj[unique] / length)
+
+    return ratios
@@ -10,7 +10,10 @@ import os
 import re
 import warnings
 from collections import defaultdict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from functools import lru_cache
+from multiprocessing.shared_memory import SharedMemory
 from typing import TYPE_CHECKING
 
 import matplotlib.pyplot as plt
@@ -20,9 +23,10 @@ from matplotlib import cm
 from matplotlib.cm import ScalarMappable
 from matplotlib.colors import LinearSegmentedColormap, Normalize
 from matplotlib.font_manager import FontProperties
-from monty.json import MontyDecoder, MSONable
+from monty.json import MontyDecoder, MontyEncoder, MSONable
 from scipy import interpolate
 from scipy.optimize import minimize
+from scipy.sparse import csr_array
 from scipy.spatial import ConvexHull
 from tqdm import tqdm
 
@@ -30,14 +34,16 @@ from pymatgen.analysis.reaction_calculator import Reaction, ReactionError
 from pymatgen.core import DummySpecies, Element, get_el_sp
 from pymatgen.core.composition import Composition
 from pymatgen.entries import Entry
+from pymatgen.entries.computed_entries import ComputedEntry
 from pymatgen.util.coord import Simplex, in_coord_list
 from pymatgen.util.due import Doi, due
 from pymatgen.util.plotting import pretty_plot
 from pymatgen.util.string import htmlify, latexify
 
 if TYPE_CHECKING:
-    from collections.abc import Collection, Iterator, Sequence
+    from collections.abc import Collection, Iterator
     from io import StringIO
+    from os import PathLike
     from typing import Any, Literal
 
     from numpy.typing import ArrayLike
@@ -290,6 +296,194 @@ class TransformedPDEntryError(Exception):
     """An exception class for TransformedPDEntry."""
 
 
+class EntryTable(Sequence):
+    """Columnar, array-backed store of entries for phase stability workflows
+    involving very large numbers of entries.
+
+    Instead of one Entry object per calculation, compositions are held in a dense
+    (n_entries, n_elements) matrix alongside arrays of energies, corrections and ids.
+    Indexing returns lightweight EntryView objects which are created on demand.
+    A PhaseDiagram can be built directly from a table with PhaseDiagram.from_entry_table()
+    and the batch hull methods (e.g. PhaseDiagram.get_e_above_hull_batch()) accept a table
+    in place of a list of entries.
+
+    Attributes:
+        elements (list[Element]): Elements corresponding to the columns of amounts.
+        amounts (np.ndarray): Composition matrix of shape (n_entries, n_elements).
+        uncorrected_energies (np.ndarray): Uncorrected energies of the entries.
+        corrections (np.ndarray): Total energy corrections of the entries.
+        entry_ids (np.ndarray): Entry ids as strings ("" if not set).
+    """
+
+    def __init__(
+        self,
+        elements: Sequence[Element],
+        amounts: ArrayLike,
+        uncorrected_energies: ArrayLike,
+        corrections: ArrayLike | None = None,
+        entry_ids: Sequence[str] | None = None,
+    ) -> None:
+        """
+        Args:
+            elements (list[Element]): Elements corresponding to the columns of amounts.
+            amounts (ArrayLike): Composition matrix of shape (n_entries, n_elements).
+            uncorrected_energies (ArrayLike): Uncorrected energies of the entries.
+            corrections (ArrayLike): Total energy corrections. Defaults to zeros.
+            entry_ids (list[str]): Entry ids. Defaults to empty strings.
+        """
+        self.elements = [get_el_sp(el) for el in elements]
+        self.amounts = np.asarray(amounts, dtype=float).reshape(-1, len(self.elements))
+        self.uncorrected_energies = np.asarray(uncorrected_energies, dtype=float)
+        n_entries = len(self.amounts)
+        self.corrections = np.zeros(n_entries) if corrections is None else np.asarray(corrections, dtype=float)
+        self.entry_ids = np.array([""] * n_entries if entry_ids is None else entry_ids, dtype=str)
+        if not len(self.uncorrected_energies) == len(self.corrections) == len(self.entry_ids) == n_entries:
+            raise ValueError("All columns of an EntryTable must have the same length.")
+        self._views: dict[int, EntryView] = {}
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(len(self))[idx]]
+        idx = range(len(self))[idx]
+        if (view := self._views.get(idx)) is None:
+            view = self._views[idx] = EntryView(self, idx)
+        return view
+
+    def __iter__(self) -> Iterator[EntryView]:
+        return (self[idx] for idx in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__} with {len(self)} entries over {'-'.join(el.symbol for el in self.elements)}"
+
+    @property
+    def energies(self) -> np.ndarray:
+        """Corrected energies of the entries."""
+        return self.uncorrected_energies + self.corrections
+
+    @property
+    def num_atoms(self) -> np.ndarray:
+        """Number of atoms of each entry."""
+        return self.amounts.sum(axis=1)
+
+    @property
+    def energies_per_atom(self) -> np.ndarray:
+        """Corrected energies per atom of the entries."""
+        return self.energies / self.num_atoms
+
+    def get_atomic_fractions(self, elements: Sequence[Element]) -> tuple[np.ndarray, np.ndarray]:
+        """Atomic fractions of the given elements for all entries.
+
+        Args:
+            elements (list[Element]): Elements, e.g. of a PhaseDiagram.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Fractions of shape (n_entries, len(elements))
+                and a boolean mask of entries containing no other elements.
+        """
+        col_of_el = {el: col for col, el in enumerate(self.elements)}
+        cols = [col_of_el.get(el) for el in elements]
+        fracs = np.zeros((len(self), len(elements)))
+        for idx, col in enumerate(cols):
+            if col is not None:
+                fracs[:, idx] = self.amounts[:, col]
+        num_atoms = self.num_atoms
+        valid = np.isclose(fracs.sum(axis=1), num_atoms, rtol=0, atol=Composition.amount_tolerance)
+        return fracs / num_atoms[:, None], valid
+
+    @classmethod
+    def from_entries(cls, entries: Sequence[Entry], elements: Sequence[Element] | None = None) -> Self:
+        """Build an EntryTable from Entry objects.
+
+        Args:
+            entries (list[Entry]): PDEntry- or ComputedEntry-like objects.
+            elements (list[Element]): Columns of the composition matrix. Defaults to all
+                elements of the entries, sorted.
+
+        Returns:
+            EntryTable
+        """
+        if elements is None:
+            elements = sorted({el for entry in entries for el in entry.elements})
+        return cls(
+            elements,
+            [[entry.composition[el] for el in elements] for entry in entries],
+            [getattr(entry, "uncorrected_energy", entry.energy) for entry in entries],
+            [getattr(entry, "correction", 0) for entry in entries],
+            [str(getattr(entry, "entry_id", None) or "") for entry in entries],
+        )
+
+
+class EntryView(PDEntry):
+    """Lightweight PDEntry-like view of one row of an EntryTable. The composition
+    is only built when it is first accessed.
+    """
+
+    def __init__(self, table: EntryTable, index: int) -> None:
+        """
+        Args:
+            table (EntryTable): Table holding the entry data.
+            index (int): Row of the entry in the table.
+        """
+        self.table = table
+        self.index = index
+        self._comp: Composition | None = None
+        self._name: str | None = None
+        self.attribute = None
+
+    @property
+    def _composition(self) -> Composition:
+        if self._comp is None:
+            amounts = self.table.amounts[self.index]
+            self._comp = Composition(
+                {el: amt for el, amt in zip(self.table.elements, amounts, strict=True) if amt != 0}
+            )
+        return self._comp
+
+    @property
+    def _energy(self) -> float:
+        return float(self.table.energies[self.index])
+
+    @property
+    def name(self) -> str:
+        """Name of the entry. Defaults to the reduced formula."""
+        return self._name or self.reduced_formula
+
+    @name.setter
+    def name(self, name: str) -> None:
+        self._name = name
+
+    @property
+    def entry_id(self) -> str | None:
+        """Entry id of the entry, None if not set."""
+        return str(self.table.entry_ids[self.index]) or None
+
+    @property
+    def correction(self) -> float:
+        """Total energy correction of the entry."""
+        return float(self.table.corrections[self.index])
+
+    @property
+    def uncorrected_energy(self) -> float:
+        """Uncorrected energy of the entry."""
+        return float(self.table.uncorrected_energies[self.index])
+
+    def to_computed_entry(self) -> ComputedEntry:
+        """Materialize the view as a ComputedEntry with a single constant energy adjustment."""
+        return ComputedEntry(
+            self.composition,
+            self.uncorrected_energy,
+            correction=self.correction,
+            entry_id=self.entry_id,
+        )
+
+    def as_dict(self) -> dict:
+        """Get MSONable dict of the equivalent ComputedEntry."""
+        return self.to_computed_entry().as_dict()
+
+
 @due.dcite(
     Doi("10.1021/cm702327g"),
     description="Phase Diagram from First Principles Calculations",
@@ -394,7 +588,12 @@ class PhaseDiagram(MSONable):
             "@class": type(self).__name__,
             "all_entries": [e.as_dict() for e in self.all_entries],
             "elements": [e.as_dict() for e in self.elements],
-            "computed_data": self.computed_data,
+            # NOTE entries of phase diagrams loaded with from_npz() are materialized here
+            "computed_data": {
+                **self.computed_data,
+                "all_entries": list(self.computed_data["all_entries"]),
+                "qhull_entries": list(self.computed_data["qhull_entries"]),
+            },
         }
 
     @classmethod
@@ -411,6 +610,99 @@ class PhaseDiagram(MSONable):
         computed_data = dct.get("computed_data")
         return cls(entries, elements, computed_data=computed_data)
 
+    @classmethod
+    def from_entry_table(cls, table: EntryTable, elements: Sequence[Element] | None = None) -> Self:
+        """Build a PhaseDiagram directly from an EntryTable.
+
+        The grouping by composition, formation energy filtering and hull construction
+        all operate on the table's arrays. EntryView objects are only created for the
+        entries used in the hull, and all_entries is the table itself.
+
+        Args:
+            table (EntryTable): Entries to build the phase diagram from.
+            elements (list[Element]): Optional list of elements in the phase diagram.
+                Defaults to the elements present in the table, sorted.
+
+        Returns:
+            PhaseDiagram
+        """
+        if len(table) == 0:
+            raise ValueError("Unable to build phase diagram without entries.")
+        if elements is None:
+            elements = sorted(el for el, col in zip(table.elements, table.amounts.T, strict=True) if col.any())
+        elements = list(elements)
+
+        fracs, valid = table.get_atomic_fractions(elements)
+        if not valid.all():
+            raise ValueError(f"{table[int(np.argmin(valid))]} has elements not in {elements}")
+        energies = table.energies_per_atom
+
+        # Lowest energy entry for each reduced composition
+        keys = np.round(fracs / Composition.amount_tolerance).astype(np.int64)
+        _, group = np.unique(keys, axis=0, return_inverse=True)
+        group = group.ravel()
+        order = np.lexsort((energies, group))
+        min_rows = order[np.r_[True, np.diff(group[order]) != 0]]
+
+        min_fracs = fracs[min_rows]
+        el_ref_indices = []
+        for col, el in enumerate(elements):
+            if not (is_el := np.flatnonzero(min_fracs[:, col] == 1)).size:
+                missing = [str(el) for col, el in enumerate(elements) if not (min_fracs[:, col] == 1).any()]
+                raise ValueError(f"Missing terminal entries for elements {sorted(missing)}")
+            el_ref_indices.append(int(is_el[0]))
+
+        data = np.column_stack([min_fracs, energies[min_rows]])
+        idx, qhull_data, facets = _get_qhull_data_and_facets(data, el_ref_indices)
+        el_refs = sorted(zip(elements, el_ref_indices, strict=True), key=lambda item: item[1])
+
+        computed_data = {
+            "facets": facets,
+            "simplexes": [Simplex(qhull_data[facet, :-1]) for facet in facets],
+            "all_entries": table,
+            "qhull_data": qhull_data,
+            "dim": len(elements),
+            "el_refs": [(el, table[int(min_rows[row])]) for el, row in el_refs],
+            "qhull_entries": [table[int(min_rows[row])] for row in idx],
+        }
+        return cls(table, elements, computed_data=computed_data)
+
+    def to_npz(self, filename: str | PathLike, compress: bool = False) -> None:
+        """Save the computed hull and a compact entry table in NumPy's binary npz format.
+
+        Unlike as_dict(), loading with from_npz() does not decode the entries up front,
+        which makes opening large phase diagrams much faster.
+
+        Args:
+            filename (str | PathLike): Output file, conventionally ending in .npz.
+            compress (bool): Whether to compress the file. Defaults to False, which
+                gives the fastest loading.
+        """
+        if type(self) is not PhaseDiagram:
+            raise TypeError(f"to_npz() is not supported for {type(self).__name__}")
+        arrays = _NpzEntryStore.to_arrays(self.all_entries, self.elements)
+        arrays |= _pd_to_npz_arrays(self, {id(entry): idx for idx, entry in enumerate(self.all_entries)})
+        (np.savez_compressed if compress else np.savez)(filename, **arrays)
+
+    @classmethod
+    def from_npz(cls, filename: str | PathLike) -> Self:
+        """Load a PhaseDiagram saved with to_npz().
+
+        Entries are decoded lazily, i.e. only when they are first accessed. Hull
+        queries such as get_hull_energy_per_atom() therefore only decode the
+        entries of the facets involved.
+
+        Args:
+            filename (str | PathLike): npz file written by to_npz().
+
+        Returns:
+            PhaseDiagram
+        """
+        with np.load(filename) as npz:
+            arrays = dict(npz)
+        store = _NpzEntryStore(arrays)
+        return _pd_from_npz_arrays(cls, arrays, store)
+
     def _compute(self) -> dict[str, Any]:
         if self.elements == ():
             self.elements = sorted({els for e in self.entries for els in e.elements})
@@ -439,38 +731,9 @@ class PhaseDiagram(MSONable):
         data = np.array(
             [[e.composition.get_atomic_fraction(el) for el in elements] + [e.energy_per_atom] for e in min_entries]
         )
-
-        # Use only entries with negative formation energy
-        vec = [el_refs[el].energy_per_atom for el in elements] + [-1]
-        form_e = -np.dot(data, vec)
-        idx = np.where(form_e < -PhaseDiagram.formation_energy_tol)[0].tolist()
-
-        # Add the elemental references
-        idx.extend([min_entries.index(el) for el in el_refs.values()])
-
+        el_ref_indices = [min_entries.index(el_refs[el]) for el in elements]
+        idx, qhull_data, facets = _get_qhull_data_and_facets(data, el_ref_indices)
         qhull_entries = [min_entries[idx] for idx in idx]
-        qhull_data = data[idx][:, 1:]
-
-        # Add an extra point to enforce full dimensionality.
-        # This point will be present in all upper hull facets.
-        extra_point = np.zeros(dim) + 1 / dim
-        extra_point[-1] = np.max(qhull_data) + 1
-        qhull_data = np.concatenate([qhull_data, [extra_point]], axis=0)
-
-        if dim == 1:
-            facets = [qhull_data.argmin(axis=0)]
-        else:
-            facets = get_facets(qhull_data)
-            final_facets = []
-            for facet in facets:
-                # Skip facets that include the extra point
-                if max(facet) == len(qhull_data) - 1:
-                    continue
-                mat = qhull_data[facet]
-                mat[:, -1] = 1
-                if abs(np.linalg.det(mat)) > 1e-14:
-                    final_facets.append(facet)
-            facets = final_facets
 
         simplexes = [Simplex(qhull_data[facet, :-1]) for facet in facets]
         self.elements = elements
@@ -787,6 +1050,251 @@ class PhaseDiagram(MSONable):
         """
         return self.get_decomp_and_e_above_hull(entry, **kwargs)[1]
 
+    @lru_cache(1)  # noqa: B019
+    def _get_facet_bary_inverses(self) -> np.ndarray:
+        """Stacked inverses of the augmented simplex matrices for all facets.
+
+        Multiplying an augmented point [x_1, ..., x_{d-1}, 1] with the i-th matrix
+        gives the barycentric coordinates of that point in the i-th simplex.
+
+        Returns:
+            np.ndarray: of shape (n_facets, dim, dim).
+        """
+        return _get_bary_inverses(np.array([simplex.coords for simplex in self.simplexes], dtype=float))
+
+    def _get_pd_coords_batch(self, comps: Sequence[Composition]) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized version of pd_coords() for many compositions.
+
+        Args:
+            comps (list[Composition] | EntryTable): Compositions to convert.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Coordinates of shape (n_comps, dim - 1) and
+                a boolean mask of compositions whose elements are all in the phase diagram.
+        """
+        if isinstance(comps, EntryTable):
+            fracs, valid = comps.get_atomic_fractions(self.elements)
+            return fracs[:, 1:], valid
+
+        elements = set(self.elements)
+        coords = np.zeros((len(comps), max(len(self.elements) - 1, 0)))
+        valid = np.ones(len(comps), dtype=bool)
+        for idx, comp in enumerate(comps):
+            if set(comp.elements) - elements:
+                valid[idx] = False
+                continue
+            coords[idx] = [comp.get_atomic_fraction(el) for el in self.elements[1:]]
+        return coords, valid
+
+    def _get_facet_indices_batch(self, coords: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Locate the facet containing each of a set of points.
+
+        Barycentric coordinates of every point in every facet are evaluated with
+        one batched matrix product per chunk of points. As in
+        _get_facet_and_simplex(), the first matching facet is returned.
+
+        Args:
+            coords (np.ndarray): Reduced dimension coordinates of shape (n, dim - 1).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Facet index of each point (-1 if none was
+                found) and the barycentric coordinates in that facet, shape (n, dim).
+        """
+        return _locate_in_facets(self._get_facet_bary_inverses(), coords)
+
+    def _get_decomp_batch(self, comps: Sequence[Composition]) -> tuple[csr_array, np.ndarray]:
+        """
+        Args:
+            comps (list[Composition]): Compositions to decompose.
+
+        Returns:
+            tuple[csr_array, np.ndarray]: Decomposition weights of shape
+                (n_comps, n_qhull_entries) and a boolean mask of the compositions
+                for which a decomposition was found.
+        """
+        coords, valid = self._get_pd_coords_batch(comps)
+        facet_idx, bary = self._get_facet_indices_batch(coords)
+        found = valid & (facet_idx >= 0)
+
+        facets = np.asarray(self.facets, dtype=int).reshape(len(self.facets), -1)
+        rows = np.repeat(np.arange(len(comps)), bary.shape[1])
+        cols = facets[np.where(found, facet_idx, 0)].ravel()
+        amts = np.where(found[:, None], bary, 0).ravel()
+        keep = np.abs(amts) > PhaseDiagram.numerical_tol
+
+        weights = csr_array(
+            (amts[keep], (rows[keep], cols[keep])),
+            shape=(len(comps), len(self.qhull_entries)),
+        )
+        return weights, found
+
+    def get_decomposition_batch(
+        self,
+        comps: Sequence[Composition],
+        on_error: Literal["raise", "warn", "ignore"] = "raise",
+    ) -> csr_array:
+        """Vectorized version of get_decomposition() for many compositions.
+
+        Args:
+            comps (list[Composition] | EntryTable): Compositions to decompose.
+            on_error ('raise' | 'warn' | 'ignore'): What to do if no valid decomposition
+                was found for a composition. 'raise' will throw ValueError. 'warn' and
+                'ignore' leave the corresponding row empty. Defaults to 'raise'.
+
+        Returns:
+            scipy.sparse.csr_array: of shape (n_comps, len(qhull_entries)). Entry (i, j)
+                is the amount of qhull_entries[j] in the decomposition of the fractional
+                composition of comps[i].
+        """
+        weights, found = self._get_decomp_batch(comps)
+        _handle_batch_decomp_errors(comps, found, on_error)
+        return weights
+
+    def get_hull_energy_per_atom_batch(
+        self,
+        comps: Sequence[Composition],
+        on_error: Literal["raise", "warn", "ignore"] = "raise",
+    ) -> np.ndarray:
+        """Vectorized version of get_hull_energy_per_atom() for many compositions.
+
+        Args:
+            comps (list[Composition] | EntryTable): Input compositions.
+            on_error ('raise' | 'warn' | 'ignore'): See get_decomposition_batch(). NaN is
+                returned for compositions without a valid decomposition.
+
+        Returns:
+            np.ndarray: Energy of lowest energy equilibrium per atom for each composition.
+        """
+        weights, found = self._get_decomp_batch(comps)
+        _handle_batch_decomp_errors(comps, found, on_error)
+        energies = np.array([entry.energy_per_atom for entry in self.qhull_entries])
+        return np.where(found, weights @ energies, np.nan)
+
+    def get_e_above_hull_batch(
+        self,
+        entries: Sequence[PDEntry],
+        allow_negative: bool = False,
+        on_error: Literal["raise", "warn", "ignore"] = "raise",
+    ) -> np.ndarray:
+        """Vectorized version of get_e_above_hull() for screening many entries.
+
+        Args:
+            entries (list[PDEntry] | EntryTable): PDEntry-like objects or an EntryTable.
+            allow_negative (bool): Whether to allow negative e_above_hulls. Defaults to False.
+            on_error ('raise' | 'warn' | 'ignore'): What to do if no valid decomposition
+                was found for an entry. 'raise' will throw ValueError. 'warn' and 'ignore'
+                return NaN for that entry. Defaults to 'raise'.
+
+        Returns:
+            np.ndarray: Energies above the convex hull per atom.
+        """
+        if isinstance(entries, EntryTable):
+            hull_energies = self.get_hull_energy_per_atom_batch(entries, on_error)
+            e_above_hull = entries.energies_per_atom - hull_energies
+        else:
+            hull_energies = self.get_hull_energy_per_atom_batch([entry.composition for entry in entries], on_error)
+            e_above_hull = np.array([entry.energy_per_atom for entry in entries]) - hull_energies
+
+        if not allow_negative and (invalid := np.flatnonzero(e_above_hull < -PhaseDiagram.numerical_tol)).size:
+            msg = f"No valid decomposition found for {entries[invalid[0]]}! (e_h: {e_above_hull[invalid[0]]})"
+            if on_error == "raise":
+                raise ValueError(msg)
+            if on_error == "warn":
+                warnings.warn(msg, stacklevel=2)
+            e_above_hull[invalid] = np.nan
+        return e_above_hull
+
+    def get_grand_potential_stability(
+        self,
+        chempots: dict[Element, ArrayLike],
+        comps: Sequence[Composition] | None = None,
+        grid: bool = False,
+    ) -> tuple[list[list[PDEntry]], np.ndarray | None]:
+        """Scan the stability of phases against the chemical potentials of open elements.
+
+        This gives the same stable phases as building a GrandPotentialPhaseDiagram for each
+        chemical potential point, but much faster. As long as the open element reservoir is
+        stable against all phases made up of open elements only, only entries stable in this
+        phase diagram can be stable in the grand potential phase diagram, so the scan reuses
+        its hull and only considers those. The grand potentials of all entries at all points are computed with
+        a single matrix product and the per-point convex hulls operate on arrays only.
+
+        Args:
+            chempots (dict[Element, ArrayLike]): Chemical potentials of the open elements.
+                Values are scalars or 1D arrays which are broadcast against each other,
+                e.g. {Element("O"): np.linspace(-8, -4, 100)}.
+            comps (list[Composition]): Optional compositions at which to evaluate the
+                grand potential hull energies. Amounts of open elements are ignored.
+            grid (bool): Whether to scan the Cartesian product of the chemical potential
+                arrays rather than broadcasting them. Defaults to False.
+
+        Returns:
+            tuple[list[list[PDEntry]], np.ndarray | None]: For each chemical potential point,
+                the stable entries (from this phase diagram) and, if comps are given, an array
+                of shape (n_points, n_comps) of grand potential hull energies per atom of the
+                closed elements. NaN is returned for compositions outside the closed elements.
+        """
+        open_els = [get_el_sp(el) for el in chempots]
+        mus = [np.ravel(np.asarray(mu, dtype=float)) for mu in chempots.values()]
+        if grid:
+            mus = [mu.ravel() for mu in np.meshgrid(*mus, indexing="ij")]
+        mus = np.column_stack(np.broadcast_arrays(*mus))
+
+        closed_els = [el for el in self.elements if el not in open_els]
+        if not closed_els:
+            raise ValueError("At least one element of the phase diagram must not be open.")
+
+        # Phases unstable in this phase diagram stay unstable as long as no phase made up of
+        # only open elements has a negative grand potential, i.e. is more stable than the
+        # reservoir. Otherwise all entries have to be considered.
+        open_only = [entry for entry in self._stable_entries if set(entry.elements).issubset(open_els)]
+        n_open_only = np.array([[entry.composition[el] for el in open_els] for entry in open_only])
+        open_only_grand = (
+            np.array([entry.energy for entry in open_only]) - mus @ n_open_only.reshape(-1, len(open_els)).T
+        )
+        physical = (open_only_grand >= -PhaseDiagram.numerical_tol).all()
+        candidates = self._stable_entries if physical else self.all_entries
+        candidates = [entry for entry in candidates if set(closed_els).intersection(entry.elements)]
+        n_closed = np.array([[entry.composition[el] for el in closed_els] for entry in candidates])
+        n_open = np.array([[entry.composition[el] for el in open_els] for entry in candidates])
+        energies = np.array([entry.energy for entry in candidates])
+        grand_energies = (energies - mus @ n_open.T) / n_closed.sum(axis=1)
+
+        # Group entries with the same reduced composition of closed elements and take the
+        # lowest grand potential in each group at every point.
+        groups: dict[Composition, list[int]] = defaultdict(list)
+        for idx, amounts in enumerate(n_closed):
+            groups[Composition(dict(zip(closed_els, amounts, strict=True))).reduced_composition].append(idx)
+        group_fracs = np.array([[comp.get_atomic_fraction(el) for el in closed_els] for comp in groups])
+        best = np.column_stack(
+            [np.asarray(members)[grand_energies[:, members].argmin(axis=1)] for members in groups.values()]
+        )
+        el_ref_indices = [int(np.flatnonzero(group_fracs[:, col] == 1)[0]) for col in range(len(closed_els))]
+
+        if comps is not None:
+            comp_fracs = np.full((len(comps), len(closed_els)), np.nan)
+            for idx, comp in enumerate(comps):
+                closed_comp = Composition({el: amt for el, amt in comp.items() if el not in open_els})
+                if closed_comp.num_atoms > 0 and set(closed_comp.elements).issubset(closed_els):
+                    comp_fracs[idx] = [closed_comp.get_atomic_fraction(el) for el in closed_els]
+            valid = ~np.isnan(comp_fracs[:, 0])
+            hull_energies = np.full((len(mus), len(comps)), np.nan)
+
+        stable_entries = []
+        for point, point_best in enumerate(best):
+            data = np.column_stack([group_fracs, grand_energies[point, point_best]])
+            idx, qhull_data, facets = _get_qhull_data_and_facets(data, el_ref_indices)
+            stable_groups = {idx[row] for row in set(itertools.chain(*facets))}
+            stable_entries.append([candidates[point_best[group]] for group in sorted(stable_groups)])
+
+            if comps is not None:
+                aug_inv = _get_bary_inverses(np.array([qhull_data[facet, :-1] for facet in facets]))
+                facet_idx, bary = _locate_in_facets(aug_inv, comp_fracs[valid, 1:])
+                vertex_energies = np.array([qhull_data[facet, -1] for facet in facets])[facet_idx]
+                hull_energies[point, valid] = np.where(facet_idx >= 0, (bary * vertex_energies).sum(axis=1), np.nan)
+
+        return stable_entries, (hull_energies if comps is not None else None)
+
     def get_equilibrium_reaction_energy(self, entry: PDEntry) -> float | None:
         """
         Provides the reaction energy of a stable entry from the neighboring
@@ -1613,6 +2121,7 @@ class PatchedPhaseDiagram(PhaseDiagram):
         elements: Sequence[Element] | None = None,
         keep_all_spaces: bool = False,
         verbose: bool = False,
+        n_jobs: int = 1,
     ) -> None:
         """
         Args:
@@ -1626,6 +2135,10 @@ class PatchedPhaseDiagram(PhaseDiagram):
             keep_all_spaces (bool): Pass True to keep chemical spaces that are subspaces
                 of other spaces.
             verbose (bool): Whether to show progress bar during convex hull construction.
+            n_jobs (int): Number of processes used to construct the PD patches. The
+                composition and energy data is placed once in shared memory and each
+                process only receives the row and column indices of its chemical space.
+                -1 uses all CPUs. Defaults to 1, i.e. patches are built serially.
         """
         if elements is None:
             elements = sorted({els for entry in entries for els in entry.elements})
@@ -1685,7 +2198,12 @@ class PatchedPhaseDiagram(PhaseDiagram):
         self.spaces = sorted(spaces, key=len, reverse=True)  # Calculate pds for smaller dimension spaces last
         self.qhull_entries = qhull_entries
         self._qhull_spaces = qhull_spaces
-        self.pds = dict(self._get_pd_patch_for_space(s) for s in tqdm(self.spaces, disable=not verbose))
+        if n_jobs == 1:
+            self.pds = dict(self._get_pd_patch_for_space(s) for s in tqdm(self.spaces, disable=not verbose))
+        else:
+            self.pds = self._get_pd_patches_parallel(
+                min_entries, inds, data, elements=elements, el_refs=el_refs, n_jobs=n_jobs, verbose=verbose
+            )
         self.all_entries = all_entries
         self.el_refs = el_refs
         self.elements = elements
@@ -1765,6 +2283,56 @@ class PatchedPhaseDiagram(PhaseDiagram):
         elements = [Element.from_dict(elem) for elem in dct["elements"]]
         return cls(entries, elements)
 
+    def to_npz(self, filename: str | PathLike, compress: bool = False) -> None:
+        """Save all PD patches and a compact table of all entries in NumPy's binary npz
+        format. Entries shared between overlapping patches are only stored once.
+
+        Args:
+            filename (str | PathLike): Output file, conventionally ending in .npz.
+            compress (bool): Whether to compress the file. Defaults to False, which
+                gives the fastest loading.
+        """
+        index_of = {id(entry): idx for idx, entry in enumerate(self.all_entries)}
+        arrays = _NpzEntryStore.to_arrays(self.all_entries, self.elements)
+        arrays["qhull_entry_indices"] = np.array([index_of[id(entry)] for entry in self.qhull_entries], dtype=int)
+        arrays["stable_entry_indices"] = np.array([index_of[id(entry)] for entry in self._stable_entries], dtype=int)
+        arrays["el_ref_indices"] = np.array([index_of[id(entry)] for entry in self.el_refs.values()], dtype=int)
+        arrays["n_patches"] = np.array(len(self.pds))
+        for idx, pd in enumerate(self.pds.values()):
+            arrays |= _pd_to_npz_arrays(pd, index_of, prefix=f"patch{idx}_")
+        (np.savez_compressed if compress else np.savez)(filename, **arrays)
+
+    @classmethod
+    def from_npz(cls, filename: str | PathLike) -> Self:
+        """Load a PatchedPhaseDiagram saved with to_npz(). See PhaseDiagram.from_npz().
+
+        Args:
+            filename (str | PathLike): npz file written by to_npz().
+
+        Returns:
+            PatchedPhaseDiagram
+        """
+        with np.load(filename) as npz:
+            arrays = dict(npz)
+        store = _NpzEntryStore(arrays)
+
+        ppd = cls.__new__(cls)
+        ppd.elements = store.elements
+        ppd.dim = len(store.elements)
+        ppd.all_entries = _LazyEntrySequence(store, range(len(store)))
+        ppd.qhull_entries = _LazyEntrySequence(store, arrays["qhull_entry_indices"])
+        ppd._qhull_spaces = tuple(store.spaces[idx] for idx in arrays["qhull_entry_indices"])
+        patches = [
+            _pd_from_npz_arrays(PhaseDiagram, arrays, store, prefix=f"patch{idx}_")
+            for idx in range(int(arrays["n_patches"]))
+        ]
+        ppd.pds = {frozenset(pd.elements): pd for pd in patches}
+        ppd.spaces = list(ppd.pds)
+        ppd.el_refs = {store.elements[store.compositions[idx].argmax()]: store[idx] for idx in arrays["el_ref_indices"]}
+        ppd._stable_entries = _LazyEntrySequence(store, arrays["stable_entry_indices"])
+        ppd._stable_spaces = tuple(store.spaces[idx] for idx in arrays["stable_entry_indices"])
+        return ppd
+
     @staticmethod
     def remove_redundant_spaces(spaces, keep_all_spaces=False):
         if keep_all_spaces or len(spaces) <= 1:
@@ -1868,6 +2436,92 @@ class PatchedPhaseDiagram(PhaseDiagram):
             on_error=on_error,
         )
 
+    def _get_decomp_batch(self, comps: Sequence[Composition]) -> tuple[csr_array, np.ndarray]:
+        """See PhaseDiagram.
+
+        Compositions are grouped by the PD patch that contains them and each group is
+        decomposed in a single batch. Compositions not covered by any patch fall back
+        to SLSQP as in get_decomposition().
+        """
+        # Chemical space of each composition. Those of an EntryTable are read from its
+        # composition matrix, without creating a Composition per row.
+        if isinstance(comps, EntryTable):
+            space_masks, space_idx = np.unique(
+                np.abs(comps.amounts) > Composition.amount_tolerance, axis=0, return_inverse=True
+            )
+            spaces = [
+                frozenset(el for el, present in zip(comps.elements, mask, strict=True) if present)
+                for mask in space_masks
+            ]
+        else:
+            space_ids: dict[frozenset, int] = {}
+            space_idx = np.array(
+                [space_ids.setdefault(frozenset(comp.elements), len(space_ids)) for comp in comps], dtype=np.intp
+            )
+            spaces = list(space_ids)
+        space_idx = space_idx.reshape(-1)
+
+        # Index of the PD patch containing each chemical space, -1 if there is none
+        group_ids: dict[int, int] = {}
+        group_pds: list[PhaseDiagram] = []
+        space_group = np.full(len(spaces), -1)
+        for idx, space in enumerate(spaces):
+            try:
+                pd = self.get_pd_for_entry(Composition(dict.fromkeys(space, 1)))
+            except ValueError:
+                continue
+            if id(pd) not in group_ids:
+                group_ids[id(pd)] = len(group_pds)
+                group_pds.append(pd)
+            space_group[idx] = group_ids[id(pd)]
+        row_group = space_group[space_idx]
+        order = np.argsort(row_group, kind="stable")
+        bounds = np.searchsorted(row_group[order], np.arange(-1, len(group_pds) + 1))
+
+        qhull_idx = {id(entry): idx for idx, entry in enumerate(self.qhull_entries)}
+        rows: list[np.ndarray] = []
+        cols: list[np.ndarray] = []
+        amts: list[np.ndarray] = []
+        found = np.zeros(len(comps), dtype=bool)
+
+        stable_entries: dict[int, list[Entry]] = {}
+        for row in order[bounds[0] : bounds[1]]:
+            if space_idx[row] not in stable_entries:
+                stable_entries[space_idx[row]] = self._get_stable_entries_in_space(spaces[space_idx[row]])
+            comp = comps[row].composition if isinstance(comps, EntryTable) else comps[row]
+            try:
+                decomp = _get_slsqp_decomp(comp, stable_entries[space_idx[row]])
+            except ValueError:
+                continue
+            found[row] = True
+            rows.append(np.full(len(decomp), row))
+            cols.append(np.array([qhull_idx[id(entry)] for entry in decomp], dtype=int))
+            amts.append(np.array(list(decomp.values())))
+
+        for group, pd in enumerate(group_pds, start=1):
+            indices = order[bounds[group] : bounds[group + 1]]
+            pd_comps: Sequence[Composition]
+            if isinstance(comps, EntryTable):
+                pd_comps = EntryTable(comps.elements, comps.amounts[indices], comps.uncorrected_energies[indices])
+            else:
+                pd_comps = [comps[idx] for idx in indices]
+            weights, pd_found = pd._get_decomp_batch(pd_comps)
+            col_map = np.array([qhull_idx[id(entry)] for entry in pd.qhull_entries], dtype=int)
+            weights = weights.tocoo()
+            found[indices] = pd_found
+            rows.append(indices[weights.row])
+            cols.append(col_map[weights.col])
+            amts.append(weights.data)
+
+        weights = csr_array(
+            (
+                np.concatenate([np.zeros(0), *amts]),
+                (np.concatenate([np.zeros(0, dtype=int), *rows]), np.concatenate([np.zeros(0, dtype=int), *cols])),
+            ),
+            shape=(len(comps), len(self.qhull_entries)),
+        )
+        return weights, found
+
     def _get_pd_patch_for_space(self, space: frozenset[Element]) -> tuple[frozenset[Element], PhaseDiagram]:
         """
         Args:
@@ -1880,6 +2534,94 @@ class PatchedPhaseDiagram(PhaseDiagram):
 
         return space, PhaseDiagram(space_entries)
 
+    def _get_pd_patches_parallel(
+        self,
+        min_entries: list[PDEntry],
+        qhull_rows: list[int],
+        data: np.ndarray,
+        *,
+        elements: Sequence[Element],
+        el_refs: dict[Element, PDEntry],
+        n_jobs: int,
+        verbose: bool,
+    ) -> dict[frozenset[Element], PhaseDiagram]:
+        """Build the PD patches for all spaces in a process pool.
+
+        The atomic fractions and energies of min_entries are copied once into a shared
+        memory block. Each task only consists of the rows (qhull entries) and columns
+        (elements) of its chemical space. The convex hulls are computed in the workers
+        and the resulting PhaseDiagrams are assembled from the original entries, so they
+        are identical to those built by _get_pd_patch_for_space().
+
+        Args:
+            min_entries (list[PDEntry]): Lowest energy entry per composition, sorted by
+                reduced composition.
+            qhull_rows (list[int]): Rows of min_entries used in the convex hull, in the
+                order of self.qhull_entries.
+            data (np.ndarray): Atomic fractions and energy per atom of min_entries.
+            elements (list[Element]): Elements corresponding to the columns of data.
+            el_refs (dict[Element, PDEntry]): Elemental references.
+            n_jobs (int): Number of processes. -1 uses all CPUs.
+            verbose (bool): Whether to show a progress bar.
+
+        Returns:
+            dict[frozenset[Element], PhaseDiagram]: PD patch for each space.
+        """
+        col_of_el = {el: idx for idx, el in enumerate(elements)}
+        row_of_ref = {el: min_entries.index(entry) for el, entry in el_refs.items()}
+
+        tasks = []
+        space_masks = []
+        for space in self.spaces:
+            in_space = [space.issuperset(entry_space) for entry_space in self._qhull_spaces]
+            rows = sorted(row for row, member in zip(qhull_rows, in_space, strict=True) if member)
+            space_els = sorted(space)
+            cols = [col_of_el[el] for el in space_els]
+            el_ref_indices = [rows.index(row_of_ref[el]) for el in space_els]
+            tasks.append((rows, cols, el_ref_indices))
+            space_masks.append(in_space)
+
+        max_workers = os.cpu_count() if n_jobs == -1 else n_jobs
+        shm = SharedMemory(create=True, size=data.nbytes)
+        try:
+            np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)[:] = data
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_pd_patch_worker,
+                initargs=(shm.name, data.shape, data.dtype.str),
+            ) as executor:
+                chunksize = max(1, len(tasks) // (4 * (max_workers or 1)))
+                results = list(
+                    tqdm(
+                        executor.map(_get_pd_patch_hull, tasks, chunksize=chunksize),
+                        total=len(tasks),
+                        disable=not verbose,
+                    )
+                )
+        finally:
+            shm.close()
+            shm.unlink()
+
+        pds = {}
+        for space, (rows, _cols, _el_ref_indices), in_space, (idx, qhull_data, facets) in zip(
+            self.spaces, tasks, space_masks, results, strict=True
+        ):
+            space_els = sorted(space)
+            space_entries = [min_entries[row] for row in rows]
+            computed_data = {
+                "facets": facets,
+                "simplexes": [Simplex(qhull_data[facet, :-1]) for facet in facets],
+                "all_entries": space_entries,
+                "qhull_data": qhull_data,
+                "dim": len(space_els),
+                "el_refs": sorted(((el, el_refs[el]) for el in space_els), key=lambda item: row_of_ref[item[0]]),
+                "qhull_entries": [space_entries[i] for i in idx],
+            }
+            qhull_space_entries = [e for e, member in zip(self.qhull_entries, in_space, strict=True) if member]
+            pds[space] = PhaseDiagram(qhull_space_entries, space_els, computed_data=computed_data)
+
+        return pds
+
     # NOTE the following functions are not implemented for PatchedPhaseDiagram
 
     def _get_facet_and_simplex(self):
@@ -2081,10 +2823,247 @@ class ReactionDiagram:
         )
 
 
+class _NpzEntryStore:
+    """Compact entry table loaded from an npz file written by PhaseDiagram.to_npz().
+
+    Entries are kept as JSON and only decoded on first access. The compositions
+    are available as a dense (n_entries, n_elements) matrix without decoding.
+    """
+
+    def __init__(self, arrays: dict[str, np.ndarray]) -> None:
+        """
+        Args:
+            arrays (dict[str, np.ndarray]): Arrays from the npz file.
+        """
+        self.elements = [Element(symbol) for symbol in arrays["elements"]]
+        self.compositions = arrays["entry_compositions"]
+        self.energies = arrays["entry_energies"]
+        self._json = arrays["entry_json"].tobytes()
+        self._offsets = arrays["entry_offsets"]
+        self._entries: list[PDEntry | None] = [None] * len(self.energies)
+        self._spaces: tuple[frozenset[Element], ...] | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, idx: int) -> PDEntry:
+        if (entry := self._entries[idx]) is None:
+            dct = json.loads(self._json[self._offsets[idx] : self._offsets[idx + 1]])
+            entry = self._entries[idx] = MontyDecoder().process_decoded(dct)
+        return entry
+
+    @property
+    def spaces(self) -> tuple[frozenset[Element], ...]:
+        """Chemical space of each entry, derived from the composition matrix."""
+        if self._spaces is None:
+            self._spaces = tuple(
+                frozenset(self.elements[col] for col in np.flatnonzero(row)) for row in self.compositions
+            )
+        return self._spaces
+
+    @staticmethod
+    def to_arrays(entries: Sequence[PDEntry], elements: Sequence[Element]) -> dict[str, np.ndarray]:
+        """Convert entries into the arrays of the npz entry table.
+
+        Args:
+            entries (list[PDEntry]): Entries to store.
+            elements (list[Element]): Elements of the composition matrix columns.
+
+        Returns:
+            dict[str, np.ndarray]: Arrays of the entry table.
+        """
+        blobs = [json.dumps(entry.as_dict(), cls=MontyEncoder).encode() for entry in entries]
+        return {
+            "elements": np.array([el.symbol for el in elements]),
+            "entry_compositions": np.array([[entry.composition[el] for el in elements] for entry in entries]),
+            "entry_energies": np.array([entry.energy for entry in entries]),
+            "entry_json": np.frombuffer(b"".join(blobs), dtype=np.uint8),
+            "entry_offsets": np.cumsum([0, *map(len, blobs)]),
+        }
+
+
+class _LazyEntrySequence(Sequence):
+    """Read-only view of entries in an _NpzEntryStore, decoded on first access."""
+
+    def __init__(self, store: _NpzEntryStore, indices: Sequence[int]) -> None:
+        """
+        Args:
+            store (_NpzEntryStore): Entry table.
+            indices (list[int]): Indices of the entries in the store.
+        """
+        self._store = store
+        self._indices = indices
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self._store[int(i)] for i in self._indices[idx]]
+        return self._store[int(self._indices[idx])]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__} of {len(self)} entries"
+
+
+def _pd_to_npz_arrays(pd: PhaseDiagram, index_of: dict[int, int], prefix: str = "") -> dict[str, np.ndarray]:
+    """Arrays describing the computed hull of a PhaseDiagram, with entries given as
+    indices into the npz entry table.
+
+    Args:
+        pd (PhaseDiagram): Phase diagram to store.
+        index_of (dict[int, int]): Map from id() of each entry to its index in the table.
+        prefix (str): Prefix for the array names.
+
+    Returns:
+        dict[str, np.ndarray]: Arrays of the hull.
+    """
+    return {
+        f"{prefix}elements": np.array([el.symbol for el in pd.elements]),
+        f"{prefix}qhull_data": np.asarray(pd.qhull_data),
+        f"{prefix}facets": np.array(pd.facets, dtype=int).reshape(len(pd.facets), -1),
+        f"{prefix}entry_indices": np.array([index_of[id(entry)] for entry in pd.entries], dtype=int),
+        f"{prefix}all_entry_indices": np.array([index_of[id(entry)] for entry in pd.all_entries], dtype=int),
+        f"{prefix}qhull_entry_indices": np.array([index_of[id(entry)] for entry in pd.qhull_entries], dtype=int),
+        f"{prefix}el_ref_indices": np.array([index_of[id(entry)] for entry in pd.el_refs.values()], dtype=int),
+    }
+
+
+def _pd_from_npz_arrays(
+    cls: type[PhaseDiagram], arrays: dict[str, np.ndarray], store: _NpzEntryStore, prefix: str = ""
+) -> PhaseDiagram:
+    """Reconstitute a PhaseDiagram written by _pd_to_npz_arrays() without decoding
+    its entries or recomputing the convex hull.
+
+    Args:
+        cls (type[PhaseDiagram]): Class to instantiate.
+        arrays (dict[str, np.ndarray]): Arrays from the npz file.
+        store (_NpzEntryStore): Entry table.
+        prefix (str): Prefix of the array names.
+
+    Returns:
+        PhaseDiagram
+    """
+    elements = [Element(symbol) for symbol in arrays[f"{prefix}elements"]]
+    qhull_data = arrays[f"{prefix}qhull_data"]
+    facets = list(arrays[f"{prefix}facets"])
+    qhull_indices = arrays[f"{prefix}qhull_entry_indices"]
+    stable_indices = qhull_indices[np.unique(arrays[f"{prefix}facets"])]
+    el_refs = [
+        (store.elements[store.compositions[idx].argmax()], store[idx]) for idx in arrays[f"{prefix}el_ref_indices"]
+    ]
+
+    pd = cls.__new__(cls)
+    pd.elements = elements
+    pd.entries = _LazyEntrySequence(store, arrays[f"{prefix}entry_indices"])
+    pd.computed_data = {
+        "facets": facets,
+        "simplexes": [Simplex(qhull_data[facet, :-1]) for facet in facets],
+        "all_entries": _LazyEntrySequence(store, arrays[f"{prefix}all_entry_indices"]),
+        "qhull_data": qhull_data,
+        "dim": len(elements),
+        "el_refs": el_refs,
+        "qhull_entries": _LazyEntrySequence(store, qhull_indices),
+    }
+    pd.facets = facets
+    pd.simplexes = pd.computed_data["simplexes"]
+    pd.all_entries = pd.computed_data["all_entries"]
+    pd.qhull_data = qhull_data
+    pd.dim = len(elements)
+    pd.el_refs = dict(el_refs)
+    pd.qhull_entries = pd.computed_data["qhull_entries"]
+    pd._qhull_spaces = tuple(store.spaces[idx] for idx in qhull_indices)
+    pd._stable_entries = _LazyEntrySequence(store, stable_indices)
+    pd._stable_spaces = tuple(store.spaces[idx] for idx in stable_indices)
+    return pd
+
+
 class PhaseDiagramError(Exception):
     """An exception class for Phase Diagram generation."""
 
 
+# Composition and energy data shared with PatchedPhaseDiagram worker processes
+_PD_PATCH_SHM: SharedMemory | None = None
+_PD_PATCH_DATA: np.ndarray | None = None
+
+
+def _init_pd_patch_worker(shm_name: str, shape: tuple[int, int], dtype: str) -> None:
+    """Attach a PatchedPhaseDiagram worker process to the shared data block."""
+    global _PD_PATCH_SHM, _PD_PATCH_DATA  # noqa: PLW0603
+    _PD_PATCH_SHM = SharedMemory(name=shm_name)
+    _PD_PATCH_DATA = np.ndarray(shape, dtype=dtype, buffer=_PD_PATCH_SHM.buf)
+
+
+def _get_pd_patch_hull(task: tuple[list[int], list[int], list[int]]) -> tuple[list[int], np.ndarray, list[np.ndarray]]:
+    """Compute the convex hull of one PD patch from the shared data block.
+
+    Args:
+        task (tuple): Rows (entries) and columns (elements) of the shared data in
+            this chemical space, and the position of each elemental reference in rows.
+
+    Returns:
+        See _get_qhull_data_and_facets().
+    """
+    rows, cols, el_ref_indices = task
+    data = _PD_PATCH_DATA[np.ix_(rows, [*cols, -1])]
+    return _get_qhull_data_and_facets(data, el_ref_indices)
+
+
+def _get_qhull_data_and_facets(
+    data: np.ndarray,
+    el_ref_indices: Sequence[int],
+) -> tuple[list[int], np.ndarray, list[np.ndarray]]:
+    """Compute the lower convex hull from composition and energy data.
+
+    This only operates on arrays so it can run without access to the entry objects.
+
+    Args:
+        data (np.ndarray): Array of shape (n_entries, dim + 1) holding the atomic fractions
+            of each element and the energy per atom of the lowest energy entry for each
+            composition, in the sorted order used by PhaseDiagram.
+        el_ref_indices (list[int]): Row of the elemental reference for each element (column).
+
+    Returns:
+        tuple[list[int], np.ndarray, list[np.ndarray]]: Rows of data used in the convex hull,
+            the qhull data (including the extra point enforcing full dimensionality) and the
+            facets of the lower hull.
+    """
+    dim = data.shape[1] - 1
+
+    # Use only entries with negative formation energy
+    vec = [data[idx, -1] for idx in el_ref_indices] + [-1]
+    form_e = -np.dot(data, vec)
+    idx = np.where(form_e < -PhaseDiagram.formation_energy_tol)[0].tolist()
+
+    # Add the elemental references, in the order they appear in data
+    idx.extend(sorted(el_ref_indices))
+
+    qhull_data = data[idx][:, 1:]
+
+    # Add an extra point to enforce full dimensionality.
+    # This point will be present in all upper hull facets.
+    extra_point = np.zeros(dim) + 1 / dim
+    extra_point[-1] = np.max(qhull_data) + 1
+    qhull_data = np.concatenate([qhull_data, [extra_point]], axis=0)
+
+    if dim == 1:
+        facets = [qhull_data.argmin(axis=0)]
+    else:
+        facets = get_facets(qhull_data)
+        final_facets = []
+        for facet in facets:
+            # Skip facets that include the extra point
+            if max(facet) == len(qhull_data) - 1:
+                continue
+            mat = qhull_data[facet]
+            mat[:, -1] = 1
+            if abs(np.linalg.det(mat)) > 1e-14:
+                final_facets.append(facet)
+        facets = final_facets
+
+    return idx, qhull_data, facets
+
+
 def get_facets(qhull_data: ArrayLike, joggle: bool = False) -> ConvexHull:
     """Get the simplex facets for the Convex hull.
 
@@ -2103,6 +3082,76 @@ def get_facets(qhull_data: ArrayLike, joggle: bool = False) -> ConvexHull:
     return ConvexHull(qhull_data, qhull_options="Qt i").simplices
 
 
+def _get_bary_inverses(simplex_coords: np.ndarray) -> np.ndarray:
+    """Stacked inverses of the augmented matrices of simplexes.
+
+    Args:
+        simplex_coords (np.ndarray): Vertex coordinates of shape (n_simplexes, dim, dim - 1).
+
+    Returns:
+        np.ndarray: of shape (n_simplexes, dim, dim).
+    """
+    n_simplexes, n_vertices = simplex_coords.shape[:2]
+    aug = np.concatenate([simplex_coords, np.ones((n_simplexes, n_vertices, 1))], axis=-1)
+    return np.linalg.inv(aug)
+
+
+def _locate_in_facets(aug_inv: np.ndarray, coords: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Locate the first facet containing each of a set of points.
+
+    Barycentric coordinates of every point in every facet are evaluated with
+    one batched matrix product per chunk of points.
+
+    Args:
+        aug_inv (np.ndarray): Output of _get_bary_inverses() for the facets.
+        coords (np.ndarray): Reduced dimension coordinates of shape (n, dim - 1).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Facet index of each point (-1 if none was
+            found) and the barycentric coordinates in that facet, shape (n, dim).
+    """
+    n_facets, dim = aug_inv.shape[:2]
+    n_points = len(coords)
+    aug_points = np.concatenate([coords, np.ones((n_points, 1))], axis=1)
+
+    facet_idx = np.full(n_points, -1, dtype=int)
+    bary = np.zeros((n_points, dim))
+    # bound the (chunk, n_facets, dim) intermediate to ~32 MB
+    chunk_size = max(1, 2**22 // (n_facets * dim))
+    for start in range(0, n_points, chunk_size):
+        chunk = slice(start, start + chunk_size)
+        all_bary = np.einsum("pi,fij->pfj", aug_points[chunk], aug_inv)
+        in_facet = (all_bary >= -PhaseDiagram.numerical_tol / 10).all(axis=-1)
+        first = in_facet.argmax(axis=1)
+        found = in_facet[np.arange(len(first)), first]
+        facet_idx[chunk] = np.where(found, first, -1)
+        bary[chunk] = all_bary[np.arange(len(first)), first]
+
+    return facet_idx, bary
+
+
+def _handle_batch_decomp_errors(
+    comps: Sequence[Composition],
+    found: np.ndarray,
+    on_error: Literal["raise", "warn", "ignore"],
+) -> None:
+    """Raise or warn about compositions for which a batched decomposition failed.
+
+    Args:
+        comps (list[Composition]): Compositions passed to a batch method.
+        found (np.ndarray): Boolean mask of successfully decomposed compositions.
+        on_error ('raise' | 'warn' | 'ignore'): What to do if any decomposition failed.
+    """
+    if found.all():
+        return
+    failed = [comps[idx] for idx in np.flatnonzero(~found)]
+    msg = f"Unable to get decomposition for {len(failed)} of {len(comps)} compositions, e.g. {failed[0]}"
+    if on_error == "raise":
+        raise ValueError(msg)
+    if on_error == "warn":
+        warnings.warn(msg, stacklevel=3)
+
+
 def _get_slsqp_decomp(
     comp,
     competing_entries,
@@ -10,7 +10,7 @@ import logging
 import re
 import warnings
 from copy import deepcopy
-from functools import cmp_to_key, partial
+from functools import cmp_to_key
 from multiprocessing import Pool
 from typing import TYPE_CHECKING
 
@@ -35,7 +35,7 @@ if TYPE_CHECKING:
     from typing import Any, ClassVar, Literal
 
     import matplotlib.pyplot as plt
-    from numpy.typing import NDArray
+    from numpy.typing import ArrayLike, NDArray
     from typing_extensions import Self
 
     from pymatgen.core import DummySpecies, Species
@@ -421,6 +421,26 @@ def ion_or_solid_comp_object(formula: str) -> Composition | Ion:
     return Composition(formula)
 
 
+# Entries and product composition shared with multi-entry worker processes,
+# set once per worker by the pool initializer so that tasks only carry indices
+_MULTIENTRY_DATA: dict[str, Any] = {}
+
+
+def _init_multientry_worker(entries: list[PourbaixEntry], prod_comp: Composition, coeff_threshold: float) -> None:
+    """Pool initializer storing the entries to be combined in the worker."""
+    _MULTIENTRY_DATA.update(entries=entries, prod_comp=prod_comp, coeff_threshold=coeff_threshold)
+
+
+def _process_multientry_combo(combo: tuple[int, ...]) -> MultiEntry | None:
+    """Process a combo of entry indices into a MultiEntry in a worker."""
+    entries = _MULTIENTRY_DATA["entries"]
+    return PourbaixDiagram.process_multientry(
+        [entries[idx] for idx in combo],
+        prod_comp=_MULTIENTRY_DATA["prod_comp"],
+        coeff_threshold=_MULTIENTRY_DATA["coeff_threshold"],
+    )
+
+
 # TODO: the solids filter breaks some of the functionality of the
 # heatmap plotter, because the reference states for decomposition
 # don't include oxygen/hydrogen in the OER/HER regions
@@ -527,6 +547,7 @@ class PourbaixDiagram(MSONable):
                 self._multi_element = False
 
         self._stable_domains, self._stable_domain_vertices = self.get_pourbaix_domains(self._processed_entries)
+        self._stable_coeffs = self._get_energy_coefficients(self.stable_entries)
 
     def _convert_entries_to_points(self, pourbaix_entries: list[PourbaixEntry]) -> NDArray:
         """
@@ -628,37 +649,12 @@ class PourbaixDiagram(MSONable):
 
         min_entries, valid_facets = self._get_hull_in_nph_nphi_space(entries)
 
-        combos: list[list[frozenset]] = []
+        combos: set[tuple[int, ...]] = set()
         for facet in valid_facets:
             for idx in range(1, self.dim + 2):
-                these_combos: list[frozenset] = []
-                for combo in itertools.combinations(facet, idx):
-                    these_entries = [min_entries[i] for i in combo]
-                    these_combos.append(frozenset(these_entries))
-                combos.append(these_combos)
-
-        all_combos: set | list = set(itertools.chain.from_iterable(combos))
-
-        list_combos: list = []
-        for combo in all_combos:
-            list_combos.append(list(combo))
-        all_combos = list_combos
-
-        multi_entries: list = []
-
-        # Parallel processing of multi-entry generation
-        if nproc is not None:
-            func = partial(self.process_multientry, prod_comp=tot_comp)
-            with Pool(nproc) as proc_pool:
-                multi_entries = list(proc_pool.imap(func, all_combos))
-            multi_entries = list(filter(bool, multi_entries))
-        else:
-            # Serial processing of multi-entry generation
-            for combo in all_combos:
-                if multi_entry := self.process_multientry(combo, prod_comp=tot_comp):
-                    multi_entries.append(multi_entry)
+                combos.update(itertools.combinations(sorted(facet), idx))
 
-        return multi_entries
+        return self._get_multientries(min_entries, sorted(combos), tot_comp, nproc=nproc)
 
     def _generate_multielement_entries(
         self,
@@ -681,34 +677,120 @@ class PourbaixDiagram(MSONable):
         n_elems = len(self._elt_comp)  # No. of elements
         total_comp = Composition(self._elt_comp)
 
-        # generate all combinations of compounds that have all elements
-        entry_combos: list = [itertools.combinations(entries, idx + 1) for idx in range(n_elems)]
-        entry_combos = list(itertools.chain.from_iterable(entry_combos))
-
-        entry_combos = list(filter(lambda x: total_comp < MultiEntry(x).composition, entry_combos))
-
-        # Generate and filter entries
-        processed_entries: list = []
         total = sum(comb(len(entries), idx + 1) for idx in range(n_elems))
         if total > 1e6:
             warnings.warn(
                 f"Your Pourbaix diagram includes {total} entries and may take a long time to generate.", stacklevel=2
             )
 
-        # Parallel processing of multi-entry generation
-        if nproc is not None:
-            func = partial(self.process_multientry, prod_comp=total_comp)
-            with Pool(nproc) as proc_pool:
-                processed_entries = list(proc_pool.imap(func, entry_combos))
-            processed_entries = list(filter(bool, processed_entries))
-        # Serial processing of multi-entry generation
+        # Only combos of entries that together span exactly the non-OH elements of the
+        # target composition can produce it with positive weights, so prune on the
+        # element sets of each entry before enumerating anything else
+        target_elts = frozenset(total_comp.elements) - self.elements_ho
+        entry_elts = [frozenset(entry.composition.elements) - self.elements_ho for entry in entries]
+        candidates = [idx for idx, elts in enumerate(entry_elts) if elts and elts <= target_elts]
+
+        entry_combos: list[tuple[int, ...]] = []
+        for idx in range(n_elems):
+            for combo in itertools.combinations(candidates, idx + 1):
+                if frozenset().union(*(entry_elts[i] for i in combo)) == target_elts:
+                    entry_combos.append(combo)
+
+        return self._get_multientries(entries, entry_combos, total_comp, nproc=nproc)
+
+    @classmethod
+    def _get_multientries(
+        cls,
+        entries: Sequence[PourbaixEntry],
+        combos: Sequence[tuple[int, ...]],
+        prod_comp: Composition,
+        *,
+        nproc: int | None = None,
+        coeff_threshold: float = 1e-4,
+        chunk_size: int = 100_000,
+    ) -> list[MultiEntry]:
+        """Generate MultiEntries from combos of entry indices.
+
+        Equivalent to calling process_multientry on every combo, but the
+        weights of combos of equal size are solved together as a stacked
+        least-squares problem over the non-OH elements. Combos that contain
+        elements absent from the product, cannot be balanced or require
+        non-positive weights are discarded without building a Reaction.
+        Only combos with linearly dependent compositions, for which the
+        weights are not unique, are handed to process_multientry.
+
+        Args:
+            entries (Sequence[PourbaixEntry]): entries indexed by combos
+            combos (Sequence[tuple[int, ...]]): tuples of entry indices
+            prod_comp (Composition): composition constraint for setting
+                weights of each MultiEntry
+            nproc (int): number of processes used for the combos handed to
+                process_multientry. Entries are sent to each worker once
+                and tasks only carry entry indices.
+            coeff_threshold (float): minimum weight of each entry
+            chunk_size (int): maximum number of combos solved at once
+
+        Returns:
+            list[MultiEntry]: MultiEntries in the order of combos
+        """
+        elements = sorted(
+            {el for entry in entries for el in entry.composition.elements}.union(prod_comp.elements) - cls.elements_ho
+        )
+        entry_comps = np.array([[entry.composition[el] for el in elements] for entry in entries], dtype=float)
+        target = np.array([prod_comp[el] for el in elements], dtype=float)
+        # Elements absent from the product can't be balanced with positive weights
+        excluded = np.flatnonzero(np.abs(target) < Composition.amount_tolerance)
+        entry_ok = ~(entry_comps[:, excluded] > Composition.amount_tolerance).any(axis=1)
+
+        results: dict[int, MultiEntry] = {}
+        fallback: list[int] = []
+        combos_by_size: dict[int, list[int]] = {}
+        for idx, combo in enumerate(combos):
+            combos_by_size.setdefault(len(combo), []).append(idx)
+
+        for size, combo_indices in combos_by_size.items():
+            for start in range(0, len(combo_indices), chunk_size):
+                chunk = np.array(combo_indices[start : start + chunk_size])
+                indices = np.array([combos[idx] for idx in chunk], dtype=int).reshape(-1, size)
+                keep = entry_ok[indices].all(axis=1)
+                chunk, indices = chunk[keep], indices[keep]
+                if len(chunk) == 0:
+                    continue
+
+                # (n_combos, n_elements, size) composition matrices
+                comp_matrices = entry_comps[indices].transpose(0, 2, 1)
+                full_rank = np.linalg.matrix_rank(comp_matrices) == size
+                fallback.extend(chunk[~full_rank].tolist())
+
+                chunk, indices, comp_matrices = chunk[full_rank], indices[full_rank], comp_matrices[full_rank]
+                weights = np.einsum("nij,j->ni", np.linalg.pinv(comp_matrices), target)
+                residuals = np.einsum("nij,nj->ni", comp_matrices, weights) - target
+                valid = (np.abs(residuals) <= 1e-8).all(axis=1) & (weights > coeff_threshold).all(axis=1)
+                for idx, combo, combo_weights in zip(chunk[valid], indices[valid], weights[valid], strict=True):
+                    results[int(idx)] = MultiEntry([entries[i] for i in combo], weights=combo_weights.tolist())
+
+        fallback_combos = [combos[idx] for idx in fallback]
+        if nproc is not None and fallback_combos:
+            with Pool(
+                nproc, initializer=_init_multientry_worker, initargs=(list(entries), prod_comp, coeff_threshold)
+            ) as proc_pool:
+                fallback_entries = list(
+                    proc_pool.imap(
+                        _process_multientry_combo,
+                        fallback_combos,
+                        chunksize=max(1, len(fallback_combos) // (4 * nproc)),
+                    )
+                )
         else:
-            for combo in entry_combos:
-                processed_entry = self.process_multientry(combo, total_comp)
-                if processed_entry is not None:
-                    processed_entries.append(processed_entry)
+            fallback_entries = [
+                cls.process_multientry([entries[i] for i in combo], prod_comp, coeff_threshold)
+                for combo in fallback_combos
+            ]
+        results.update(
+            {idx: multi_entry for idx, multi_entry in zip(fallback, fallback_entries, strict=True) if multi_entry}
+        )
 
-        return processed_entries
+        return [results[idx] for idx in sorted(results)]
 
     @staticmethod
     def process_multientry(
@@ -840,6 +922,39 @@ class PourbaixDiagram(MSONable):
 
         return pourbaix_domains, pourbaix_domain_vertices
 
+    @staticmethod
+    def _get_energy_coefficients(entries: Sequence[PourbaixEntry]) -> NDArray:
+        """Compile entries into the coefficients of their energies at conditions.
+
+        Args:
+            entries (list[PourbaixEntry]): Pourbaix entries or MultiEntries.
+
+        Returns:
+            NDArray: of shape (n_entries, 4) with columns energy, npH * PREFAC, nPhi and
+                normalization factor, such that the normalized energy at (pH, V) is
+                (energy + npH * PREFAC * pH + nPhi * V) * normalization factor.
+        """
+        return np.array(
+            [[entry.energy, entry.npH * PREFAC, entry.nPhi, entry.normalization_factor] for entry in entries]
+        ).reshape(-1, 4)
+
+    @staticmethod
+    def _get_normalized_energies(coeffs: NDArray, pH: ArrayLike, V: ArrayLike) -> NDArray:
+        """Evaluate normalized energies from compiled coefficients.
+
+        Args:
+            coeffs (NDArray): Output of _get_energy_coefficients().
+            pH (ArrayLike): pH values, broadcast against V.
+            V (ArrayLike): Voltages, broadcast against pH.
+
+        Returns:
+            NDArray: of shape (n_entries, *np.broadcast(pH, V).shape).
+        """
+        pH, V = np.asarray(pH, dtype=float), np.asarray(V, dtype=float)
+        shape = (len(coeffs),) + (1,) * np.broadcast(pH, V).ndim
+        energy, pH_coeff, V_coeff, norm = (col.reshape(shape) for col in coeffs.T)
+        return (energy + pH_coeff * pH + V_coeff * V) * norm
+
     def find_stable_entry(self, pH: float, V: float) -> PourbaixEntry:
         """Find stable entry at a pH,V condition.
 
@@ -850,8 +965,7 @@ class PourbaixDiagram(MSONable):
         Returns:
             PourbaixEntry: stable entry at pH, V
         """
-        energies_at_conditions = [entry.normalized_energy_at_conditions(pH, V) for entry in self.stable_entries]
-        return self.stable_entries[np.argmin(energies_at_conditions)]
+        return self.get_stable_entry(pH, V)
 
     def get_decomposition_energy(
         self,
@@ -872,21 +986,43 @@ class PourbaixDiagram(MSONable):
             Decomposition energy for the entry, i.e. the energy above
                 the "Pourbaix hull" in eV/atom at the given conditions
         """
-        # Check composition consistency between entry and Pourbaix diagram:
+        return self.get_decomposition_energies([entry], pH, V)[0]
+
+    def get_decomposition_energies(
+        self,
+        entries: Sequence[PourbaixEntry],
+        pH: ArrayLike,
+        V: ArrayLike,
+    ) -> NDArray:
+        """Decomposition energies of many entries over a (pH, V) grid in eV/atom.
+
+        The hull energy is evaluated once for the whole grid and shared by all entries.
+
+        Args:
+            entries (list[PourbaixEntry]): Entries to find the decomposition energies for.
+                Their compositions must match the Pourbaix diagram.
+            pH (ArrayLike): pH values, broadcast against V.
+            V (ArrayLike): Voltages, broadcast against pH.
+
+        Returns:
+            NDArray: of shape (n_entries, *np.broadcast(pH, V).shape).
+        """
+        # Check composition consistency between entries and Pourbaix diagram:
         pbx_comp = Composition(self._elt_comp).fractional_composition
-        entry_pbx_comp = Composition(
-            {elt: coeff for elt, coeff in entry.composition.items() if elt not in self.elements_ho}
-        ).fractional_composition
-        if entry_pbx_comp != pbx_comp:
-            raise ValueError("Composition of stability entry does not match Pourbaix Diagram")
-        entry_normalized_energy = entry.normalized_energy_at_conditions(pH, V)
-        hull_energy = self.get_hull_energy(pH, V)
-        decomposition_energy = entry_normalized_energy - hull_energy
+        for entry in entries:
+            entry_pbx_comp = Composition(
+                {elt: coeff for elt, coeff in entry.composition.items() if elt not in self.elements_ho}
+            ).fractional_composition
+            if entry_pbx_comp != pbx_comp:
+                raise ValueError("Composition of stability entry does not match Pourbaix Diagram")
+
+        coeffs = self._get_energy_coefficients(entries)
+        decomposition_energy = self._get_normalized_energies(coeffs, pH, V) - self.get_hull_energy(pH, V)
 
         # Convert to eV/atom instead of eV/normalized formula unit
-        decomposition_energy /= entry.normalization_factor
-        decomposition_energy /= entry.composition.num_atoms
-        return decomposition_energy
+        num_atoms = np.array([entry.composition.num_atoms for entry in entries])
+        scale = (coeffs[:, 3] * num_atoms).reshape((-1,) + (1,) * (decomposition_energy.ndim - 1))
+        return decomposition_energy / scale
 
     def get_hull_energy(self, pH: float | list[float], V: float | list[float]) -> NDArray:
         """Get the minimum energy of the Pourbaix "basin" that is formed
@@ -899,8 +1035,7 @@ class PourbaixDiagram(MSONable):
         Returns:
             np.array: minimum Pourbaix energy at conditions
         """
-        all_gs = np.array([entry.normalized_energy_at_conditions(pH, V) for entry in self.stable_entries])
-        return np.min(all_gs, axis=0)
+        return np.min(self._get_normalized_energies(self._stable_coeffs, pH, V), axis=0)
 
     def get_stable_entry(self, pH: float, V: float) -> PourbaixEntry | MultiEntry:
         """Get the stable entry at a given pH, V condition.
@@ -913,8 +1048,20 @@ class PourbaixDiagram(MSONable):
             PourbaixEntry | MultiEntry: Pourbaix or multi-entry
                 corresponding to the minimum energy entry at a given pH, V condition
         """
-        all_gs = np.array([entry.normalized_energy_at_conditions(pH, V) for entry in self.stable_entries])
-        return self.stable_entries[np.argmin(all_gs)]
+        return self.stable_entries[int(self.get_stable_entry_map(pH, V))]
+
+    def get_stable_entry_map(self, pH: ArrayLike, V: ArrayLike) -> NDArray:
+        """Indices of the stable entries over a (pH, V) grid from a single vectorized
+        argmin, e.g. for rendering high-resolution stability maps.
+
+        Args:
+            pH (ArrayLike): pH values, broadcast against V.
+            V (ArrayLike): Voltages, broadcast against pH.
+
+        Returns:
+            NDArray: of shape np.broadcast(pH, V).shape holding indices into stable_entries.
+        """
+        return np.argmin(self._get_normalized_energies(self._stable_coeffs, pH, V), axis=0)
 
     @property
     def stable_entries(self) -> list:
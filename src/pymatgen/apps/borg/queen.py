@@ -5,16 +5,29 @@ data using Python's multiprocessing.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
-from multiprocessing import Manager, Pool
+import sqlite3
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, nullcontext
+from fnmatch import fnmatch
+from multiprocessing import Pool
 from typing import TYPE_CHECKING
 
+from monty.dev import deprecated
 from monty.io import zopen
 from monty.json import MontyDecoder, MontyEncoder
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from typing import Any
+
+    from typing_extensions import Self
+
     from pymatgen.apps.borg.hive import AbstractDrone
     from pymatgen.util.typing import PathLike
 
@@ -32,6 +45,10 @@ class BorgQueen:
         drone: AbstractDrone,
         rootpath: PathLike | None = None,
         number_of_drones: int = 1,
+        *,
+        manifest: PathLike | None = None,
+        hash_patterns: Sequence[str] = ("vasprun.xml*", "OUTCAR*"),
+        scan_workers: int | None = None,
     ) -> None:
         """
         Args:
@@ -46,9 +63,30 @@ class BorgQueen:
                 will definitely see a significant speedup of at least 50% or so.
                 If you are running this over a server with far more processors,
                 the speedup will be even greater.
+            manifest (PathLike): SQLite database file caching the assimilated object
+                of every valid path together with a fingerprint of its files (sizes,
+                mtimes and content hashes), stored per path. If given, serial_assimilate
+                and parallel_assimilate only assimilate paths that are new or whose files
+                have changed since their object was cached, load the cached objects for
+                all other paths and update the manifest as they go. Defaults to None,
+                i.e. no caching.
+            hash_patterns (Sequence[str]): Glob patterns of the file names whose SHA-256
+                hash is stored in the manifest. A path whose files only differ from the
+                manifest in the mtimes of such files (e.g. after a copy or touch) is
+                still considered unchanged if their hashes match. Defaults to
+                ("vasprun.xml*", "OUTCAR*").
+            scan_workers (int | None): Number of threads listing directories with
+                scan_tree, which is considerably faster than os.walk for large trees
+                on network file systems. scan_tree visits the directories in
+                breadth-first order with sorted names, which changes the order of
+                the assimilated data. Defaults to None, i.e. the tree is walked with
+                os.walk.
         """
         self._drone = drone
         self._num_drones = number_of_drones
+        self._manifest = manifest
+        self._hash_patterns = tuple(hash_patterns)
+        self._scan_workers = scan_workers
         self._data: list = []
 
         if rootpath:
@@ -57,39 +95,144 @@ class BorgQueen:
             else:
                 self.serial_assimilate(rootpath)
 
+    def _get_valid_paths(self, rootpath: PathLike) -> list[str]:
+        """Get the paths in rootpath that the drone can assimilate."""
+        valid_paths = []
+        if self._scan_workers is None:
+            tree: Iterable[tuple[str, list[str], list[str]]] = os.walk(rootpath)
+        else:
+            tree = scan_tree(rootpath, n_workers=self._scan_workers)
+        for parent, subdirs, files in tree:
+            valid_paths.extend(self._drone.get_valid_paths((parent, subdirs, files)))
+        return valid_paths
+
+    def _open_manifest(self) -> _Manifest | None:
+        """Open the manifest, if any."""
+        if self._manifest is None:
+            return None
+        # drone settings, e.g. the parameters of VaspToComputedEntryDrone, may be sets
+        drone = json.loads(json.dumps(self._drone.as_dict(), default=sorted))
+        return _Manifest(self._manifest, drone)
+
     def parallel_assimilate(self, rootpath: PathLike) -> None:
         """Assimilate the entire subdirectory structure in rootpath."""
         logger.info("Scanning for valid paths...")
-        valid_paths = []
-        for parent, subdirs, files in os.walk(rootpath):
-            valid_paths.extend(self._drone.get_valid_paths((parent, subdirs, files)))
-        manager = Manager()
-        data = manager.list()
-        status = manager.dict()
-        status["count"] = 0
-        status["total"] = len(valid_paths)
+        valid_paths = self._get_valid_paths(rootpath)
         logger.info(f"{len(valid_paths)} valid paths found.")
-        with Pool(self._num_drones) as pool:
-            pool.map(
-                order_assimilation,
-                ((path, self._drone, data, status) for path in valid_paths),
-            )
-            for string in data:
-                self._data.append(json.loads(string, cls=MontyDecoder))
+        with self._open_manifest() or nullcontext() as manifest:
+            new_paths = valid_paths
+            if manifest is not None:
+                checked = manifest.check(valid_paths, self._hash_patterns, self._num_drones)
+                new_paths = [path for path, cached in checked if not cached]
+
+            new_data: dict[str, str | None] = {}
+            total = len(new_paths)
+            with Pool(self._num_drones) as pool:
+                tasks = ((path, self._drone) for path in new_paths)
+                for count, (path, json_str, _elapsed, _pid) in enumerate(pool.imap(timed_assimilation, tasks), start=1):
+                    new_data[path] = json_str
+                    if manifest is not None:
+                        manifest.store(path, json_str)
+                    logger.info(f"{count}/{total} ({count / total:.2%}) done")
+
+            for path in valid_paths:
+                if str(path) in new_data:
+                    if json_str := new_data[str(path)]:
+                        self._data.append(json.loads(json_str, cls=MontyDecoder))
+                elif (cached_data := manifest.load(path)) is not None:
+                    self._data.append(cached_data)
+            if manifest is not None:
+                manifest.prune(rootpath, valid_paths)
 
     def serial_assimilate(self, root: PathLike) -> None:
         """Assimilate the entire subdirectory structure in rootpath serially."""
-        valid_paths = []
-        for parent, subdirs, files in os.walk(root):
-            valid_paths.extend(self._drone.get_valid_paths((parent, subdirs, files)))
-        data: list[str] = []
+        valid_paths = self._get_valid_paths(root)
         total = len(valid_paths)
-        for idx, path in enumerate(valid_paths, start=1):
-            new_data = self._drone.assimilate(path)
-            self._data.append(new_data)
-            logger.info(f"{idx}/{total} ({idx / total:.1%}) done")
-        for json_str in data:
-            self._data.append(json.loads(json_str, cls=MontyDecoder))
+        with self._open_manifest() or nullcontext() as manifest:
+            checked: Iterable[tuple[str, bool]] = ((path, False) for path in valid_paths)
+            if manifest is not None:
+                checked = manifest.check(valid_paths, self._hash_patterns, self._num_drones)
+            for idx, (path, cached) in enumerate(checked, start=1):
+                if cached:
+                    self._data.append(manifest.load(path))
+                    continue
+                new_data = self._drone.assimilate(path)
+                self._data.append(new_data)
+                if manifest is not None:
+                    manifest.store(path, json.dumps(new_data, cls=MontyEncoder))
+                logger.info(f"{idx}/{total} ({idx / total:.1%}) done")
+            if manifest is not None:
+                manifest.prune(root, valid_paths)
+
+    def stream_assimilate(
+        self,
+        rootpath: PathLike,
+        filename: PathLike,
+        checkpoint: PathLike | None = None,
+    ) -> int:
+        """Assimilate the entire subdirectory structure in rootpath, writing each
+        assimilated object to a JSONL file as soon as it is ready instead of keeping
+        all of them in memory. Uses number_of_drones processes.
+
+        Every completed path is recorded in a checkpoint file. If the assimilation is
+        interrupted, calling this method again with the same arguments skips the paths
+        that were already completed and appends the remaining objects to the same file.
+
+        Args:
+            rootpath (PathLike): The root directory to start assimilation.
+            filename (PathLike): JSONL file that assimilated objects are appended to,
+                one MontyEncoder-serialized object per line. It can be read with
+                pymatgen.entries.entry_io.iter_entries.
+            checkpoint (PathLike): File recording one completed path per line.
+                Defaults to f"{filename}.checkpoint".
+
+        Returns:
+            int: Number of paths assimilated by this call.
+        """
+        checkpoint = checkpoint or f"{filename}.checkpoint"
+        done: set[str] = set()
+        if os.path.isfile(checkpoint):
+            with open(checkpoint, encoding="utf-8") as file:
+                done = {line.rstrip("\n") for line in file if line.strip()}
+
+        logger.info("Scanning for valid paths...")
+        valid_paths = [path for path in self._get_valid_paths(rootpath) if str(path) not in done]
+        total = len(valid_paths)
+        logger.info(f"{total} valid paths to assimilate, {len(done)} already done.")
+
+        # number of paths and time spent by each drone process
+        drone_stats: dict[int, list] = defaultdict(lambda: [0, 0.0])
+        start = time.perf_counter()
+        count = 0
+        with ExitStack() as stack:
+            sink = stack.enter_context(zopen(filename, mode="at", encoding="utf-8"))
+            checkpoint_file = stack.enter_context(open(checkpoint, mode="a", encoding="utf-8"))
+            tasks = ((path, self._drone) for path in valid_paths)
+            results: Iterator[tuple[str, str | None, float, int]]
+            if self._num_drones > 1:
+                pool = stack.enter_context(Pool(self._num_drones))
+                results = pool.imap_unordered(timed_assimilation, tasks)
+            else:
+                results = map(timed_assimilation, tasks)
+
+            for count, (path, json_str, elapsed, pid) in enumerate(results, start=1):
+                if json_str is not None:
+                    sink.write(f"{json_str}\n")
+                    sink.flush()
+                # only mark the path as done once its result is written
+                checkpoint_file.write(f"{path}\n")
+                checkpoint_file.flush()
+
+                drone_stats[pid][0] += 1
+                drone_stats[pid][1] += elapsed
+                rate = count / (time.perf_counter() - start)
+                logger.info(
+                    f"{count}/{total} ({count / total:.1%}) done, {rate:.2f} dirs/s, {path} took {elapsed:.2f} s"
+                )
+
+        for pid, (n_paths, elapsed) in drone_stats.items():
+            logger.info(f"Drone {pid} assimilated {n_paths} paths in {elapsed:.2f} s ({elapsed / n_paths:.2f} s/path)")
+        return count
 
     def get_data(self) -> list:
         """Get an list of assimilated objects."""
@@ -112,6 +255,136 @@ class BorgQueen:
             self._data = json.load(file, cls=MontyDecoder)
 
 
+class _Manifest:
+    """SQLite store of the manifest of a BorgQueen. The fingerprint of the files of
+    every valid path and its assimilated object are stored in separate tables keyed
+    by the absolute path, so that checking a path only reads its fingerprint and
+    every update only writes the rows of one path.
+    """
+
+    # number of paths fingerprinted at once, and of updates between commits
+    batch_size = 1000
+
+    def __init__(self, filename: PathLike, drone: dict) -> None:
+        """
+        Args:
+            filename (PathLike): The SQLite database file, created if it does not exist.
+            drone (dict): JSON-compatible dict of the drone. Cached objects assimilated
+                by a different drone are dropped.
+        """
+        self._conn = sqlite3.connect(filename)
+        self._n_pending = 0
+        with self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS fingerprints (path TEXT PRIMARY KEY, files TEXT NOT NULL)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS data (path TEXT PRIMARY KEY, data TEXT)")
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'drone'").fetchone()
+            if row is None or json.loads(row[0]) != drone:
+                if row is not None:
+                    logger.info("Drone differs from the one in the manifest, ignoring cached data.")
+                self._conn.execute("DELETE FROM data")
+                self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('drone', ?)", (json.dumps(drone),))
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Commit the pending updates and close the database."""
+        self._conn.commit()
+        self._conn.close()
+
+    def _updated(self) -> None:
+        """Commit every batch_size updates, so an interrupted run keeps its progress."""
+        self._n_pending += 1
+        if self._n_pending >= self.batch_size:
+            self._conn.commit()
+            self._n_pending = 0
+
+    def check(
+        self, paths: Sequence[str], hash_patterns: tuple[str, ...], n_workers: int = 1
+    ) -> Iterator[tuple[str, bool]]:
+        """Fingerprint the files of paths in a thread pool and compare them with the
+        stored fingerprints. Changed fingerprints are stored right away, dropping the
+        cached object of their path.
+
+        Args:
+            paths (Sequence[str]): The valid paths.
+            hash_patterns (tuple[str, ...]): Glob patterns of the file names to hash.
+            n_workers (int): Number of threads fingerprinting paths. Defaults to 1.
+
+        Yields:
+            tuple[str, bool]: Every path and whether its object is cached, i.e. whether
+                it is unchanged since its object was stored.
+        """
+        n_cached = 0
+        with ThreadPoolExecutor(n_workers) as executor:
+            for start in range(0, len(paths), self.batch_size):
+                batch = paths[start : start + self.batch_size]
+                abs_paths = [os.path.abspath(path) for path in batch]
+                stored = []
+                for abs_path in abs_paths:
+                    row = self._conn.execute(
+                        "SELECT files, EXISTS (SELECT 1 FROM data WHERE data.path = fingerprints.path) "
+                        "FROM fingerprints WHERE path = ?",
+                        (abs_path,),
+                    ).fetchone()
+                    stored.append((json.loads(row[0]), bool(row[1])) if row else (None, False))
+                checked = executor.map(
+                    _check_files, abs_paths, [files for files, _ in stored], [hash_patterns] * len(batch)
+                )
+                for path, abs_path, (old_files, has_data), (files, unchanged) in zip(
+                    batch, abs_paths, stored, checked, strict=True
+                ):
+                    if files != old_files:
+                        self._conn.execute(
+                            "INSERT OR REPLACE INTO fingerprints VALUES (?, ?)", (abs_path, json.dumps(files))
+                        )
+                        self._updated()
+                    if not unchanged and has_data:
+                        self._conn.execute("DELETE FROM data WHERE path = ?", (abs_path,))
+                        self._updated()
+                    cached = unchanged and has_data
+                    n_cached += cached
+                    yield path, cached
+        logger.info(f"{n_cached}/{len(paths)} valid paths unchanged since the manifest was written.")
+
+    def store(self, path: str, json_str: str | None) -> None:
+        """Store the JSON string of the object assimilated from path, or None if nothing
+        was assimilated. The fingerprint of path must have been stored by check.
+        """
+        self._conn.execute("INSERT OR REPLACE INTO data VALUES (?, ?)", (os.path.abspath(path), json_str))
+        self._updated()
+
+    def load(self, path: str) -> Any:
+        """Load the cached object of path, None if nothing was assimilated from it."""
+        row = self._conn.execute("SELECT data FROM data WHERE path = ?", (os.path.abspath(path),)).fetchone()
+        return None if row is None or row[0] is None else json.loads(row[0], cls=MontyDecoder)
+
+    def prune(self, rootpath: PathLike, valid_paths: Sequence[str]) -> None:
+        """Drop the records of the paths in rootpath that are no longer valid, while
+        keeping those of paths outside rootpath.
+        """
+        root = os.path.abspath(rootpath)
+        prefix = os.path.join(root, "")
+        self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS valid (path TEXT PRIMARY KEY)")
+        self._conn.execute("DELETE FROM valid")
+        self._conn.executemany("INSERT OR IGNORE INTO valid VALUES (?)", ((os.path.abspath(p),) for p in valid_paths))
+        for table in ("fingerprints", "data"):
+            self._conn.execute(
+                f"DELETE FROM {table} WHERE (path = ? OR substr(path, 1, ?) = ?) "  # noqa: S608
+                "AND path NOT IN (SELECT path FROM valid)",
+                (root, len(prefix), prefix),
+            )
+        self._conn.commit()
+
+
+@deprecated(
+    message="BorgQueen no longer uses order_assimilation, which will be removed. Use timed_assimilation instead.",
+    category=DeprecationWarning,
+)
 def order_assimilation(args: tuple) -> None:
     """Internal helper method for BorgQueen to process assimilation."""
     path, drone, data, status = args
@@ -121,3 +394,114 @@ def order_assimilation(args: tuple) -> None:
     count = status["count"]
     total = status["total"]
     logger.info(f"{count}/{total} ({count / total:.2%}) done")
+
+
+def scan_tree(rootpath: PathLike, n_workers: int = 1) -> Iterator[tuple[str, list[str], list[str]]]:
+    """Walk a directory tree like os.walk, but list all directories of the same depth
+    concurrently with os.scandir in a thread pool. This is considerably faster than
+    os.walk for large trees on network file systems, where listing a directory is
+    dominated by latency. Symbolic links to directories are listed but not followed.
+
+    Args:
+        rootpath (PathLike): The root directory of the tree.
+        n_workers (int): Number of threads listing directories. Defaults to 1.
+
+    Yields:
+        tuple[str, list[str], list[str]]: The (parent, subdirs, files) tuple of every
+            directory in the tree, in breadth-first order with sorted names.
+    """
+    level = [os.fspath(rootpath)]
+    with ThreadPoolExecutor(n_workers) as executor:
+        while level:
+            next_level = []
+            for listing in executor.map(_scan_dir, level):
+                if listing is None:
+                    continue
+                parent, subdirs, files, real_subdirs = listing
+                yield parent, subdirs, files
+                next_level.extend(os.path.join(parent, subdir) for subdir in real_subdirs)
+            level = next_level
+
+
+def _scan_dir(path: str) -> tuple[str, list[str], list[str], list[str]] | None:
+    """List a directory for scan_tree. Returns None if it cannot be listed, which
+    os.walk silently skips as well.
+    """
+    subdirs, files, real_subdirs = [], [], []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    subdirs.append(entry.name)
+                    if not entry.is_symlink():
+                        real_subdirs.append(entry.name)
+                else:
+                    files.append(entry.name)
+    except OSError:
+        return None
+    return path, sorted(subdirs), sorted(files), sorted(real_subdirs)
+
+
+def _check_files(
+    path: str, cached_files: dict[str, list] | None, hash_patterns: tuple[str, ...]
+) -> tuple[dict[str, list], bool]:
+    """Fingerprint the files in a valid path for the manifest of BorgQueen.
+
+    Args:
+        path (str): A valid path, usually a directory that is fingerprinted recursively.
+        cached_files (dict[str, list] | None): The fingerprint in the manifest, if any.
+        hash_patterns (tuple[str, ...]): Glob patterns of the file names to hash.
+
+    Returns:
+        tuple[dict[str, list], bool]: The [size, mtime_ns, sha256] of every file keyed
+            by its path relative to path, with sha256 None for files that are not hashed,
+            and whether the path is unchanged compared to cached_files.
+    """
+    if os.path.isdir(path):
+        stats = {
+            os.path.relpath(os.path.join(parent, name), path): os.stat(os.path.join(parent, name))
+            for parent, _subdirs, names in os.walk(path)
+            for name in names
+        }
+    else:
+        stats = {os.path.basename(path): os.stat(path)}
+
+    unchanged = cached_files is not None and cached_files.keys() == stats.keys()
+    files = {}
+    for rel_path, stat in stats.items():
+        size, mtime, sha256 = stat.st_size, stat.st_mtime_ns, None
+        cached = (cached_files or {}).get(rel_path)
+        if cached is not None and cached[:2] == [size, mtime]:
+            # unmodified file, reuse the cached hash
+            sha256 = cached[2]
+        elif any(fnmatch(os.path.basename(rel_path), pattern) for pattern in hash_patterns):
+            file_path = os.path.join(path, rel_path) if os.path.isdir(path) else path
+            digest = hashlib.sha256()
+            with open(file_path, mode="rb") as file:
+                while chunk := file.read(1 << 20):
+                    digest.update(chunk)
+            sha256 = digest.hexdigest()
+            # a touched or copied file is unchanged if its content is
+            unchanged = unchanged and cached is not None and cached[0] == size and cached[2] == sha256
+        else:
+            unchanged = False
+        files[rel_path] = [size, mtime, sha256]
+    return files, unchanged
+
+
+def timed_assimilation(args: tuple) -> tuple[str, str | None, float, int]:
+    """Internal helper method for BorgQueen.stream_assimilate to process assimilation.
+
+    Returns:
+        tuple[str, str | None, float, int]: The path, the JSON string of the assimilated
+            object (None if nothing was assimilated), the time spent and the process id.
+    """
+    path, drone = args
+    start = time.perf_counter()
+    new_data = drone.assimilate(path)
+    json_str = json.dumps(new_data, cls=MontyEncoder) if new_data else None
+    return str(path), json_str, time.perf_counter() - start, os.getpid()
@@ -9,6 +9,7 @@ import copy
 import os
 import warnings
 from collections import defaultdict
+from functools import cache, lru_cache
 from typing import TYPE_CHECKING, TypeAlias, cast
 
 import numpy as np
@@ -76,6 +77,9 @@ if (
 ):
     raise RuntimeError("MP2020Compatibility.yaml expected to have the same Hubbard U corrections for O and F")
 
+# anions that receive an MP2020 anion correction if present, in the order they are applied
+_MP2020_ANIONS = ("Br", "I", "Se", "Si", "Sb", "Te", "H", "N", "F", "Cl")
+
 AnyComputedEntry: TypeAlias = ComputedEntry | ComputedStructureEntry
 
 
@@ -927,6 +931,29 @@ class MaterialsProjectCompatibility(CorrectionsList):
         )
 
 
+@cache
+def _get_mp_potcar_correction(check_potcar: bool, check_hash: bool) -> PotcarCorrection:
+    """Get the PotcarCorrection used by MaterialsProject2020Compatibility to check
+    the POTCAR settings of each entry.
+    """
+    return PotcarCorrection(MPRelaxSet, check_hash=check_hash, check_potcar=check_potcar)
+
+
+@lru_cache(maxsize=65536)
+def _guess_oxi_states(comp_items: tuple[tuple[Any, float], ...]) -> dict[str, float]:
+    """Guess the oxidation states of a composition given as a tuple of (species, amount)
+    pairs. The result is cached so that entries with identical compositions are only
+    guessed once. Do not mutate the returned dict.
+    """
+    # for performance reasons, fail if the composition is too large
+    try:
+        oxi_states = Composition(dict(comp_items)).oxi_state_guesses(max_sites=-20)
+    except ValueError:
+        oxi_states = ({},)
+
+    return (oxi_states or ({},))[0]
+
+
 # Note from Ryan Kingsbury (2022-10-14): MaterialsProject2020Compatibility inherits from Compatibility
 # instead of CorrectionsList which came before it because CorrectionsList had technical limitations.
 # When we did the new scheme (MP2020) we decided to refactor the base Compatibility class to not
@@ -1053,6 +1080,9 @@ class MaterialsProject2020Compatibility(Compatibility):
             self.u_corrections = {}
             self.u_errors = {}
 
+        # compiled correction tables, see _get_correction_table
+        self._correction_tables: dict[tuple, list[tuple[Any, float, float, str]] | str] = {}
+
     def get_adjustments(self, entry: AnyComputedEntry) -> list[CompositionEnergyAdjustment]:
         """Get the energy adjustments for a ComputedEntry or ComputedStructureEntry.
 
@@ -1078,24 +1108,15 @@ class MaterialsProject2020Compatibility(Compatibility):
         # check the POTCAR symbols
         # this should return ufloat(0, 0) or raise a CompatibilityError or ValueError
         if entry.parameters.get("software", "vasp") == "vasp":
-            pc = PotcarCorrection(
-                MPRelaxSet,
-                check_hash=self.check_potcar_hash,
-                check_potcar=self.check_potcar,
-            )
-            pc.get_correction(entry)
-
-        # apply energy adjustments
-        adjustments: list[CompositionEnergyAdjustment] = []
+            _get_mp_potcar_correction(self.check_potcar, self.check_potcar_hash).get_correction(entry)
 
         comp = entry.composition
-        rform = comp.reduced_formula
-        # sorted list of elements, ordered by electronegativity
-        sorted_elements = sorted((el for el in comp.elements if comp[el] > 0), key=lambda el: el.X)
 
         # Skip single elements
         if len(comp) == 1:
-            return adjustments
+            return []
+
+        sf_type = ox_type = None
 
         # Check for sulfide corrections
         if Element("S") in comp:
@@ -1109,17 +1130,6 @@ class MaterialsProject2020Compatibility(Compatibility):
             if sf_type == "polysulfide":
                 sf_type = "sulfide"
 
-            if sf_type == "sulfide":
-                adjustments.append(
-                    CompositionEnergyAdjustment(
-                        self.comp_correction["S"],
-                        comp["S"],
-                        uncertainty_per_atom=self.comp_errors["S"],
-                        name="MP2020 anion correction (S)",
-                        cls=self.as_dict(),
-                    )
-                )
-
         # Check for oxide, peroxide, superoxide, and ozonide corrections.
         if Element("O") in comp:
             if self.correct_peroxide:
@@ -1139,6 +1149,7 @@ class MaterialsProject2020Compatibility(Compatibility):
                     common_superoxides = "LiO2 NaO2 KO2 RbO2 CsO2".split()
                     ozonides = "LiO3 NaO3 KO3 NaO5".split()
 
+                    rform = comp.reduced_formula
                     if rform in common_peroxides:
                         ox_type = "peroxide"
                     elif rform in common_superoxides:
@@ -1153,30 +1164,15 @@ class MaterialsProject2020Compatibility(Compatibility):
             if ox_type == "hydroxide":
                 ox_type = "oxide"
 
-            adjustments.append(
-                CompositionEnergyAdjustment(
-                    self.comp_correction[ox_type],
-                    comp["O"],
-                    uncertainty_per_atom=self.comp_errors[ox_type],
-                    name=f"MP2020 anion correction ({ox_type})",
-                    cls=self.as_dict(),
-                )
-            )
-
         # Check for anion corrections
         # only apply anion corrections if the element is an anion
         # first check for a pre-populated oxidation states key
         # the key is expected to comprise a dict corresponding to the first element output by
         # Composition.oxi_state_guesses(), e.g. {'Al': 3.0, 'S': 2.0, 'O': -2.0} for 'Al2SO4'
         if "oxidation_states" not in entry.data:
-            # try to guess the oxidation states from composition
-            # for performance reasons, fail if the composition is too large
-            try:
-                oxi_states = entry.composition.oxi_state_guesses(max_sites=-20)
-            except ValueError:
-                oxi_states = ({},)
-
-            entry.data["oxidation_states"] = (oxi_states or ({},))[0]
+            # try to guess the oxidation states from composition, reusing the guess for
+            # entries with exactly the same composition
+            entry.data["oxidation_states"] = dict(_guess_oxi_states(tuple(comp.items())))
 
         if entry.data["oxidation_states"] == {}:
             warnings.warn(
@@ -1186,15 +1182,103 @@ class MaterialsProject2020Compatibility(Compatibility):
                 stacklevel=2,
             )
 
-        for anion in ("Br", "I", "Se", "Si", "Sb", "Te", "H", "N", "F", "Cl"):
-            if Element(anion) in comp and anion in self.comp_correction:
+        # GGA / GGA+U mixing scheme corrections are keyed on the U values of the elements present
+        calc_u = entry.parameters.get("hubbards")
+        calc_u = defaultdict(int) if calc_u is None else calc_u
+        elements = tuple(comp.elements)
+        oxidation_states = entry.data["oxidation_states"]
+
+        correction_table = self._get_correction_table(
+            elements=elements,
+            positive=tuple(comp[el] > 0 for el in elements),
+            sf_type=sf_type,
+            ox_type=ox_type,
+            anion_oxi_states=tuple(
+                oxidation_states.get(anion, 0) if Element(anion) in comp else None for anion in _MP2020_ANIONS
+            ),
+            hubbards=tuple(float(calc_u.get(el.symbol, 0)) for el in elements),
+            strict_anions=self.strict_anions,
+        )
+        if isinstance(correction_table, str):
+            raise CompatibilityError(f"{correction_table} for {entry.as_dict()}")
+
+        cls_dict = self.as_dict()
+        return [
+            CompositionEnergyAdjustment(
+                adj_per_atom,
+                comp[species],
+                uncertainty_per_atom=uncertainty_per_atom,
+                name=name,
+                cls=cls_dict,
+            )
+            for species, adj_per_atom, uncertainty_per_atom, name in correction_table
+        ]
+
+    def _get_correction_table(self, **kwargs) -> list[tuple[Any, float, float, str]] | str:
+        """Get the correction table for the keyword arguments of _compile_correction_table,
+        which is compiled once per instance and set of arguments.
+        """
+        key = tuple(sorted(kwargs.items()))
+        if (table := self._correction_tables.get(key)) is None:
+            table = self._correction_tables[key] = self._compile_correction_table(**kwargs)
+        return table
+
+    def _compile_correction_table(
+        self,
+        *,
+        elements: tuple[Any, ...],
+        positive: tuple[bool, ...],
+        sf_type: str | None,
+        ox_type: str | None,
+        anion_oxi_states: tuple[float | None, ...],
+        hubbards: tuple[float, ...],
+        strict_anions: str,
+    ) -> list[tuple[Any, float, float, str]] | str:
+        """Compile the composition corrections that apply to all entries sharing the same
+        elements, anion types, anion oxidation states and U values.
+
+        Args:
+            elements (tuple): Elements (or Species) of the composition, in composition order.
+            positive (tuple[bool]): Whether each element has a positive amount.
+            sf_type (str | None): Sulfide type, None if there is no S.
+            ox_type (str | None): Oxide type, None if there is no O.
+            anion_oxi_states (tuple): Oxidation state of each anion in _MP2020_ANIONS,
+                None if the anion is absent.
+            hubbards (tuple[float]): U value used for each element.
+            strict_anions (str): The strict_anions setting.
+
+        Returns:
+            list[tuple]: (species, correction per atom, uncertainty per atom, name) for each
+                correction in the order they are applied, or an error message if the U values
+                are invalid.
+        """
+        table: list[tuple[Any, float, float, str]] = []
+
+        # sorted list of elements, ordered by electronegativity
+        sorted_elements = sorted((el for el, pos in zip(elements, positive, strict=True) if pos), key=lambda el: el.X)
+        most_electroneg = sorted_elements[-1].symbol
+
+        if sf_type == "sulfide":
+            table.append(("S", self.comp_correction["S"], self.comp_errors["S"], "MP2020 anion correction (S)"))
+
+        if ox_type is not None:
+            table.append(
+                (
+                    "O",
+                    self.comp_correction[ox_type],
+                    self.comp_errors[ox_type],
+                    f"MP2020 anion correction ({ox_type})",
+                )
+            )
+
+        for anion, oxidation_state in zip(_MP2020_ANIONS, anion_oxi_states, strict=True):
+            if oxidation_state is not None and anion in self.comp_correction:
                 apply_correction = False
-                oxidation_state = entry.data["oxidation_states"].get(anion, 0)
                 # if the oxidation_states key is not populated, only apply the correction if the anion
                 # is the most electronegative element
                 if oxidation_state < 0:
                     apply_correction = True
-                    if self.strict_anions == "require_bound" and oxidation_state > -1:
+                    if strict_anions == "require_bound" and oxidation_state > -1:
                         # This is not an anion. Noting that the rare case of a fractional
                         # oxidation state in range [-1, 0] might be considered an anionic.
                         # This could include suboxides or metal-rich pnictides, chalcogenides etc.
@@ -1203,12 +1287,10 @@ class MaterialsProject2020Compatibility(Compatibility):
                         # whether the corrections are appropriate in this instance, and likely
                         # may.
                         apply_correction = False
-                else:
-                    most_electroneg = sorted_elements[-1].symbol
-                    if anion == most_electroneg:
-                        apply_correction = True
+                elif anion == most_electroneg:
+                    apply_correction = True
 
-                if self.strict_anions == "require_exact":
+                if strict_anions == "require_exact":
                     apply_correction = False
                     if (oxi_range := MP2020_ANION_OXIDATION_STATE_RANGES.get(anion)) and (
                         oxi_range[0] <= oxidation_state <= oxi_range[1]
@@ -1216,45 +1298,32 @@ class MaterialsProject2020Compatibility(Compatibility):
                         apply_correction = True
 
                 if apply_correction:
-                    adjustments.append(
-                        CompositionEnergyAdjustment(
+                    table.append(
+                        (
+                            anion,
                             self.comp_correction[anion],
-                            comp[anion],
-                            uncertainty_per_atom=self.comp_errors[anion],
-                            name=f"MP2020 anion correction ({anion})",
-                            cls=self.as_dict(),
+                            self.comp_errors[anion],
+                            f"MP2020 anion correction ({anion})",
                         )
                     )
 
         # GGA / GGA+U mixing scheme corrections
-        calc_u = entry.parameters.get("hubbards")
-        calc_u = defaultdict(int) if calc_u is None else calc_u
-        most_electroneg = sorted_elements[-1].symbol
         u_corrections = self.u_corrections.get(most_electroneg, defaultdict(float))
         u_settings = self.u_settings.get(most_electroneg, defaultdict(float))
         u_errors = self.u_errors.get(most_electroneg, defaultdict(float))
 
-        for el in comp.elements:
+        for el, actual_u in zip(elements, hubbards, strict=True):
             symbol = el.symbol
             # Check for bad U values
             expected_u = float(u_settings.get(symbol, 0))
-            actual_u = float(calc_u.get(symbol, 0))
             if actual_u != expected_u:
-                raise CompatibilityError(
-                    f"Invalid U value of {actual_u:.3} on {symbol}, expected {expected_u:.3} for {entry.as_dict()}"
-                )
+                return f"Invalid U value of {actual_u:.3} on {symbol}, expected {expected_u:.3}"
             if symbol in u_corrections:
-                adjustments.append(
-                    CompositionEnergyAdjustment(
-                        u_corrections[symbol],
-                        comp[el],
-                        uncertainty_per_atom=u_errors[symbol],
-                        name=f"MP2020 GGA/GGA+U mixing correction ({symbol})",
-                        cls=self.as_dict(),
-                    )
+                table.append(
+                    (el, u_corrections[symbol], u_errors[symbol], f"MP2020 GGA/GGA+U mixing correction ({symbol})")
                 )
 
-        return adjustments
+        return table
 
 
 class MITCompatibility(CorrectionsList):
@@ -0,0 +1,140 @@
+"""This module implements streaming I/O of entries in line-delimited JSON (JSONL) files,
+with one MSONable entry dict per line. Compressed files (.gz, .bz2, .xz, .lzma) are
+supported transparently. Unlike loadfn on a JSON list, entries are read and decoded
+incrementally, so large entry collections can be processed with bounded memory.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+from monty.io import zopen
+from monty.json import MontyDecoder, MontyEncoder
+
+from pymatgen.core import Composition
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import Any
+
+    from pymatgen.core import Element
+    from pymatgen.entries import Entry
+    from pymatgen.util.typing import PathLike
+
+
+def write_entries(entries: Iterable[Entry | dict], filename: PathLike, append: bool = False) -> int:
+    """Write entries to a JSONL file, one entry per line. Entries are serialized one at a
+    time, so a generator of entries is never materialized in memory.
+
+    Args:
+        entries (Iterable[Entry | dict]): Entries or their MSONable dicts.
+        filename (PathLike): Output file. The compression is inferred from the extension,
+            e.g. "entries.jsonl.gz".
+        append (bool): Whether to append to an existing file instead of overwriting it.
+            Defaults to False.
+
+    Returns:
+        int: Number of entries written.
+    """
+    n_entries = 0
+    with zopen(filename, mode="at" if append else "wt", encoding="utf-8") as file:
+        for entry in entries:
+            file.write(json.dumps(entry, cls=MontyEncoder) + "\n")
+            n_entries += 1
+    return n_entries
+
+
+def iter_entries(
+    filename: PathLike,
+    *,
+    chemsys: str | Iterable[str | Element] | None = None,
+    formula: str | Composition | None = None,
+    as_dict: bool = False,
+    n_workers: int = 1,
+    chunk_size: int = 1000,
+) -> Iterator[Entry | dict]:
+    """Iterate over the entries in a JSONL file, in file order.
+
+    Filtering is done on the "composition" field of each entry dict, before the
+    entry object is built, so entries that are filtered out are never fully decoded.
+
+    Args:
+        filename (PathLike): JSONL file written by write_entries, optionally compressed.
+        chemsys (str | Iterable[str | Element] | None): Only yield entries whose elements
+            are all in this chemical system, e.g. "Li-Fe-O" or ["Li", "Fe", "O"]. This
+            includes entries of its subsystems, as in EntrySet.get_subset_in_chemsys.
+        formula (str | Composition | None): Only yield entries with this reduced formula.
+        as_dict (bool): Whether to yield the entry dicts instead of decoding them into
+            entry objects. Defaults to False.
+        n_workers (int): Number of processes used to decode chunks of lines in parallel.
+            Defaults to 1, which decodes in the calling process.
+        chunk_size (int): Number of lines per chunk when decoding in parallel. At most
+            2 * n_workers chunks are held in memory at once. Defaults to 1000.
+
+    Yields:
+        Entry | dict: Entries (or entry dicts) that pass the filters.
+    """
+    if chemsys is not None:
+        if isinstance(chemsys, str):
+            chemsys = chemsys.split("-")
+        chemsys = frozenset(str(el) for el in chemsys)
+    if formula is not None:
+        formula = Composition(formula).reduced_formula
+
+    with zopen(filename, mode="rt", encoding="utf-8") as file:
+        if n_workers == 1:
+            for line in file:
+                if (decoded := _decode_line(line, chemsys, formula, as_dict)) is not None:
+                    yield decoded
+            return
+
+        chunks = iter(lambda: list(itertools.islice(file, chunk_size)), [])
+        with ProcessPoolExecutor(n_workers) as executor:
+            pending: deque = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(_decode_lines, chunk, chemsys, formula, as_dict))
+                if len(pending) >= 2 * n_workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+
+def load_entries(filename: PathLike, **kwargs) -> list[Entry | dict]:
+    """Load all entries from a JSONL file.
+
+    Args:
+        filename (PathLike): JSONL file written by write_entries, optionally compressed.
+        **kwargs: Passed to iter_entries, e.g. chemsys, formula or n_workers.
+
+    Returns:
+        list[Entry | dict]: Entries (or entry dicts) that pass the filters.
+    """
+    return list(iter_entries(filename, **kwargs))
+
+
+def _decode_lines(
+    lines: list[str], chemsys: frozenset[str] | None, formula: str | None, as_dict: bool
+) -> list[Entry | dict]:
+    """Decode a chunk of lines, dropping blank lines and entries that are filtered out."""
+    decoded = (_decode_line(line, chemsys, formula, as_dict) for line in lines)
+    return [dct for dct in decoded if dct is not None]
+
+
+def _decode_line(line: str, chemsys: frozenset[str] | None, formula: str | None, as_dict: bool) -> Any:
+    """Decode one line into an entry (or entry dict), or None if it is blank or filtered out."""
+    if not line.strip():
+        return None
+    dct = json.loads(line)
+
+    if chemsys is not None or formula is not None:
+        comp = Composition(dct["composition"])
+        if chemsys is not None and not comp.chemical_system_set <= chemsys:
+            return None
+        if formula is not None and comp.reduced_formula != formula:
+            return None
+
+    return dct if as_dict else MontyDecoder().process_decoded(dct)
@@ -7,7 +7,6 @@ from __future__ import annotations
 import collections
 import csv
 import itertools
-import json
 import logging
 import multiprocessing as mp
 import re
@@ -15,18 +14,19 @@ from collections import defaultdict
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
-from monty.json import MontyDecoder, MontyEncoder, MSONable
+from monty.json import MSONable
 
 from pymatgen.analysis.phase_diagram import PDEntry
 from pymatgen.analysis.structure_matcher import SpeciesComparator, StructureMatcher
 from pymatgen.core import Composition, Element
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
-    from typing import Literal
+    from collections.abc import Iterable, KeysView
+    from typing import Any, Literal
 
     from typing_extensions import Self
 
+    from pymatgen.core import Structure
     from pymatgen.entries import Entry
     from pymatgen.entries.computed_entries import ComputedEntry, ComputedStructureEntry
     from pymatgen.util.typing import SpeciesLike
@@ -42,47 +42,49 @@ def _get_host(structure, species_to_remove):
     return structure
 
 
-def _perform_grouping(args):
-    (
-        entries_json,
-        hosts_json,
-        ltol,
-        stol,
-        angle_tol,
-        primitive_cell,
-        scale,
-        comparator,
-        groups,
-    ) = args
-
-    entries = json.loads(entries_json, cls=MontyDecoder)
-    hosts = json.loads(hosts_json, cls=MontyDecoder)
-    unmatched = list(zip(entries, hosts, strict=True))
-    while len(unmatched) > 0:
-        ref_host = unmatched[0][1]
-        logger.info(f"Reference tid = {unmatched[0][0].entry_id}, formula = {ref_host.formula}")
-        ref_formula = ref_host.reduced_formula
-        logger.info(f"Reference host = {ref_formula}")
-        matches = [unmatched[0]]
-        for idx in range(1, len(unmatched)):
-            test_host = unmatched[idx][1]
-            logger.info(f"Testing tid = {unmatched[idx][0].entry_id}, formula = {test_host.formula}")
-            test_formula = test_host.reduced_formula
-            logger.info(f"Test host = {test_formula}")
-            matcher = StructureMatcher(
-                ltol=ltol,
-                stol=stol,
-                angle_tol=angle_tol,
-                primitive_cell=primitive_cell,
-                scale=scale,
-                comparator=comparator,
-            )
-            if matcher.fit(ref_host, test_host):
-                logger.info("Fit found")
-                matches.append(unmatched[idx])
-        groups.append(json.dumps([m[0] for m in matches], cls=MontyEncoder))
-        unmatched = list(filter(lambda x: x not in matches, unmatched))
+# Shared state of group_entries_by_structure worker processes. The reduced structures and
+# the matcher are sent once per worker by the pool initializer, so that each task only
+# carries a list of indices.
+_GROUPING_DATA: dict[str, Any] = {}
+
+
+def _init_grouping_worker(structures: list[Structure], matcher: StructureMatcher) -> None:
+    _GROUPING_DATA["structures"] = structures
+    _GROUPING_DATA["matcher"] = matcher
+
+
+def _group_bucket(indices: list[int]) -> list[list[int]]:
+    return _perform_grouping(indices, _GROUPING_DATA["structures"], _GROUPING_DATA["matcher"])
+
+
+def _perform_grouping(indices: list[int], structures: list[Structure], matcher: StructureMatcher) -> list[list[int]]:
+    """Greedily group structures: the first unmatched structure is the reference, and
+    all remaining structures that fit it form its group.
+
+    Args:
+        indices (list[int]): Indices of the structures to group, in input order.
+        structures (list[Structure]): Reduced (Niggli and, if requested, primitive) structures.
+        matcher (StructureMatcher): Matcher used to fit the structures.
+
+    Returns:
+        list[list[int]]: Groups of indices, each starting with its reference index.
+    """
+    groups = []
+    unmatched = list(indices)
+    while unmatched:
+        ref_idx, *others = unmatched
+        ref_host = structures[ref_idx]
+        logger.info(f"Reference host = {ref_host.reduced_formula}")
+        matches = [ref_idx]
+        unmatched = []
+        for idx in others:
+            if matcher.fit(ref_host, structures[idx], skip_structure_reduction=True):
+                matches.append(idx)
+            else:
+                unmatched.append(idx)
+        groups.append(matches)
         logger.info(f"{len(unmatched)} unmatched remaining")
+    return groups
 
 
 def group_entries_by_structure(
@@ -99,6 +101,10 @@ def group_entries_by_structure(
     """Given a sequence of ComputedStructureEntries, use structure fitter to group
     them by structural similarity.
 
+    Entries are first bucketed by the comparator hash of their composition and the
+    number of sites in their reduced cell, since structures that differ in either can
+    never be fitted. StructureMatcher.fit is then only run within buckets.
+
     Args:
         entries: Sequence of ComputedStructureEntries.
         species_to_remove: Sometimes you want to compare a host framework
@@ -125,53 +131,39 @@ def group_entries_by_structure(
         comparator = SpeciesComparator()
     start = datetime.now(tz=timezone.utc)
     logger.info(f"Started at {start}")
-    entries_host = [(entry, _get_host(entry.structure, species_to_remove)) for entry in entries]
-    if ncpus:
-        symm_entries = defaultdict(list)
-        for entry, host in entries_host:
-            symm_entries[comparator.get_structure_hash(host)].append((entry, host))
-
+    entries = list(entries)
+    matcher = StructureMatcher(
+        ltol=ltol,
+        stol=stol,
+        angle_tol=angle_tol,
+        primitive_cell=primitive_cell,
+        scale=scale,
+        comparator=comparator,
+    )
+    # reduce each structure once instead of once per fit
+    structures = [
+        StructureMatcher._get_reduced_structure(_get_host(entry.structure, species_to_remove), primitive_cell)
+        for entry in entries
+    ]
+
+    buckets: dict[tuple[Any, int], list[int]] = defaultdict(list)
+    for idx, struct in enumerate(structures):
+        buckets[comparator.get_hash(struct.composition), len(struct)].append(idx)
+
+    index_groups = [indices for indices in buckets.values() if len(indices) == 1]
+    # largest number of pairs first to balance the work across processes
+    to_fit = sorted((indices for indices in buckets.values() if len(indices) > 1), key=len, reverse=True)
+    if ncpus and to_fit:
         logger.info(f"Using {ncpus} cpus")
-        manager = mp.Manager()
-        groups = manager.list()
-        with mp.Pool(ncpus) as pool:
-            # Parallel processing only supports Python primitives and not objects.
-            pool.map(
-                _perform_grouping,
-                [
-                    (
-                        json.dumps([e[0] for e in eh], cls=MontyEncoder),
-                        json.dumps([e[1] for e in eh], cls=MontyEncoder),
-                        ltol,
-                        stol,
-                        angle_tol,
-                        primitive_cell,
-                        scale,
-                        comparator,
-                        groups,
-                    )
-                    for eh in symm_entries.values()
-                ],
-            )
+        with mp.Pool(ncpus, initializer=_init_grouping_worker, initargs=(structures, matcher)) as pool:
+            for groups in pool.imap_unordered(_group_bucket, to_fit):
+                index_groups.extend(groups)
     else:
-        groups = []
-        hosts = [host for entry, host in entries_host]
-        _perform_grouping(
-            (
-                json.dumps(entries, cls=MontyEncoder),
-                json.dumps(hosts, cls=MontyEncoder),
-                ltol,
-                stol,
-                angle_tol,
-                primitive_cell,
-                scale,
-                comparator,
-                groups,
-            )
-        )
-    entry_groups = []
-    for g in groups:
-        entry_groups.append(json.loads(g, cls=MontyDecoder))
+        for indices in to_fit:
+            index_groups.extend(_perform_grouping(indices, structures, matcher))
+
+    # order groups by their reference entry, as if all entries had been grouped in one pass
+    entry_groups = [[entries[idx] for idx in group] for group in sorted(index_groups, key=lambda group: group[0])]
     logger.info(f"Finished at {datetime.now(tz=timezone.utc)}")
     logger.info(f"Took {datetime.now(tz=timezone.utc) - start}")
     return entry_groups
@@ -212,16 +204,31 @@ class EntrySet(collections.abc.MutableSet, MSONable):
         Args:
             entries: All the entries.
         """
-        self.entries = set(entries)
+        self.entries = entries
+
+    @property
+    def entries(self) -> KeysView:
+        """A read-only view of the entries. Use add(), discard() and remove() to modify
+        the EntrySet, so that its chemical system index and ground states stay up to date.
+        """
+        return self._entries.keys()
+
+    @entries.setter
+    def entries(self, entries: Iterable[PDEntry | ComputedEntry | ComputedStructureEntry]) -> None:
+        # entries are the keys of a dict, which gives a read-only view of them
+        self._entries: dict[PDEntry | ComputedEntry | ComputedStructureEntry, None] = dict.fromkeys(entries)
+        self._chemsys_index: dict[tuple[str, ...], set] | None = None
+        self._composition_groups: dict[str, set] | None = None
+        self._ground_states: dict[str, PDEntry | ComputedEntry | ComputedStructureEntry] | None = None
 
     def __contains__(self, item):
-        return item in self.entries
+        return item in self._entries
 
     def __iter__(self):
-        return iter(self.entries)
+        return iter(self._entries)
 
     def __len__(self):
-        return len(self.entries)
+        return len(self._entries)
 
     def add(self, element):
         """Add an entry.
@@ -229,7 +236,17 @@ class EntrySet(collections.abc.MutableSet, MSONable):
         Args:
             element: Entry
         """
-        self.entries.add(element)
+        if element in self._entries:
+            return
+        self._entries[element] = None
+        if self._chemsys_index is not None:
+            self._chemsys_index[self._get_chemsys_key(element)].add(element)
+        if self._composition_groups is not None:
+            self._composition_groups[element.reduced_formula].add(element)
+        if self._ground_states is not None:
+            ground_state = self._ground_states.get(element.reduced_formula)
+            if ground_state is None or element.energy_per_atom < ground_state.energy_per_atom:
+                self._ground_states[element.reduced_formula] = element
 
     def discard(self, element):
         """Discard an entry.
@@ -237,7 +254,62 @@ class EntrySet(collections.abc.MutableSet, MSONable):
         Args:
             element: Entry
         """
-        self.entries.discard(element)
+        if element not in self._entries:
+            return
+        del self._entries[element]
+        if self._chemsys_index is not None:
+            key = self._get_chemsys_key(element)
+            self._chemsys_index[key].discard(element)
+            if not self._chemsys_index[key]:
+                del self._chemsys_index[key]
+        if self._composition_groups is not None:
+            formula = element.reduced_formula
+            self._composition_groups[formula].discard(element)
+            if not self._composition_groups[formula]:
+                del self._composition_groups[formula]
+        if self._ground_states is not None and self._ground_states.get(element.reduced_formula) == element:
+            # only this composition has to be looked at again
+            del self._ground_states[element.reduced_formula]
+            group = self._get_composition_groups().get(element.reduced_formula)
+            if group:
+                self._ground_states[element.reduced_formula] = min(group, key=lambda e: e.energy_per_atom)
+
+    @staticmethod
+    def _get_chemsys_key(entry) -> tuple[str, ...]:
+        """Sorted tuple of the element symbols of an entry."""
+        return tuple(sorted({sp.symbol for sp in entry.composition}))
+
+    def _get_chemsys_index(self) -> dict[tuple[str, ...], set]:
+        """Mapping of sorted element symbol tuples to the entries with exactly those
+        elements. The index is built on first use and kept up to date by add() and
+        discard().
+        """
+        if self._chemsys_index is None:
+            self._chemsys_index = defaultdict(set)
+            for entry in self._entries:
+                self._chemsys_index[self._get_chemsys_key(entry)].add(entry)
+        return self._chemsys_index
+
+    def _get_composition_groups(self) -> dict[str, set]:
+        """Mapping of reduced formulas to the entries with that formula. Built on first
+        use and kept up to date by add() and discard().
+        """
+        if self._composition_groups is None:
+            self._composition_groups = defaultdict(set)
+            for entry in self._entries:
+                self._composition_groups[entry.reduced_formula].add(entry)
+        return self._composition_groups
+
+    def _get_ground_states(self) -> dict[str, PDEntry | ComputedEntry | ComputedStructureEntry]:
+        """Mapping of reduced formulas to their lowest energy per atom entry. Built on
+        first use and kept up to date by add() and discard().
+        """
+        if self._ground_states is None:
+            self._ground_states = {
+                formula: min(group, key=lambda e: e.energy_per_atom)
+                for formula, group in self._get_composition_groups().items()
+            }
+        return self._ground_states
 
     @property
     def chemsys(self) -> set:
@@ -245,21 +317,14 @@ class EntrySet(collections.abc.MutableSet, MSONable):
         Returns:
             set representing the chemical system, e.g. {"Li", "Fe", "P", "O"}.
         """
-        chemsys = set()
-        for e in self.entries:
-            chemsys.update([el.symbol for el in e.composition])
-        return chemsys
+        return set(itertools.chain.from_iterable(self._get_chemsys_index()))
 
     @property
     def ground_states(self) -> set:
         """A set containing only the entries that are ground states, i.e., the lowest energy
         per atom entry at each composition.
         """
-        entries = sorted(self.entries, key=lambda e: e.reduced_formula)
-        return {
-            min(g, key=lambda e: e.energy_per_atom)
-            for _, g in itertools.groupby(entries, key=lambda e: e.reduced_formula)
-        }
+        return set(self._get_ground_states().values())
 
     def remove_non_ground_states(self):
         """Removes all non-ground state entries, i.e., only keep the lowest energy
@@ -269,7 +334,7 @@ class EntrySet(collections.abc.MutableSet, MSONable):
 
     def is_ground_state(self, entry) -> bool:
         """Boolean indicating whether a given Entry is a ground state."""
-        return entry in self.ground_states
+        return self._get_ground_states().get(entry.reduced_formula) == entry
 
     def get_subset_in_chemsys(self, chemsys: list[str]):
         """Get an EntrySet containing only the set of entries belonging to
@@ -286,16 +351,26 @@ class EntrySet(collections.abc.MutableSet, MSONable):
             EntrySet
         """
         chem_sys = set(chemsys)
-        if not chem_sys.issubset(self.chemsys):
+        index = self._get_chemsys_index()
+        all_chemsys = self.chemsys
+        if not chem_sys.issubset(all_chemsys):
             raise ValueError(
-                f"{sorted(chem_sys)} is not a subset of {sorted(self.chemsys)}, extra: {chem_sys - self.chemsys}"
+                f"{sorted(chem_sys)} is not a subset of {sorted(all_chemsys)}, extra: {chem_sys - all_chemsys}"
             )
-        subset = set()
-        for e in self.entries:
-            elements = [sp.symbol for sp in e.composition]
-            if chem_sys.issuperset(elements):
-                subset.add(e)
-        return EntrySet(subset)
+
+        # Look up every subsystem of chemsys, unless there are fewer indexed systems to check
+        if 2 ** len(chem_sys) <= len(index):
+            elements = sorted(chem_sys)
+            keys = (
+                key
+                for n_els in range(len(elements) + 1)
+                for key in itertools.combinations(elements, n_els)
+                if key in index
+            )
+        else:
+            keys = (key for key in index if chem_sys.issuperset(key))
+
+        return EntrySet(itertools.chain.from_iterable(index[key] for key in keys))
 
     def as_dict(self) -> dict[Literal["entries"], list[Entry]]:
         """Get MSONable dict."""
@@ -6,8 +6,12 @@ from __future__ import annotations
 
 import copy
 import os
+import time
 import warnings
-from itertools import groupby
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, groupby
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
@@ -23,6 +27,12 @@ from pymatgen.entries.compatibility import (
 from pymatgen.entries.computed_entries import ComputedStructureEntry, ConstantEnergyAdjustment
 from pymatgen.entries.entry_tools import EntrySet
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any
+
+    from pymatgen.core import Composition
+
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 __author__ = "Ryan Kingsbury"
@@ -154,14 +164,12 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
             list[AnyComputedEntry]: Adjusted entries. Entries in the original list incompatible with
                 chosen correction scheme are excluded from the returned list.
         """
-        processed_entry_list: list = []
-
         # We can't operate on single entries in this scheme
         if len(entries) == 1:  # type: ignore[arg-type]
             warnings.warn(
                 f"{type(self).__name__} cannot process single entries. Supply a list of entries.", stacklevel=2
             )
-            return processed_entry_list
+            return []
 
         # if inplace = False, process entries on a copy
         if not inplace:
@@ -205,16 +213,186 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
                     f"matching {self.run_type_1} materials"
                 )
 
+        processed_entry_list = self._apply_adjustments(entries_type_1 + entries_type_2, mixing_state_data, verbose)
+
+        if verbose:
+            count_type_1 = sum(entry.parameters["run_type"] in self.valid_rtypes_1 for entry in processed_entry_list)
+            count_type_2 = sum(entry.parameters["run_type"] in self.valid_rtypes_2 for entry in processed_entry_list)
+            print(
+                f"\nProcessing complete. Mixed entries contain {count_type_1} {self.run_type_1} and {count_type_2} "
+                f"{self.run_type_2} entries.\n"
+            )
+            self.display_entries(processed_entry_list)
+
+        return processed_entry_list
+
+    def process_entries_by_chemsys(
+        self,
+        entries: list[AnyComputedEntry],
+        chemsys: Iterable[str] | None = None,
+        clean: bool = True,
+        verbose: bool = False,
+        n_workers: int = 1,
+    ) -> dict[str, list[AnyComputedEntry]]:
+        """Process entries spanning many chemical systems, e.g. a whole database, mixing each
+        chemical system independently.
+
+        This gives the same result as calling process_entries on the entries of each chemical
+        system, but entries are only processed with compat_1 and compat_2 once, and the
+        spacegroup determination and structure matching of each composition is done once and
+        reused by every chemical system that contains it. Only the phase diagrams, mixing state
+        data and adjustments are computed for each chemical system.
+
+        Note that compat_1 and compat_2 adjust the input entries in place, whereas the mixing
+        adjustments of each chemical system are applied to shallow copies of the entries.
+
+        Args:
+            entries: ComputedStructureEntry of both run_types, in any number of chemical systems.
+            chemsys: Chemical systems to process, e.g. ["Fe-Li-O", "Mn-O"]. Defaults to the
+                chemical systems of the entries that are not contained in another one.
+            clean (bool): Whether to remove any previously-applied energy adjustments.
+                Default is True.
+            verbose (bool): Whether to print the time spent in each stage. Default is False.
+            n_workers (int): Number of processes used to process chemical systems in parallel.
+                Default is 1.
+
+        Returns:
+            dict[str, list[AnyComputedEntry]]: Adjusted entries of each chemical system, keyed by
+                chemical system (e.g. "Fe-Li-O"). Entries incompatible with the mixing scheme
+                are excluded.
+        """
+        timings: dict[str, float] = defaultdict(float)
+        start = time.perf_counter()
+
+        if clean:
+            for entry in entries:
+                entry.energy_adjustments = []
+        entries_type_1, entries_type_2 = self._filter_and_sort_entries(entries)
+        timings["compatibility"] = time.perf_counter() - start
+
+        # index the entries by chemical system, and group the structures of each composition once
+        start = time.perf_counter()
+        for entry in entries_type_1 + entries_type_2:
+            if not isinstance(entry, ComputedStructureEntry):
+                warnings.warn(
+                    f"Entry {entry.entry_id} is not a ComputedStructureEntry and will be ignored. "
+                    "The DFT mixing scheme requires structures for all entries",
+                    stacklevel=2,
+                )
+        index_1 = _get_chemsys_index(entries_type_1)
+        index_2 = _get_chemsys_index(entries_type_2)
+        sg_cache: dict = {}
+        group_cache: dict = {}
+        self._get_structure_groups(
+            [entry for entry in entries_type_1 + entries_type_2 if isinstance(entry, ComputedStructureEntry)],
+            sg_cache,
+            group_cache,
+        )
+        timings["structure grouping"] = time.perf_counter() - start
+
+        if chemsys is None:
+            # chemical systems that are not a proper subset of another one
+            all_chemsys = set(index_1) | set(index_2)
+            sub_chemsys = {
+                frozenset(combo)
+                for elements in all_chemsys
+                for n_elements in range(1, len(elements))
+                for combo in combinations(elements, n_elements)
+            }
+            chemsys_list = sorted(all_chemsys - sub_chemsys, key=lambda elements: "-".join(sorted(elements)))
+        else:
+            chemsys_list = [frozenset(elements.split("-")) for elements in chemsys]
+
+        kwargs = {
+            "entries_type_1": entries_type_1,
+            "entries_type_2": entries_type_2,
+            "index_1": index_1,
+            "index_2": index_2,
+            "sg_cache": sg_cache,
+            "group_cache": group_cache,
+        }
+        if n_workers > 1 and len(chemsys_list) > 1:
+            with ProcessPoolExecutor(n_workers, initializer=_init_mixing_worker, initargs=(self, kwargs)) as executor:
+                results = list(executor.map(_process_chemsys_worker, chemsys_list))
+        else:
+            results = [self._process_chemsys(elements, **kwargs) for elements in chemsys_list]
+
+        processed_entries = {}
+        for elements, (chemsys_entries, chemsys_timings) in zip(chemsys_list, results, strict=True):
+            processed_entries["-".join(sorted(elements))] = chemsys_entries
+            for stage, seconds in chemsys_timings.items():
+                timings[stage] += seconds
+
+        if verbose:
+            print(f"Processed {len(chemsys_list)} chemical systems. Time spent in each stage:")
+            for stage, seconds in timings.items():
+                print(f"  {stage}: {seconds:.2f} s")
+
+        return processed_entries
+
+    def _process_chemsys(
+        self, elements, *, entries_type_1, entries_type_2, index_1, index_2, sg_cache, group_cache
+    ) -> tuple[list[AnyComputedEntry], dict[str, float]]:
+        """Mix the entries of one chemical system for process_entries_by_chemsys.
+
+        Returns:
+            tuple[list[AnyComputedEntry], dict[str, float]]: Adjusted entries and the time
+                spent in each stage.
+        """
+        timings = {}
+        start = time.perf_counter()
+        chemsys_type_1 = [entries_type_1[idx] for idx in _get_chemsys_indices(index_1, elements)]
+        chemsys_type_2 = [entries_type_2[idx] for idx in _get_chemsys_indices(index_2, elements)]
+        if chemsys_type_1:
+            # as in _filter_and_sort_entries, run_type_2 entries outside of the chemical
+            # system of the run_type_1 entries are discarded
+            elements_1 = frozenset().union(*(entry.composition.chemical_system_set for entry in chemsys_type_1))
+            chemsys_type_2 = [entry for entry in chemsys_type_2 if entry.composition.chemical_system_set <= elements_1]
+
+        # copy the entries so that each chemical system gets its own energy adjustments
+        chemsys_entries = []
+        for entry in chemsys_type_1 + chemsys_type_2:
+            entry = copy.copy(entry)
+            entry.energy_adjustments = list(entry.energy_adjustments)
+            chemsys_entries.append(entry)
+        structure_entries = [entry for entry in chemsys_entries if isinstance(entry, ComputedStructureEntry)]
+
+        pd_type_1, pd_type_2 = self._get_phase_diagrams(
+            [entry for entry in structure_entries if entry.parameters["run_type"] in self.valid_rtypes_1],
+            [entry for entry in structure_entries if entry.parameters["run_type"] in self.valid_rtypes_2],
+        )
+        timings["phase diagrams"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        comp_groups = self._get_structure_groups(structure_entries, sg_cache, group_cache)
+        mixing_state_data = self._get_mixing_state_df(comp_groups, structure_entries, pd_type_1, pd_type_2)
+        timings["mixing state data"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        processed_entry_list = self._apply_adjustments(chemsys_entries, mixing_state_data)
+        timings["adjustments"] = time.perf_counter() - start
+
+        return processed_entry_list, timings
+
+    def _apply_adjustments(self, entries, mixing_state_data, verbose=False) -> list[AnyComputedEntry]:
+        """Apply the mixing scheme energy adjustments to entries that have been filtered and
+        processed with compat_1 and compat_2.
+
+        Returns:
+            list[AnyComputedEntry]: The adjusted entries, excluding discarded ones.
+        """
+        processed_entry_list: list = []
+
         # the code below is identical to code inside process_entries in the base
         # Compatibility class, except that an extra kwarg is passed to get_adjustments
-        for entry in entries_type_1 + entries_type_2:
+        for entry in entries:
             ignore_entry = False
             # get the energy adjustments
             try:
                 adjustments = self.get_adjustments(entry, mixing_state_data)
             except CompatibilityError as exc:
                 if "WARNING!" in str(exc):
-                    warnings.warn(str(exc), stacklevel=2)
+                    warnings.warn(str(exc), stacklevel=3)
                 elif verbose:
                     print(f"  {exc}")
                 ignore_entry = True
@@ -233,7 +411,7 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
                         f"Entry {entry.entry_id} already has an energy adjustment called {ea.name}, but its "
                         f"value differs from the value of {ea.value:.3f} calculated here. This "
                         "Entry will be discarded.",
-                        stacklevel=2,
+                        stacklevel=3,
                     )
                 else:
                     # Add the correction to the energy_adjustments list
@@ -242,15 +420,6 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
             if not ignore_entry:
                 processed_entry_list.append(entry)
 
-        if verbose:
-            count_type_1 = sum(entry.parameters["run_type"] in self.valid_rtypes_1 for entry in processed_entry_list)
-            count_type_2 = sum(entry.parameters["run_type"] in self.valid_rtypes_2 for entry in processed_entry_list)
-            print(
-                f"\nProcessing complete. Mixed entries contain {count_type_1} {self.run_type_1} and {count_type_2} "
-                f"{self.run_type_2} entries.\n"
-            )
-            self.display_entries(processed_entry_list)
-
         return processed_entry_list
 
     def get_adjustments(self, entry, mixing_state_data: pd.DataFrame | None = None):
@@ -284,7 +453,7 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
                 "WARNING! `mixing_state_data` DataFrame is None. No energy adjustments will be applied."
             )
 
-        if not all(mixing_state_data["hull_energy_1"].notna()) and any(mixing_state_data["entry_id_1"].notna()):
+        if not mixing_state_data["hull_energy_1"].notna().all() and mixing_state_data["entry_id_1"].notna().any():
             raise CompatibilityError(
                 f"WARNING! {self.run_type_1} entries do not form a complete PhaseDiagram."
                 " No energy adjustments will be applied."
@@ -323,7 +492,7 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
         # In this scenario we construct the hull using run_type_2 energies. We discard any
         # run_type_1 entries that already exist in run_type_2 and correct other run_type_1
         # energies to have the same e_above_hull on the run_type_2 hull as they had on the run_type_1 hull
-        if all(mixing_state_data[mixing_state_data["is_stable_1"]]["entry_id_2"].notna()):
+        if mixing_state_data[mixing_state_data["is_stable_1"]]["entry_id_2"].notna().all():
             if run_type in self.valid_rtypes_2:
                 # For run_type_2 entries, there is no correction
                 return adjustments
@@ -366,7 +535,7 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
         # Second case - there are run_type_2 energies available for at least some run_type_1
         # stable entries. Here, we can correct run_type_2 energies at certain compositions
         # to preserve their e_above_hull on the run_type_1 hull
-        if any(mixing_state_data[mixing_state_data["is_stable_1"]]["entry_id_2"].notna()):
+        if mixing_state_data[mixing_state_data["is_stable_1"]]["entry_id_2"].notna().any():
             if run_type in self.valid_rtypes_1:
                 df_slice = mixing_state_data[mixing_state_data["entry_id_1"] == entry.entry_id]
 
@@ -435,7 +604,7 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
 
         # Third case - there are no run_type_2 energies available for any run_type_1
         # ground states. There's no way to use the run_type_2 energies in this case.
-        if all(mixing_state_data[mixing_state_data["is_stable_1"]]["entry_id_2"].isna()):
+        if mixing_state_data[mixing_state_data["is_stable_1"]]["entry_id_2"].isna().all():
             if run_type in self.valid_rtypes_1:
                 # nothing to do for run_type_1, return as is
                 return adjustments
@@ -497,45 +666,62 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
         entries_type_1 = [e for e in filtered_entries if e.parameters["run_type"] in self.valid_rtypes_1]
         entries_type_2 = [e for e in filtered_entries if e.parameters["run_type"] in self.valid_rtypes_2]
 
-        # construct PhaseDiagram for each run_type, if possible
+        pd_type_1, pd_type_2 = self._get_phase_diagrams(entries_type_1, entries_type_2)
+
+        # Objective: loop through all the entries, group them by structure matching (or fuzzy structure matching
+        # where relevant). For each group, put a row in a pandas DataFrame with the composition of the run_type_1 entry,
+        # the run_type_2 entry, whether or not that entry is a ground state (not necessarily on the hull), its energy,
+        # and the energy of the hull at that composition
+        all_entries = list(entries_type_1) + list(entries_type_2)
+        return self._get_mixing_state_df(self._get_structure_groups(all_entries), all_entries, pd_type_1, pd_type_2)
+
+    def _get_phase_diagrams(self, entries_type_1, entries_type_2) -> tuple[PhaseDiagram | None, PhaseDiagram | None]:
+        """Construct the PhaseDiagram for each run_type, if possible."""
         pd_type_1, pd_type_2 = None, None
         try:
-            pd_type_1 = PhaseDiagram(entries_type_1)  # type: ignore[arg-type]
+            pd_type_1 = PhaseDiagram(entries_type_1)
         except ValueError:
-            warnings.warn(f"{self.run_type_1} entries do not form a complete PhaseDiagram.", stacklevel=2)
+            warnings.warn(f"{self.run_type_1} entries do not form a complete PhaseDiagram.", stacklevel=3)
 
         try:
-            pd_type_2 = PhaseDiagram(entries_type_2)  # type: ignore[arg-type]
+            pd_type_2 = PhaseDiagram(entries_type_2)
         except ValueError:
-            warnings.warn(f"{self.run_type_2} entries do not form a complete PhaseDiagram.", stacklevel=2)
+            warnings.warn(f"{self.run_type_2} entries do not form a complete PhaseDiagram.", stacklevel=3)
 
-        # Objective: loop through all the entries, group them by structure matching (or fuzzy structure matching
-        # where relevant). For each group, put a row in a pandas DataFrame with the composition of the run_type_1 entry,
-        # the run_type_2 entry, whether or not that entry is a ground state (not necessarily on the hull), its energy,
-        # and the energy of the hull at that composition
-        all_entries = list(entries_type_1) + list(entries_type_2)
-        row_list = []
-        columns = [
-            "formula",
-            "spacegroup",
-            "num_sites",
-            "is_stable_1",
-            "entry_id_1",
-            "entry_id_2",
-            "run_type_1",
-            "run_type_2",
-            "energy_1",
-            "energy_2",
-            "hull_energy_1",
-            "hull_energy_2",
-        ]
+        return pd_type_1, pd_type_2
+
+    def _get_structure_groups(
+        self,
+        all_entries: list[ComputedStructureEntry],
+        sg_cache: dict | None = None,
+        group_cache: dict | None = None,
+    ) -> list[tuple[Composition, list[tuple[int, int, list]]]]:
+        """Group entries by composition, then by spacegroup number, then by structure matching
+        (or by number of sites when fuzzy matching applies).
+
+        Args:
+            all_entries (list[ComputedStructureEntry]): Entries of both run_types.
+            sg_cache (dict | None): Spacegroup number of each entry_id, filled as spacegroups
+                are determined. Pass the same dict to reuse spacegroups across calls.
+            group_cache (dict | None): Groups of entry_ids for each tuple of entry_ids sharing a
+                composition, filled as compositions are grouped. Pass the same dict to reuse the
+                structure matching across calls on overlapping sets of entries.
+
+        Returns:
+            list[tuple[Composition, list[tuple[int, int, list]]]]: For each composition, a list of
+                (spacegroup, number of sites, entry_ids) for each group of matching structures.
+        """
+        sg_cache = {} if sg_cache is None else sg_cache
+        group_cache = {} if group_cache is None else group_cache
 
         def _get_sg(struct) -> int:
             """Helper function to get spacegroup with a loose tolerance."""
-            try:
-                return struct.get_space_group_info(symprec=0.1)[1]
-            except Exception:
-                return -1
+            if struct.entry_id not in sg_cache:
+                try:
+                    sg_cache[struct.entry_id] = struct.get_space_group_info(symprec=0.1)[1]
+                except Exception:
+                    sg_cache[struct.entry_id] = -1
+            return sg_cache[struct.entry_id]
 
         # loop through all structures
         # this logic follows emmet.builders.vasp.materials.MaterialsBuilder.filter_and_group_tasks
@@ -545,34 +731,72 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
             struct.entry_id = entry.entry_id
             structures.append(struct)
 
-        # First group by composition, then by spacegroup number, then by structure matching
+        comp_groups = []
         for comp, comp_group in groupby(sorted(structures, key=lambda s: s.composition), key=lambda s: s.composition):
             l_comp_group = list(comp_group)
-            # group by spacegroup, then by number of sites (for diatmics) or by structure matching
-            for sg, pre_group in groupby(sorted(l_comp_group, key=_get_sg), key=_get_sg):
-                l_pre_group = list(pre_group)
-                if comp.reduced_formula in ["O2", "H2", "Cl2", "F2", "N2", "I", "Br", "H2O"] and self.fuzzy_matching:
-                    # group by number of sites
-                    for idx, site_group in groupby(sorted(l_pre_group, key=len), key=len):
-                        l_sitegroup = list(site_group)
-                        row_list.append(
-                            self._populate_df_row(
-                                l_sitegroup,
-                                comp,
-                                sg,
-                                idx,
-                                pd_type_1,
-                                pd_type_2,
-                                all_entries,
-                            )
-                        )
-                else:
-                    for group in self.structure_matcher.group_structures(l_pre_group):
-                        group = list(group)
-                        idx = len(group[0])
+            key = tuple(struct.entry_id for struct in l_comp_group)
+            if key not in group_cache:
+                groups = []
+                # group by spacegroup, then by number of sites (for diatmics) or by structure matching
+                for sg, pre_group in groupby(sorted(l_comp_group, key=_get_sg), key=_get_sg):
+                    l_pre_group = list(pre_group)
+                    if (
+                        comp.reduced_formula in ["O2", "H2", "Cl2", "F2", "N2", "I", "Br", "H2O"]
+                        and self.fuzzy_matching
+                    ):
+                        # group by number of sites
+                        for idx, site_group in groupby(sorted(l_pre_group, key=len), key=len):
+                            groups.append((sg, idx, [struct.entry_id for struct in site_group]))
+                    else:
                         # StructureMatcher.group_structures returns a list of lists,
                         # so each group should be a list containing matched structures
-                        row_list.append(self._populate_df_row(group, comp, sg, idx, pd_type_1, pd_type_2, all_entries))
+                        for group in self.structure_matcher.group_structures(l_pre_group):
+                            groups.append((sg, len(group[0]), [struct.entry_id for struct in group]))
+                group_cache[key] = groups
+            comp_groups.append((comp, group_cache[key]))
+
+        return comp_groups
+
+    def _get_mixing_state_df(self, comp_groups, all_entries, pd_type_1, pd_type_2) -> pd.DataFrame:
+        """Build the mixing state DataFrame from groups of matching structures.
+
+        Args:
+            comp_groups: Output of _get_structure_groups.
+            all_entries (list[ComputedStructureEntry]): Entries of both run_types.
+            pd_type_1 (PhaseDiagram | None): PhaseDiagram of the run_type_1 entries.
+            pd_type_2 (PhaseDiagram | None): PhaseDiagram of the run_type_2 entries.
+
+        Returns:
+            DataFrame: See get_mixing_state_data.
+        """
+        columns = [
+            "formula",
+            "spacegroup",
+            "num_sites",
+            "is_stable_1",
+            "entry_id_1",
+            "entry_id_2",
+            "run_type_1",
+            "run_type_2",
+            "energy_1",
+            "energy_2",
+            "hull_energy_1",
+            "hull_energy_2",
+        ]
+        entry_indices = {entry.entry_id: idx for idx, entry in enumerate(all_entries)}
+        stable_entries_1 = pd_type_1.stable_entries if pd_type_1 else set()
+
+        row_list = []
+        for comp, groups in comp_groups:
+            # get the respective hull energies at this composition, if available
+            hull_energy_1 = pd_type_1.get_hull_energy_per_atom(comp) if pd_type_1 else np.nan
+            hull_energy_2 = pd_type_2.get_hull_energy_per_atom(comp) if pd_type_2 else np.nan
+            for sg, n, entry_ids in groups:
+                # keep the entries in input order, so that energy ties are broken consistently
+                group = [all_entries[idx] for idx in sorted(entry_indices[entry_id] for entry_id in entry_ids)]
+                row_list.append(
+                    self._populate_df_row(group, comp, sg, n, stable_entries_1, hull_energy_1, hull_energy_2)
+                )
 
         mixing_state_data = pd.DataFrame(row_list, columns=columns)
         return mixing_state_data.sort_values(["formula", "energy_1", "spacegroup", "num_sites"], ignore_index=True)
@@ -671,35 +895,25 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
 
         return list(entries_type_1), list(entries_type_2)
 
-    def _populate_df_row(self, struct_group, comp, sg, n, pd_type_1, pd_type_2, all_entries):
+    def _populate_df_row(self, entry_group, comp, sg, n, stable_entries_1, hull_energy_1, hull_energy_2):
         """Helper function to populate a row of the mixing state DataFrame, given
-        a list of matched structures.
+        a list of entries with matching structures.
         """
         # within the group of matched structures, keep the lowest energy entry from
         # each run_type
         entries_type_1 = sorted(
-            (
-                e
-                for e in all_entries
-                if e.entry_id in [s.entry_id for s in struct_group] and e.parameters["run_type"] in self.valid_rtypes_1
-            ),
+            (e for e in entry_group if e.parameters["run_type"] in self.valid_rtypes_1),
             key=lambda x: x.energy_per_atom,
         )
         first_entry = entries_type_1[0] if len(entries_type_1) > 0 else None
 
         entries_type_2 = sorted(
-            (
-                e
-                for e in all_entries
-                if e.entry_id in [s.entry_id for s in struct_group] and e.parameters["run_type"] in self.valid_rtypes_2
-            ),
+            (e for e in entry_group if e.parameters["run_type"] in self.valid_rtypes_2),
             key=lambda x: x.energy_per_atom,
         )
         second_entry = entries_type_2[0] if len(entries_type_2) > 0 else None
 
         # generate info for the DataFrame
-        stable_1 = False
-
         id1 = first_entry.entry_id if first_entry else None
         id2 = second_entry.entry_id if second_entry else None
         rt1 = first_entry.parameters["run_type"] if first_entry else None
@@ -708,15 +922,7 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
         energy_1 = first_entry.energy_per_atom if first_entry else np.nan
         energy_2 = second_entry.energy_per_atom if second_entry else np.nan
         # are they stable?
-        if pd_type_1:
-            stable_1 = first_entry in pd_type_1.stable_entries
-
-        # get the respective hull energies at this composition, if available
-        hull_energy_1, hull_energy_2 = np.nan, np.nan
-        if pd_type_1:
-            hull_energy_1 = pd_type_1.get_hull_energy_per_atom(comp)
-        if pd_type_2:
-            hull_energy_2 = pd_type_2.get_hull_energy_per_atom(comp)
+        stable_1 = first_entry is not None and first_entry in stable_entries_1
 
         return [
             comp.reduced_formula,
@@ -753,3 +959,39 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
                 f"{entry.correction / entry.composition.num_atoms:<9.3f} {pd.get_e_above_hull(entry):<9.3f}"
             )
         return
+
+
+def _get_chemsys_index(entries) -> dict[frozenset[str], list[int]]:
+    """Index entries by the set of elements in their composition."""
+    index: dict[frozenset[str], list[int]] = defaultdict(list)
+    for idx, entry in enumerate(entries):
+        index[frozenset(entry.composition.chemical_system_set)].append(idx)
+    return index
+
+
+def _get_chemsys_indices(index: dict[frozenset[str], list[int]], elements: frozenset[str]) -> list[int]:
+    """Get the sorted indices of the entries whose elements are all in elements."""
+    if 2 ** len(elements) <= len(index):
+        keys = (
+            frozenset(combo)
+            for n_elements in range(1, len(elements) + 1)
+            for combo in combinations(sorted(elements), n_elements)
+        )
+    else:
+        keys = (key for key in list(index) if key <= elements)
+    return sorted(idx for key in keys for idx in index.get(key, ()))
+
+
+# Shared state of process_entries_by_chemsys worker processes. The mixing scheme, the
+# entries and the structure groups are sent once per worker by the pool initializer,
+# so that each task only carries a chemical system.
+_MIXING_DATA: dict[str, Any] = {}
+
+
+def _init_mixing_worker(scheme: MaterialsProjectDFTMixingScheme, kwargs: dict[str, Any]) -> None:
+    _MIXING_DATA["scheme"] = scheme
+    _MIXING_DATA["kwargs"] = kwargs
+
+
+def _process_chemsys_worker(elements: frozenset[str]) -> tuple[list[AnyComputedEntry], dict[str, float]]:
+    return _MIXING_DATA["scheme"]._process_chemsys(elements, **_MIXING_DATA["kwargs"])
@@ -7,9 +7,10 @@ import importlib
 import itertools
 import json
 import os
+import tempfile
 import typing
 import warnings
-from copy import deepcopy
+from copy import copy, deepcopy
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -23,10 +24,54 @@ from pymatgen.core.units import ang_to_bohr, bohr_to_angstrom
 from pymatgen.electronic_structure.core import Spin
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
     from typing_extensions import Any, Self
 
     from pymatgen.core.structure import IStructure
 
+# Number of grid points processed at once in blockwise operations on out-of-core data
+_BLOCK_SIZE = 2**22
+
+
+def _is_out_of_core(array: Any) -> bool:
+    """Whether a grid is stored on disk as a np.memmap or an h5py dataset."""
+    return isinstance(array, np.memmap) or type(array).__module__.startswith("h5py")
+
+
+def _iter_slabs(shape: tuple[int, ...]) -> Iterator[slice]:
+    """Split a grid along its first axis into slabs of about _BLOCK_SIZE grid points."""
+    step = max(_BLOCK_SIZE // max(int(np.prod(shape[1:])), 1), 1)
+    for start in range(0, shape[0], step):
+        yield slice(start, min(start + step, shape[0]))
+
+
+def _blockwise(func: Callable[..., np.ndarray], *arrays: Any) -> np.memmap:
+    """Apply an elementwise function to grids of the same shape slab by slab, writing
+    the result to a temporary memmap file that is deleted once it is no longer referenced.
+    """
+    shape = arrays[0].shape
+    with tempfile.TemporaryFile() as file:
+        out = np.memmap(file, dtype=np.float64, mode="w+", shape=shape)
+    for slab in _iter_slabs(shape):
+        out[slab] = func(*(np.asarray(array[slab]) for array in arrays))
+    return out
+
+
+def _take_points(array: Any, indices: np.ndarray) -> np.ndarray:
+    """Get the values of a grid at integer indices of shape (n, 3). Out-of-core grids
+    are read slab by slab.
+    """
+    if not _is_out_of_core(array):
+        return array[tuple(indices.T)]
+    values = np.empty(len(indices))
+    for slab in _iter_slabs(array.shape):
+        mask = (indices[:, 0] >= slab.start) & (indices[:, 0] < slab.stop)
+        if mask.any():
+            block = np.asarray(array[slab])
+            values[mask] = block[indices[mask, 0] - slab.start, indices[mask, 1], indices[mask, 2]]
+    return values
+
 
 class VolumetricData(MSONable):
     """
@@ -56,6 +101,15 @@ class VolumetricData(MSONable):
         ngridpts (int):
             The total number of grid points in the volumetric data, calculated as
             `nx * ny * nz` using the grid dimensions.
+
+    The grids in data may also be kept on disk as np.memmap arrays (e.g. from
+    np.load(filename, mmap_mode="r")) or h5py datasets (e.g. from
+    from_hdf5(filename, lazy=True)). linear_add (and thus + and -), scale, copy,
+    spin_data, value_at, linear_slice, get_integrated_diff, get_average_along_axis
+    and to_hdf5 then process such out-of-core grids block by block without loading
+    them into memory. New grids are written to temporary memmap files, which are
+    created in the default temporary directory (set by the TMPDIR environment
+    variable) and deleted once they are no longer referenced.
     """
 
     def __init__(
@@ -83,7 +137,7 @@ class VolumetricData(MSONable):
         self.is_spin_polarized = len(data) >= 2
         self.is_soc = len(data) >= 4
         # convert data to numpy arrays in case they were jsanitized as lists
-        self.data = {k: np.array(v) for k, v in data.items()}
+        self.data = {k: v if _is_out_of_core(v) else np.array(v) for k, v in data.items()}
         self.dim = self.data["total"].shape
         self.data_aug = data_aug or {}
         self.ngridpts = self.dim[0] * self.dim[1] * self.dim[2]
@@ -93,13 +147,23 @@ class VolumetricData(MSONable):
         self.xpoints = np.linspace(0.0, 1.0, num=self.dim[0])
         self.ypoints = np.linspace(0.0, 1.0, num=self.dim[1])
         self.zpoints = np.linspace(0.0, 1.0, num=self.dim[2])
-        self.interpolator = RegularGridInterpolator(
-            (self.xpoints, self.ypoints, self.zpoints),
-            self.data["total"],
-            bounds_error=True,
+        # out-of-core data is interpolated from the surrounding grid points in value_at
+        self.interpolator = (
+            None
+            if _is_out_of_core(self.data["total"])
+            else RegularGridInterpolator(
+                (self.xpoints, self.ypoints, self.zpoints),
+                self.data["total"],
+                bounds_error=True,
+            )
         )
         self.name = "VolumetricData"
 
+    @property
+    def is_out_of_core(self) -> bool:
+        """Whether any of the data is stored on disk as a np.memmap or h5py dataset."""
+        return any(_is_out_of_core(val) for val in self.data.values())
+
     @property
     def spin_data(self):
         """The data decomposed into actual spin data as {spin: data}.
@@ -107,6 +171,16 @@ class VolumetricData(MSONable):
         instead of the total and diff. Note that by definition, a
         non-spin-polarized run would have Spin.up data == Spin.down data.
         """
+        if not self._spin_data and self.is_out_of_core:
+            if "diff" in self.data:
+                grids = (self.data["total"], self.data["diff"])
+                self._spin_data = {
+                    Spin.up: _blockwise(lambda total, diff: 0.5 * (total + diff), *grids),
+                    Spin.down: _blockwise(lambda total, diff: 0.5 * (total - diff), *grids),
+                }
+            else:
+                half = _blockwise(lambda total: 0.5 * total, self.data["total"])
+                self._spin_data = {Spin.up: half, Spin.down: half}
         if not self._spin_data:
             spin_data = {}
             spin_data[Spin.up] = 0.5 * (self.data["total"] + self.data.get("diff", 0))
@@ -135,7 +209,7 @@ class VolumetricData(MSONable):
         """Make a copy of VolumetricData object."""
         return VolumetricData(
             self.structure,
-            {k: v.copy() for k, v in self.data.items()},
+            {k: _blockwise(lambda val: val, v) if _is_out_of_core(v) else v.copy() for k, v in self.data.items()},
             distance_matrix=self._distance_matrix,  # type:ignore[arg-type]
             data_aug=self.data_aug,  # type:ignore[arg-type]
         )
@@ -161,6 +235,17 @@ class VolumetricData(MSONable):
         if list(self.data) != list(other.data):
             raise ValueError("Data have different keys! Maybe one is spin-polarized and the other is not?")
 
+        if self.is_out_of_core or other.is_out_of_core:
+            new = copy(self)
+            new.data = {
+                k: _blockwise(lambda val, other_val: val + scale_factor * other_val, self.data[k], other.data[k])
+                for k in self.data
+            }
+            new.data_aug = {}
+            new.interpolator = None
+            new._spin_data = {}
+            return new
+
         # To add checks
         data = {}
         for k in self.data:
@@ -174,7 +259,10 @@ class VolumetricData(MSONable):
     def scale(self, factor):
         """Scale the data in place by a factor."""
         for k in self.data:
-            self.data[k] = np.multiply(self.data[k], factor)
+            if _is_out_of_core(self.data[k]):
+                self.data[k] = _blockwise(lambda val: np.multiply(val, factor), self.data[k])
+            else:
+                self.data[k] = np.multiply(self.data[k], factor)
 
     def value_at(self, x, y, z):
         """Get a data value from self.data at a given point (x, y, z) in terms
@@ -191,6 +279,16 @@ class VolumetricData(MSONable):
             Value from self.data (potentially interpolated) corresponding to
             the point (x, y, z).
         """
+        if self.interpolator is None:
+            # interpolate out-of-core data from the corners of the grid cell enclosing the point
+            starts = [
+                min(max(int(frac * (n_pts - 1)), 0), max(n_pts - 2, 0))
+                for frac, n_pts in zip((x, y, z), self.dim, strict=True)
+            ]
+            cell = tuple(slice(start, start + 2) for start in starts)
+            points = (self.xpoints[cell[0]], self.ypoints[cell[1]], self.zpoints[cell[2]])
+            interpolator = RegularGridInterpolator(points, np.asarray(self.data["total"][cell]), bounds_error=True)
+            return interpolator([x, y, z])[0]
         return self.interpolator([x, y, z])[0]
 
     def linear_slice(self, p1, p2, n=100):
@@ -263,7 +361,7 @@ class VolumetricData(MSONable):
         inds = data[:, 1] <= radius
         dists = data[inds, 1]
         data_inds = np.rint(np.mod(list(data[inds, 0]), 1) * np.tile(a, (len(dists), 1))).astype(int)
-        vals = [self.data["diff"][x, y, z] for x, y, z in data_inds]
+        vals = _take_points(self.data["diff"], data_inds)
 
         hist, edges = np.histogram(dists, bins=nbins, range=[0, radius], weights=vals)
         data = np.zeros((nbins, 2))
@@ -284,7 +382,11 @@ class VolumetricData(MSONable):
         """
         total_spin_dens = self.data["total"]
         ng = self.dim
-        if ind == 0:
+        if _is_out_of_core(total_spin_dens):
+            axes = tuple(axis for axis in range(3) if axis != ind)
+            block_sums = [np.asarray(total_spin_dens[slab]).sum(axis=axes) for slab in _iter_slabs(ng)]
+            total = np.concatenate(block_sums) if ind == 0 else np.sum(block_sums, axis=0)
+        elif ind == 0:
             total = np.sum(np.sum(total_spin_dens, axis=1), 1)
         elif ind == 1:
             total = np.sum(np.sum(total_spin_dens, axis=0), 1)
@@ -292,7 +394,7 @@ class VolumetricData(MSONable):
             total = np.sum(np.sum(total_spin_dens, axis=0), 0)
         return total / ng[(ind + 1) % 3] / ng[(ind + 2) % 3]
 
-    def to_hdf5(self, filename):
+    def to_hdf5(self, filename, chunks: bool | tuple[int, int, int] | None = None):
         """Write the VolumetricData to a HDF5 format, which is a highly optimized
         format for reading storing large data. The mapping of the VolumetricData
         to this file format is as follows:
@@ -307,6 +409,9 @@ class VolumetricData(MSONable):
 
         Args:
             filename (str): Filename to output to.
+            chunks (bool | tuple[int, int, int] | None): Chunk shape of the data
+                datasets, passed to h5py. True lets h5py choose the chunk shape.
+                Defaults to None, i.e. contiguous datasets.
         """
         import h5py
 
@@ -320,33 +425,47 @@ class VolumetricData(MSONable):
             dt = h5py.special_dtype(vlen=str)
             ds = file.create_dataset("species", (len(self.structure.species),), dtype=dt)
             ds[...] = [str(sp) for sp in self.structure.species]
-            grp = file.create_group("vdata")
-            for k in self.data:
-                ds = grp.create_dataset(k, self.data[k].shape, dtype="float")
-                ds[...] = self.data[k]
+            grp = file.create_group("vdata", track_order=True)
+            for k, val in self.data.items():
+                ds = grp.create_dataset(k, val.shape, dtype="float", chunks=chunks)
+                if _is_out_of_core(val):
+                    for slab in _iter_slabs(val.shape):
+                        ds[slab] = val[slab]
+                else:
+                    ds[...] = val
             file.attrs["name"] = self.name
             file.attrs["structure_json"] = json.dumps(self.structure.as_dict())
 
     @classmethod
-    def from_hdf5(cls, filename: str, **kwargs) -> VolumetricData:
+    def from_hdf5(cls, filename: str, lazy: bool = False, **kwargs) -> VolumetricData:
         """
         Reads VolumetricData from HDF5 file.
 
         Args:
             filename: Filename
+            lazy (bool): Whether to keep the data on disk as h5py datasets instead of
+                loading it into memory. The file stays open for reading as long as the
+                datasets are referenced. Defaults to False.
 
         Returns:
             VolumetricData
         """
         import h5py
 
-        with h5py.File(filename, mode="r") as file:
-            data = {k: np.array(v) for k, v in file["vdata"].items()}
+        file = h5py.File(filename, mode="r")
+        try:
+            # Keep "total" first for files written without creation order tracking,
+            # whose groups h5py lists alphabetically.
+            keys = sorted(file["vdata"], key=lambda k: k != "total")
+            data = {k: file["vdata"][k] if lazy else np.array(file["vdata"][k]) for k in keys}
             data_aug = None
             if "vdata_aug" in file:
                 data_aug = {k: np.array(v) for k, v in file["vdata_aug"].items()}
             structure = Structure.from_dict(json.loads(file.attrs["structure_json"]))
             return cls(structure, data=data, data_aug=data_aug, **kwargs)  # type:ignore[arg-type]
+        finally:
+            if not lazy:
+                file.close()
 
     def to_cube(self, filename, comment: str = ""):
         """Write the total volumetric data to a cube file format, which consists of two comment lines,
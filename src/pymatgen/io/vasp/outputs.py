@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import hashlib
 import itertools
+import json
 import math
 import os
 import re
 import warnings
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from glob import glob
 from io import BytesIO
@@ -49,13 +51,13 @@ except ImportError:
     h5py = None
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator, Sequence
-    from typing import Literal, TypeAlias
+    from collections.abc import Callable, Iterator
+    from typing import ClassVar, Literal, TypeAlias
 
     # Avoid name conflict with pymatgen.core.Element
     from xml.etree.ElementTree import Element as XML_Element
 
-    from numpy.typing import NDArray
+    from numpy.typing import DTypeLike, NDArray
     from typing_extensions import Self
 
     from pymatgen.util.typing import Kpoint, PathLike
@@ -137,11 +139,97 @@ def _parse_vasp_array(elem) -> list[list[bool]] | NDArray[np.float64]:
     if elem.get("type") == "logical":
         return [[i == "T" for i in v.text.split()] for v in elem]
 
-    try:
-        # numerical data, try parse with numpy loadtxt for efficiency:
-        return np.loadtxt([e.text for e in elem], ndmin=2, dtype=np.float64)
-    except ValueError:  # unexpectedly couldn't re-shape to grid
-        return np.array([list(map(_vasprun_float, e.text.split())) for e in elem])
+    return _parse_vasp_rows([e.text for e in elem])
+
+
+def _parse_vasp_rows(rows: list[str], out: NDArray[np.float64] | None = None) -> NDArray[np.float64]:
+    """Convert the text of <v> or <r> elements with the same number of values into a
+    2D array. All rows are converted at once, with _parse_fixed_decimals for the usual
+    fixed-width values, else with numpy's text parser. If both fail, e.g. for overflowed
+    values written as *****, the values are converted one by one.
+
+    Args:
+        rows (list[str]): Text of the elements.
+        out (NDArray | None): Preallocated array to copy the values to, which must
+            hold exactly as many values as the rows. Defaults to None.
+
+    Returns:
+        NDArray: Array of shape (len(rows), number of values per row), or out.
+    """
+    values = _parse_fixed_decimals(rows)
+    if values is None:
+        try:
+            values = np.loadtxt(rows, ndmin=2, dtype=np.float64)
+        except ValueError:  # unexpectedly couldn't re-shape to grid
+            values = np.array([list(map(_vasprun_float, row.split())) for row in rows])
+
+    if out is None:
+        return values
+    np.copyto(out, values.reshape(out.shape))
+    return out
+
+
+def _parse_fixed_decimals(rows: list[str]) -> NDArray[np.float64] | None:
+    """Convert rows of fixed-width, fixed-decimal values, as VASP writes them in
+    vasprun.xml (e.g. "  -0.1234    1.0000 "), with vectorized operations on the
+    characters. Every value is right-aligned in its field, and every row ends with
+    a space. The values are exactly those of float().
+
+    Args:
+        rows (list[str]): Text of the elements, of equal length.
+
+    Returns:
+        NDArray | None: Array of shape (len(rows), number of values per row), or None
+            if the rows are not in this format.
+    """
+    if not rows or len(set(map(len, rows))) != 1:
+        return None
+    length = len(rows[0])
+    n_cols = len(rows[0].split())
+    width, rest = divmod(length - 1, n_cols) if n_cols else (0, 1)
+    dot = rows[0].find(".")
+    # the mantissa of up to 15 digits is exact in a float
+    if rest or not 2 < width <= 16 or not 0 < dot < width - 1:
+        return None
+    text = "".join(rows)
+    if not text.isascii():
+        return None
+
+    chars = np.frombuffer(text.encode(), dtype=np.uint8).reshape(len(rows), length)
+    if not (chars[:, -1] == ord(" ")).all():
+        return None
+    # One row per character position in the fields, one column per value
+    fields = chars[:, :-1].reshape(-1, width).T.copy()
+
+    mantissa = np.zeros(fields.shape[1], dtype=np.int64)
+    negative = np.zeros(fields.shape[1], dtype=bool)
+    started = np.zeros(fields.shape[1], dtype=bool)
+    for pos, char in enumerate(fields):
+        if pos == dot:
+            if not (char == ord(".")).all():
+                return None
+            continue
+        digit = char - np.uint8(ord("0"))
+        is_digit = digit <= 9
+        if pos >= dot - 1:
+            # there is at least one digit before the decimal point
+            if not is_digit.all():
+                return None
+        else:
+            # leading spaces, then an optional minus sign, then digits
+            is_space = char == ord(" ")
+            is_minus = char == ord("-")
+            if not (is_digit | is_space | is_minus).all() or (started & ~is_digit).any():
+                return None
+            negative |= is_minus
+            started |= ~is_space
+            digit[~is_digit] = 0
+        mantissa *= 10
+        mantissa += digit
+
+    values = mantissa / 10.0 ** (width - 1 - dot)
+    np.negative(values, out=values, where=negative)
+    return values.reshape(len(rows), n_cols)
 
 
 def _parse_from_incar(filename: PathLike, key: str) -> Any:
@@ -173,6 +261,183 @@ def _vasprun_float(flt: float | str) -> float:
         raise
 
 
+# Start and end tags of a vasprun.xml, except the data tags that cannot contain others
+_VASPRUN_BLOCK_TAG = re.compile(rb"<(/?)(?!(?:r|v|c|rc|i|set|field|dimension)\b)([A-Za-z_]\w*)([^>]*)>")
+
+# Parents of the <eigenvalues> blocks that Vasprun parses as eigenvalues
+_VASPRUN_EIGENVALUES_PARENTS = (b"calculation", b"projected")
+
+# Version of the block index, which invalidates cached indexes when it changes
+_VASPRUN_INDEX_VERSION = 2
+
+
+def _index_vasprun(filename: PathLike, chunk_size: int = 2**24) -> dict[str, Any]:
+    """Find the byte ranges of the <calculation> blocks of a vasprun.xml, and of the
+    last <dos>, <eigenvalues> and <projected> blocks that are not KPOINTS_OPT data,
+    i.e. of the blocks that are kept when parsing the whole file. The raw bytes are
+    scanned in chunks, without parsing the XML.
+
+    Args:
+        filename (PathLike): vasprun.xml file, optionally compressed.
+        chunk_size (int): Number of bytes read at a time.
+
+    Returns:
+        dict: {"calculations": [[start, end], ...], "dos": [start, end], ...,
+            "eigenvalue_blocks": [[start, end], ...]}, where the block keys are only
+            present if the blocks are. eigenvalues is the last <eigenvalues> block in
+            a <calculation> or <projected> block, and eigenvalue_blocks lists all
+            <eigenvalues> blocks that are not KPOINTS_OPT data.
+    """
+    index: dict[str, Any] = {"calculations": [], "eigenvalue_blocks": []}
+    open_tags: list[tuple[bytes, bytes, int]] = []
+    offset = 0
+    buffer = b""
+    with zopen(filename, mode="rb") as file:
+        while chunk := file.read(chunk_size):
+            buffer += chunk
+            end = 0
+            for match in _VASPRUN_BLOCK_TAG.finditer(buffer):
+                closing, tag, attrs = match.groups()
+                end = match.end()
+                if not closing:
+                    if not attrs.endswith(b"/"):
+                        open_tags.append((tag, attrs, offset + match.start()))
+                    continue
+                if not open_tags or open_tags[-1][0] != tag:
+                    continue
+                _, attrs, start = open_tags.pop()
+                block = [start, offset + end]
+                if tag == b"calculation":
+                    index["calculations"].append(block)
+                elif tag not in {b"dos", b"eigenvalues", b"projected"} or (
+                    b"kpoints_opt" in attrs or any(open_tag.endswith(b"_kpoints_opt") for open_tag, *_ in open_tags)
+                ):
+                    continue
+                elif tag != b"eigenvalues":
+                    index[tag.decode()] = block
+                else:
+                    index["eigenvalue_blocks"].append(block)
+                    # e.g. not the <eigenvalues> of the band velocities
+                    if open_tags and open_tags[-1][0] in _VASPRUN_EIGENVALUES_PARENTS:
+                        index["eigenvalues"] = block
+
+            # Keep the last tag, which may be cut off at the end of the chunk
+            keep = buffer.rfind(b"<", end)
+            keep = len(buffer) if keep == -1 else keep
+            offset += keep
+            buffer = buffer[keep:]
+    return index
+
+
+def _get_vasprun_index(filename: PathLike, cache: bool = False) -> dict[str, Any]:
+    """Get the block index of a vasprun.xml (see _index_vasprun).
+
+    Args:
+        filename (PathLike): vasprun.xml file, optionally compressed.
+        cache (bool): Whether to read the index from, or else write it to, a
+            "<filename>.index.json" file next to the vasprun.xml. A cached index
+            is only used if the size and modification time of the file and the
+            version of the index format still match.
+
+    Returns:
+        dict: The block index.
+    """
+    if not cache:
+        return _index_vasprun(filename)
+
+    stat = os.stat(filename)
+    file_key = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "version": _VASPRUN_INDEX_VERSION}
+    index_file = f"{filename}.index.json"
+    try:
+        with open(index_file, encoding="utf-8") as file:
+            index = json.load(file)
+        if index.pop("file") == file_key:
+            return index
+    except (OSError, ValueError, KeyError):
+        pass
+
+    index = _index_vasprun(filename)
+    # Write to a temporary file first, so an interrupted write never leaves a broken index
+    tmp_file = f"{index_file}.tmp"
+    with open(tmp_file, mode="w", encoding="utf-8") as file:
+        json.dump({"file": file_key, **index}, file)
+    os.replace(tmp_file, index_file)
+    return index
+
+
+def _read_xml_block(filename: PathLike, start: int, end: int) -> XML_Element:
+    """Parse the XML element in a byte range of a file."""
+    with zopen(filename, mode="rb") as file:
+        file.seek(start)
+        return ET.fromstring(file.read(end - start))
+
+
+def _read_xml_without(filename: PathLike, ranges: Iterable[Sequence[int]]) -> bytes:
+    """Read a file, leaving out the given byte ranges. Ranges nested in other ranges are ignored."""
+    parts = []
+    pos = 0
+    with zopen(filename, mode="rb") as file:
+        for start, end in sorted(ranges, key=lambda rng: rng[0]):
+            if start < pos:
+                continue
+            parts.append(file.read(start - pos))
+            file.seek(end)
+            pos = end
+        parts.append(file.read())
+    return b"".join(parts)
+
+
+class _LazyIonicSteps(Sequence):
+    """Ionic steps of a lazily loaded Vasprun, each parsed from its <calculation> block
+    on first access.
+    """
+
+    def __init__(
+        self,
+        filename: PathLike,
+        ranges: list[list[int]],
+        parse_step: Callable[[XML_Element], dict[str, Any]],
+        parsed: dict[int, dict[str, Any]],
+    ) -> None:
+        """
+        Args:
+            filename (PathLike): vasprun.xml file.
+            ranges (list[list[int]]): Byte ranges of the <calculation> blocks.
+            parse_step (Callable): Function to parse a <calculation> element.
+            parsed (dict[int, dict]): Steps that are already parsed, by index.
+        """
+        self._filename = filename
+        self._ranges = ranges
+        self._parse_step = parse_step
+        self._steps = parsed
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[ii] for ii in range(*idx.indices(len(self)))]
+        if not -len(self) <= idx < len(self):
+            raise IndexError("list index out of range")
+        idx %= len(self)
+        if idx not in self._steps:
+            self._steps[idx] = self._parse_step(_read_xml_block(self._filename, *self._ranges[idx]))
+        return self._steps[idx]
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        # Read all blocks through one file handle, as seeking in a compressed file
+        # decompresses it from the start
+        with zopen(self._filename, mode="rb") as file:
+            for idx, (start, end) in enumerate(self._ranges):
+                if idx not in self._steps:
+                    file.seek(start)
+                    self._steps[idx] = self._parse_step(ET.fromstring(file.read(end - start)))
+                yield self._steps[idx]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self._steps)}/{len(self)} steps parsed)"
+
+
 @dataclass
 class KpointOptProps:
     """Simple container class to store KPOINTS_OPT data in a separate namespace. Used by Vasprun."""
@@ -263,6 +528,13 @@ class Vasprun(MSONable):
     Author: Shyue Ping Ong
     """
 
+    # Attributes set from the blocks that are parsed on first access in lazy mode
+    _LAZY_BLOCK_ATTRS: ClassVar[dict[str, tuple[str, ...]]] = {
+        "dos": ("tdos", "idos", "pdos", "efermi", "dos_has_errors"),
+        "eigenvalues": ("eigenvalues",),
+        "projected": ("projected_eigenvalues", "projected_magnetisation"),
+    }
+
     def __init__(
         self,
         filename: PathLike,
@@ -275,6 +547,8 @@ class Vasprun(MSONable):
         occu_tol: float = 1e-8,
         separate_spins: bool = False,
         exception_on_bad_xml: bool = True,
+        lazy: bool = False,
+        cache_index: bool = False,
     ) -> None:
         """
         Args:
@@ -323,7 +597,22 @@ class Vasprun(MSONable):
                 proper vasprun.xml are parsed. You can set to False if you want
                 partial results (e.g., if you are monitoring a calculation during a
                 run), but use the results with care. A warning is issued.
+            lazy (bool): Whether to defer parsing the ionic steps and the final DOS,
+                eigenvalues and projected eigenvalues until they are accessed. A first
+                pass over the raw file records the byte ranges of these blocks, and
+                e.g. ionic_steps[i], complete_dos, efermi, eigenvalues or
+                projected_eigenvalues then parse only the blocks they need. The
+                parse_dos, parse_eigen and parse_projected_eigen flags only apply to
+                the KPOINTS_OPT data in this mode. Cannot be combined with
+                ionic_step_skip or ionic_step_offset. Random access is fastest on
+                uncompressed files. Defaults to False.
+            cache_index (bool): Whether to cache the byte ranges of a lazily loaded
+                file in "<filename>.index.json", so that reopening the file skips the
+                first pass. The cache is refreshed if the file changes. Defaults to False.
         """
+        if lazy and (ionic_step_skip or ionic_step_offset):
+            raise ValueError("lazy cannot be combined with ionic_step_skip or ionic_step_offset.")
+
         self.filename = filename
         self.ionic_step_skip = ionic_step_skip
         self.ionic_step_offset = ionic_step_offset
@@ -331,41 +620,49 @@ class Vasprun(MSONable):
         self.separate_spins = separate_spins
         self.exception_on_bad_xml = exception_on_bad_xml
 
-        with zopen(filename, mode="rt", encoding="utf-8") as file:
-            if ionic_step_skip or ionic_step_offset:
-                # Remove parts of the xml file and parse the string
-                content: str = file.read()  # type:ignore[assignment]
-                steps: list[str] = content.split("<calculation>")
-
-                # The text before the first <calculation> is the preamble!
-                preamble: str = steps.pop(0)
-                self.nionic_steps: int = len(steps)
-                new_steps = steps[ionic_step_offset :: int(ionic_step_skip or 1)]
-
-                # Add the tailing information in the last step from the run
-                to_parse: str = "<calculation>".join(new_steps)
-                if steps[-1] != new_steps[-1]:
-                    to_parse = f"{preamble}<calculation>{to_parse}{steps[-1].split('</calculation>')[-1]}"
+        if lazy:
+            self._parse_lazy(
+                cache_index,
+                parse_dos=parse_dos,
+                parse_eigen=parse_eigen,
+                parse_projected_eigen=parse_projected_eigen,
+            )
+        else:
+            with zopen(filename, mode="rt", encoding="utf-8") as file:
+                if ionic_step_skip or ionic_step_offset:
+                    # Remove parts of the xml file and parse the string
+                    content: str = file.read()  # type:ignore[assignment]
+                    steps: list[str] = content.split("<calculation>")
+
+                    # The text before the first <calculation> is the preamble!
+                    preamble: str = steps.pop(0)
+                    self.nionic_steps: int = len(steps)
+                    new_steps = steps[ionic_step_offset :: int(ionic_step_skip or 1)]
+
+                    # Add the tailing information in the last step from the run
+                    to_parse: str = "<calculation>".join(new_steps)
+                    if steps[-1] != new_steps[-1]:
+                        to_parse = f"{preamble}<calculation>{to_parse}{steps[-1].split('</calculation>')[-1]}"
+                    else:
+                        to_parse = f"{preamble}<calculation>{to_parse}"
+                    self._parse(
+                        BytesIO(to_parse.encode("utf-8")),
+                        parse_dos=parse_dos,
+                        parse_eigen=parse_eigen,
+                        parse_projected_eigen=parse_projected_eigen,
+                    )
                 else:
-                    to_parse = f"{preamble}<calculation>{to_parse}"
-                self._parse(
-                    BytesIO(to_parse.encode("utf-8")),
-                    parse_dos=parse_dos,
-                    parse_eigen=parse_eigen,
-                    parse_projected_eigen=parse_projected_eigen,
-                )
-            else:
-                self._parse(
-                    file,
-                    parse_dos=parse_dos,
-                    parse_eigen=parse_eigen,
-                    parse_projected_eigen=parse_projected_eigen,
-                )
-                self.nionic_steps = len(self.ionic_steps)
+                    self._parse(
+                        file,
+                        parse_dos=parse_dos,
+                        parse_eigen=parse_eigen,
+                        parse_projected_eigen=parse_projected_eigen,
+                    )
+                    self.nionic_steps = len(self.ionic_steps)
 
-            if parse_potcar_file:
-                self.update_potcar_spec(parse_potcar_file)
-                self.update_charge_from_potcar(parse_potcar_file)
+        if parse_potcar_file:
+            self.update_potcar_spec(parse_potcar_file)
+            self.update_charge_from_potcar(parse_potcar_file)
 
         if self.incar.get("ALGO") not in {"Chi", "Bse"} and not self.converged and self.parameters.get("IBRION") != 0:
             msg = f"{filename} is an unconverged VASP run.\n"
@@ -568,10 +865,79 @@ class Vasprun(MSONable):
                 stacklevel=2,
             )
 
-        self.ionic_steps = ionic_steps
+        # A lazily loaded Vasprun replaces the list by a _LazyIonicSteps sequence
+        self.ionic_steps: Sequence[dict[str, Any]] = ionic_steps
         self.md_data = md_data
         self.vasp_version = self.generator["version"]
 
+    def _parse_lazy(
+        self,
+        cache_index: bool,
+        parse_dos: bool,
+        parse_eigen: bool,
+        parse_projected_eigen: bool,
+    ) -> None:
+        """Parse the file without its ionic steps (except the last one) and without the
+        final DOS, eigenvalues and projected eigenvalues, and record the byte ranges of
+        these blocks to parse them on first access.
+        """
+        index = _get_vasprun_index(self.filename, cache=cache_index)
+        calculations = index["calculations"]
+        lazy_blocks = {block: index[block] for block in self._LAZY_BLOCK_ATTRS if block in index}
+        # Leave out all <eigenvalues> blocks, as the eigenvalues are only parsed on access
+        skipped = [*lazy_blocks.values(), *index["eigenvalue_blocks"]]
+
+        self._parse(
+            BytesIO(_read_xml_without(self.filename, [*calculations[:-1], *skipped])),
+            parse_dos=parse_dos,
+            parse_eigen=parse_eigen,
+            parse_projected_eigen=parse_projected_eigen,
+        )
+        if self.incar.get("ML_LMLFF") or self.parameters.get("LCHIMAG", False):
+            # MD data and chemical shielding steps are collected across all calculations
+            self._parse(
+                BytesIO(_read_xml_without(self.filename, skipped)),
+                parse_dos=parse_dos,
+                parse_eigen=parse_eigen,
+                parse_projected_eigen=parse_projected_eigen,
+            )
+            self.nionic_steps = len(self.ionic_steps)
+        else:
+            # The last calculation was kept in the parsed file
+            parsed = dict(enumerate(self.ionic_steps, start=len(calculations) - len(self.ionic_steps)))
+            self.ionic_steps = _LazyIonicSteps(self.filename, calculations, self._parse_ionic_step, parsed)
+            self.nionic_steps = len(calculations)
+
+        for block in lazy_blocks:
+            for attr in self._LAZY_BLOCK_ATTRS[block]:
+                vars(self).pop(attr, None)
+        self._lazy_blocks = lazy_blocks
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for unset attributes, e.g. those of a lazily loaded block
+        lazy_blocks = vars(self).get("_lazy_blocks", {})
+        for block in lazy_blocks:
+            if name in self._LAZY_BLOCK_ATTRS[block]:
+                self._load_block(block)
+                return getattr(self, name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def _load_block(self, block: str) -> None:
+        """Parse a block of a lazily loaded vasprun.xml and set its attributes."""
+        elem = _read_xml_block(self.filename, *self._lazy_blocks.pop(block))
+        if block == "dos":
+            self.efermi = None
+            try:
+                self.tdos, self.idos, self.pdos = self._parse_dos(elem)
+                self.efermi = self.tdos.efermi
+                self.dos_has_errors = False
+            except Exception:
+                self.dos_has_errors = True
+        elif block == "eigenvalues":
+            self.eigenvalues = self._parse_eigen(elem)
+        else:
+            self.projected_eigenvalues, self.projected_magnetisation = self._parse_projected_eigen(elem)
+
     @property
     def structures(self) -> list[Structure]:
         """List of Structures for each ionic step."""
@@ -1272,6 +1638,151 @@ class Vasprun(MSONable):
             structs.append(struct)
         return Trajectory.from_structures(structs, constant_lattice=False)
 
+    @staticmethod
+    def iter_ionic_steps(
+        filename: PathLike,
+        ionic_step_skip: int | None = None,
+        ionic_step_offset: int = 0,
+        exception_on_bad_xml: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over the ionic steps of a vasprun.xml file with bounded memory, e.g.
+        for long MD runs. Unlike Vasprun, which keeps all ionic steps with their
+        Structures, each step is yielded as arrays and its XML elements are cleared
+        before the next step is read.
+
+        Args:
+            filename (PathLike): vasprun.xml file, optionally compressed.
+            ionic_step_skip (int | None): Only yield every ionic_step_skip-th step.
+                Defaults to None, which yields all steps.
+            ionic_step_offset (int): Index of the first step to yield. Defaults to 0.
+            exception_on_bad_xml (bool): Whether to raise on malformed XML, e.g. a run
+                that is still going. If False, the iteration stops with a warning
+                instead. Defaults to True.
+
+        Yields:
+            dict: The energies of the step (e.g. "e_fr_energy", "e_wo_entrp"), as in
+                Vasprun.ionic_steps, and "species" (list[str]), "lattice" (3x3 array),
+                "frac_coords" (Nx3 array) as well as the "forces" (Nx3 array) and
+                "stress" (3x3 array) if they are present. The species list is
+                shared by all steps.
+        """
+        step_skip = ionic_step_skip or 1
+        species: list[str] = []
+        root = None
+        idx = 0
+        with zopen(filename, mode="rb") as file:
+            try:
+                for event, elem in ET.iterparse(file, events=("start", "end")):
+                    if root is None:
+                        root = elem
+                    if event != "end":
+                        continue
+                    if elem.tag == "atominfo" and not species:
+                        species = Vasprun._parse_atominfo(elem)[0]
+                    elif elem.tag == "calculation":
+                        if idx >= ionic_step_offset and (idx - ionic_step_offset) % step_skip == 0:
+                            yield Vasprun._parse_ionic_step_arrays(elem, species)
+                        idx += 1
+                        # Drop everything read so far, including the cleared step
+                        root.clear()
+
+            except ET.ParseError:
+                if exception_on_bad_xml:
+                    raise
+                warnings.warn(
+                    "XML is malformed. Parsing has stopped but partial data is available.",
+                    stacklevel=2,
+                )
+
+    @staticmethod
+    def _parse_ionic_step_arrays(elem: XML_Element, species: list[str]) -> dict[str, Any]:
+        """Parse the energies, lattice, coordinates, forces and stress of an ionic step."""
+        step: dict[str, Any] = {}
+        if (energy := elem.find("energy")) is not None:
+            step |= {i.attrib["name"]: _vasprun_float(i.text) for i in energy.findall("i")}  # type: ignore[arg-type]
+        step["species"] = species
+        if (struct := elem.find("structure")) is not None:
+            step["lattice"] = _parse_vasp_array(struct.find("crystal").find("varray"))  # type: ignore[union-attr]
+            step["frac_coords"] = _parse_vasp_array(struct.find("varray"))
+        for name in ("forces", "stress"):
+            if (varray := elem.find(f"varray/[@name='{name}']")) is not None:
+                step[name] = _parse_vasp_array(varray)
+        elem.clear()
+        return step
+
+    @staticmethod
+    def read_trajectory(
+        filename: PathLike,
+        ionic_step_skip: int | None = None,
+        ionic_step_offset: int = 0,
+        memmap_dir: PathLike | None = None,
+        exception_on_bad_xml: bool = True,
+    ) -> Trajectory:
+        """Read the ionic steps of a vasprun.xml file into a Trajectory with
+        iter_ionic_steps, without building a Structure per step. The number of steps is
+        counted first with a scan of the raw file, so the coordinates, lattices and
+        forces are written straight into preallocated arrays.
+
+        Args:
+            filename (PathLike): vasprun.xml file, optionally compressed.
+            ionic_step_skip (int | None): Only read every ionic_step_skip-th step.
+                Defaults to None, which reads all steps.
+            ionic_step_offset (int): Index of the first step to read. Defaults to 0.
+            memmap_dir (PathLike | None): Directory to store the arrays in, as
+                memory-mapped coords.npy, lattice.npy and forces.npy files, so that
+                even the arrays of the whole run need not fit in memory. They can be
+                reopened with np.load(..., mmap_mode="r"). Defaults to None, which
+                keeps the arrays in memory.
+            exception_on_bad_xml (bool): Whether to raise on malformed XML. If False,
+                the steps completed so far are read, e.g. of a running MD.
+                Defaults to True.
+
+        Returns:
+            Trajectory: With a lattice per frame, the forces as site properties and
+                the energies and stress of each step as frame properties.
+        """
+        n_calculations = len(_get_vasprun_index(filename)["calculations"])
+        n_steps = len(range(ionic_step_offset, n_calculations, ionic_step_skip or 1))
+        steps = Vasprun.iter_ionic_steps(filename, ionic_step_skip, ionic_step_offset, exception_on_bad_xml)
+        if n_steps == 0 or (first_step := next(steps, None)) is None:
+            raise ValueError(f"No ionic steps to read in {filename}.")
+
+        def empty(name: str, shape: tuple[int, ...]) -> NDArray:
+            if memmap_dir is None:
+                return np.empty(shape)
+            return np.lib.format.open_memmap(os.path.join(memmap_dir, f"{name}.npy"), mode="w+", shape=shape)
+
+        species = first_step["species"]
+        n_sites = len(first_step["frac_coords"])
+        coords = empty("coords", (n_steps, n_sites, 3))
+        lattice = empty("lattice", (n_steps, 3, 3))
+        forces = empty("forces", (n_steps, n_sites, 3)) if "forces" in first_step else None
+        frame_properties = []
+        for idx, step in enumerate(itertools.chain([first_step], steps)):
+            if idx >= n_steps:
+                continue
+            coords[idx] = step.pop("frac_coords")
+            lattice[idx] = step.pop("lattice")
+            if forces is not None:
+                forces[idx] = step.pop("forces")
+            del step["species"]
+            frame_properties.append(step)
+
+        # The file may have grown or been truncated since it was indexed
+        n_read = len(frame_properties)
+        if n_read < n_steps:
+            coords, lattice = coords[:n_read], lattice[:n_read]
+            forces = None if forces is None else forces[:n_read]
+
+        return Trajectory(
+            species=species,
+            coords=coords,
+            lattice=lattice,
+            constant_lattice=False,
+            site_properties=None if forces is None else [{"forces": frame_forces} for frame_forces in forces],
+            frame_properties=frame_properties,
+        )
+
     def update_potcar_spec(self, path: PathLike | bool) -> None:
         """Update the specs based on the POTCARs found.
 
@@ -1384,7 +1895,7 @@ class Vasprun(MSONable):
 
         try:
             vout = {
-                "ionic_steps": self.ionic_steps,
+                "ionic_steps": list(self.ionic_steps),
                 "final_energy": self.final_energy,
                 "final_energy_per_atom": self.final_energy / n_sites,
                 "crystal": self.final_structure.as_dict(),
@@ -1392,7 +1903,7 @@ class Vasprun(MSONable):
             }
         except (ArithmeticError, TypeError):
             vout = {
-                "ionic_steps": self.ionic_steps,
+                "ionic_steps": list(self.ionic_steps),
                 "final_energy": self.final_energy,
                 "final_energy_per_atom": None,
                 "crystal": self.final_structure.as_dict(),
@@ -1699,12 +2210,13 @@ class Vasprun(MSONable):
     @staticmethod
     def _parse_eigen(elem: XML_Element) -> dict[Spin, NDArray]:
         """Parse eigenvalues."""
-        eigenvalues: dict[Spin, NDArray] = defaultdict(list)  # type:ignore[arg-type]
+        eigenvalues: dict[Spin, NDArray] = {}
         for s in elem.find("array").find("set").findall("set"):  # type: ignore[union-attr]
             spin = Spin.up if s.attrib["comment"] == "spin 1" else Spin.down
-            for ss in s.findall("set"):
-                eigenvalues[spin].append(_parse_vasp_array(ss))
-        eigenvalues = {spin: np.array(v) for spin, v in eigenvalues.items()}
+            if n_kpoints := len(s.findall("set")):
+                # rows of all k-points and bands, converted at once
+                data = _parse_vasp_rows([r.text for r in s.iter("r")])  # type: ignore[misc]
+                eigenvalues[spin] = data.reshape(n_kpoints, -1, data.shape[1])
         elem.clear()
         return eigenvalues
 
@@ -1714,18 +2226,20 @@ class Vasprun(MSONable):
     ) -> tuple[dict[Spin, NDArray], NDArray | None]:
         """Parse projected eigenvalues."""
         root = elem.find("array").find("set")  # type: ignore[union-attr]
-        _proj_eigen: dict[int, NDArray] = defaultdict(list)  # type:ignore[arg-type]
+        _proj_eigen: dict[int, NDArray] = {}
         for s in root.findall("set"):  # type: ignore[union-attr]
             spin: int = int(re.match(r"spin(\d+)", s.attrib["comment"])[1])  # type: ignore[index]
+            if not (kpoints := s.findall("set")):
+                continue
 
-            # Force spin to be +1 or -1
-            for ss in s.findall("set"):
-                dk = []
-                for sss in ss.findall("set"):
-                    db = _parse_vasp_array(sss)
-                    dk.append(db)
-                _proj_eigen[spin].append(dk)
-        _proj_eigen = {spin: np.array(v) for spin, v in _proj_eigen.items()}
+            # Shape (k-points, bands, ions, orbitals), filled one k-point at a time
+            # to limit the size of the text converted at once
+            bands = kpoints[0].findall("set")
+            ions = bands[0].findall("r")
+            proj = np.empty((len(kpoints), len(bands), len(ions), len(ions[0].text.split())))  # type: ignore[union-attr]
+            for kpoint, out in zip(kpoints, proj, strict=True):
+                _parse_vasp_rows([r.text for r in kpoint.iter("r")], out=out)  # type: ignore[misc]
+            _proj_eigen[spin] = proj
 
         if len(_proj_eigen) > 2:
             # non-collinear magentism (also spin-orbit coupling) enabled, last three
@@ -2038,11 +2552,45 @@ class Outcar:
     Authors: Rickard Armiento, Shyue Ping Ong
     """
 
-    def __init__(self, filename: PathLike) -> None:
+    # Optional sections parsed on initialization, see __init__
+    SECTIONS: tuple[str, ...] = (
+        "nbands",
+        "nplwv",
+        "nplwvs_at_kpoints",
+        "drift",
+        "dfpt",
+        "lepsilon",
+        "lcalcpol",
+        "electrostatic_potential",
+        "nmr_cs",
+        "nmr_efg",
+        "onsite_density_matrices",
+        "final_energy_contribs",
+    )
+
+    _NGF_PATTERN = r"\s+dimension x,y,z NGXF=\s+([\.\-\d]+)\sNGYF=\s+([\.\-\d]+)\sNGZF=\s+([\.\-\d]+)"
+    _RADII_PATTERN = r"the test charge radii are((?:\s+[\.\-\d]+)+)"
+    _ELECTROSTATIC_TABLE = (
+        r"\(the norm of the test charge is\s+[\.\-\d]+\)",
+        r"((?:\s+\d+\s*[\.\-\d]+)+)",
+        r"\s+E-fermi :",
+    )
+
+    def __init__(self, filename: PathLike, sections: Sequence[str] | None = None) -> None:
         """
         Args:
             filename (PathLike): OUTCAR file to parse.
+            sections (Sequence[str] | None): Optional sections to parse, any of
+                Outcar.SECTIONS. The data at the end of the OUTCAR (energies, run stats,
+                charges and magnetizations) and the spin flags are always parsed. All
+                requested sections are read in a single pass through the file, except
+                those of specialized runs (dfpt, lepsilon, lcalcpol, nmr_cs and nmr_efg),
+                which are read afterwards if present. Sections that are not requested
+                are treated as absent, e.g. lepsilon is False. Defaults to None, which
+                parses all sections.
         """
+        if sections is not None and (unknown := set(sections) - set(self.SECTIONS)):
+            raise ValueError(f"Unknown sections {sorted(unknown)}, expected some of {self.SECTIONS}")
         self.filename: str = str(filename)
         self.is_stopped: bool = False
 
@@ -2205,66 +2753,103 @@ class Outcar:
         self.final_fr_energy = e_fr_energy
         self.data: dict[str, Any] = {}
 
-        # Read "number of bands" (NBANDS)
-        self.read_pattern(
-            {"nbands": r"number\s+of\s+bands\s+NBANDS=\s+(\d+)"},
-            terminate_on_match=True,
-            postprocess=int,
-        )
-        self.data["nbands"] = self.data["nbands"][0][0]
+        self._parse_sections(set(self.SECTIONS if sections is None else sections), serial_compilation)
 
-        # Read "total number of plane waves" (NPLWV)
-        self.read_pattern(
-            {"nplwv": r"total plane-waves  NPLWV =\s+(\*{6}|\d+)"},
-            terminate_on_match=True,
-        )
-        try:
-            self.data["nplwv"] = [[int(self.data["nplwv"][0][0])]]
-        except ValueError:
-            self.data["nplwv"] = [[None]]
-
-        nplwvs_at_kpoints = [
-            n
-            for [n] in self.read_table_pattern(
-                r"\n{3}-{104}\n{3}",
-                r".+plane waves:\s+(\*{6,}|\d+)",
-                (
-                    r"maximum number of plane-waves"
-                    if serial_compilation
-                    else r"maximum and minimum number of plane-waves"
-                ),
-                last_one_only=False,
-                first_one_only=True,
+    def _parse_sections(self, sections: set[str], serial_compilation: bool) -> None:
+        """Parse the requested optional sections, see __init__."""
+        # Patterns found in the same pass, as {key: (marker, pattern, postprocess, first_only)}.
+        # first_only keeps the matches of the first matching line only, like read_pattern
+        # with terminate_on_match=True. The marker is a substring of every matching line.
+        patterns: dict[str, tuple[str, str, Callable, bool]] = {
+            "spin": ("ISPIN", r"ISPIN\s*=\s*2", str, False),
+            "noncollinear": ("LNONCOLLINEAR", r"LNONCOLLINEAR\s*=\s*T", str, False),
+        }
+        if "nbands" in sections:
+            patterns["nbands"] = ("NBANDS=", r"number\s+of\s+bands\s+NBANDS=\s+(\d+)", int, True)
+        if "nplwv" in sections:
+            patterns["nplwv"] = ("NPLWV =", r"total plane-waves  NPLWV =\s+(\*{6}|\d+)", str, True)
+        if "drift" in sections:
+            patterns["drift"] = (
+                "total drift:",
+                r"total drift:\s+([\.\-\d]+)\s+([\.\-\d]+)\s+([\.\-\d]+)",
+                float,
+                False,
             )
-        ]
-        self.data["nplwvs_at_kpoints"] = [None for n in nplwvs_at_kpoints]
-        for n, nplwv in enumerate(nplwvs_at_kpoints):
+        if "dfpt" in sections:
+            patterns["ibrion"] = ("IBRION =", r"IBRION =\s+([\-\d]+)", int, True)
+        if "lepsilon" in sections:
+            patterns["epsilon"] = ("LEPSILON", r"LEPSILON\s*=\s*T", str, False)
+        if "lcalcpol" in sections:
+            patterns["calcpol"] = ("LCALCPOL", r"LCALCPOL\s*=\s*T", str, False)
+        if "electrostatic_potential" in sections:
+            marker = "average (electrostatic) potential at core"
+            patterns["electrostatic"] = (marker, re.escape(marker), str, False)
+            patterns["ngf"] = ("NGXF=", self._NGF_PATTERN, int, False)
+            patterns["radii"] = ("the test charge radii are", self._RADII_PATTERN, str, False)
+        if "nmr_cs" in sections:
+            patterns["nmr_cs"] = ("LCHIMAG", r"LCHIMAG\s*=\s*(T)", str, False)
+        if "nmr_efg" in sections:
+            patterns["nmr_efg"] = ("NMR quadrupolar parameters", r"NMR quadrupolar parameters", str, False)
+        if "onsite_density_matrices" in sections:
+            patterns["has_onsite_density_matrices"] = ("onsite density matrix", r"onsite density matrix", str, True)
+            # the tables of read_onsite_density_matrices start with this line
+            patterns["onsite_spin_component"] = ("spin component  1\n", r"spin component  1\n", str, True)
+        if "final_energy_contribs" in sections:
+            for key in ("PSCENC", "TEWEN", "DENC", "EXHF", "XCENC", "EENTRO", "EBANDS", "EATOM", "Ediel_sol"):
+                patterns[key] = (key, rf"{key}\s+=\s+([\d\-\.]+)", str, False)
+            key = "PAW double counting"
+            patterns[key] = (key, rf"{key}\s+=\s+([\.\-\d]+)\s+([\.\-\d]+)", str, False)
+
+        nplwvs_footer = (
+            r"maximum number of plane-waves" if serial_compilation else r"maximum and minimum number of plane-waves"
+        )
+        if "nplwvs_at_kpoints" in sections:
+            patterns["nplwvs_footer"] = (nplwvs_footer, nplwvs_footer, str, False)
+        head_lines, tail_lines = self._scan(
+            patterns,
+            head_footer=nplwvs_footer if "nplwvs_at_kpoints" in sections else None,
+            tail_marker="the norm of the test charge is" if "electrostatic_potential" in sections else None,
+        )
+        # markers of tables that are parsed separately
+        onsite_tables_present = bool(self.data.pop("onsite_spin_component", None))
+        nplwvs_footer_count = len(self.data.pop("nplwvs_footer", []))
+
+        if "nbands" in sections:
+            self.data["nbands"] = self.data["nbands"][0][0]
+
+        if "nplwv" in sections:
             try:
-                self.data["nplwvs_at_kpoints"][n] = int(nplwv)
+                self.data["nplwv"] = [[int(self.data["nplwv"][0][0])]]
             except ValueError:
-                pass
+                self.data["nplwv"] = [[None]]
+
+        if "nplwvs_at_kpoints" in sections:
+            table = (r"\n{3}-{104}\n{3}", r".+plane waves:\s+(\*{6,}|\d+)", nplwvs_footer)
+            if nplwvs_footer_count == 1:
+                # every table ends at the footer, so the lines up to it contain the first one
+                nplwvs_tables = self._parse_tables("".join(head_lines), *table, first_one_only=True)
+                nplwvs_at_kpoints = [n for [n] in nplwvs_tables[0]]
+            else:
+                nplwvs_at_kpoints = [
+                    n for [n] in self.read_table_pattern(*table, last_one_only=False, first_one_only=True)
+                ]
+            self.data["nplwvs_at_kpoints"] = [None for n in nplwvs_at_kpoints]
+            for n, nplwv in enumerate(nplwvs_at_kpoints):
+                try:
+                    self.data["nplwvs_at_kpoints"][n] = int(nplwv)
+                except ValueError:
+                    pass
 
         # Read the drift
-        self.read_pattern(
-            {"drift": r"total drift:\s+([\.\-\d]+)\s+([\.\-\d]+)\s+([\.\-\d]+)"},
-            postprocess=float,
-        )
         self.drift = self.data.get("drift", [])
 
         # Check if calculation is spin polarized
-        self.read_pattern({"spin": r"ISPIN\s*=\s*2"})
         self.spin = bool(self.data.get("spin", False))
 
         # Check if calculation is non-collinear
-        self.read_pattern({"noncollinear": r"LNONCOLLINEAR\s*=\s*T"})
         self.noncollinear = bool(self.data.get("noncollinear", False))
 
         # Check if the calculation type is DFPT
-        self.read_pattern(
-            {"ibrion": r"IBRION =\s+([\-\d]+)"},
-            terminate_on_match=True,
-            postprocess=int,
-        )
         if self.data.get("ibrion", [[0]])[0][0] > 6:
             self.dfpt = True
             self.read_internal_strain_tensor()
@@ -2272,7 +2857,6 @@ class Outcar:
             self.dfpt = False
 
         # Check if LEPSILON is True and read piezo data if so
-        self.read_pattern({"epsilon": r"LEPSILON\s*=\s*T"})
         if self.data.get("epsilon", False):
             self.lepsilon = True
             self.read_lepsilon()
@@ -2283,7 +2867,6 @@ class Outcar:
             self.lepsilon = False
 
         # Check if LCALCPOL is True and read polarization data if so
-        self.read_pattern({"calcpol": r"LCALCPOL\s*=\s*T"})
         if self.data.get("calcpol", False):
             self.lcalcpol = True
             self.read_lcalcpol()
@@ -2295,11 +2878,19 @@ class Outcar:
         self.electrostatic_potential: list[float] | None = None
         self.ngf: list[int] | None = None
         self.sampling_radii: list[float] | None = None
-        self.read_pattern({"electrostatic": r"average \(electrostatic\) potential at core"})
-        if self.data.get("electrostatic", False):
-            self.read_electrostatic_potential()
+        if not self.data.get("electrostatic", False):
+            self.data.pop("ngf", None)
+            self.data.pop("radii", None)
+        else:
+            # like read_pattern(reverse=True, terminate_on_match=True), keep the last match
+            self.data["radii"] = self.data["radii"][-1:]
+            # the lines from the last table header to the end contain the last table,
+            # unless it is incomplete
+            pot_patterns = self._parse_tables("".join(tail_lines), *self._ELECTROSTATIC_TABLE)
+            if not pot_patterns:
+                pot_patterns = self.read_table_pattern(*self._ELECTROSTATIC_TABLE)
+            self._set_electrostatic_potential(pot_patterns[-1])
 
-        self.read_pattern({"nmr_cs": r"LCHIMAG\s*=\s*(T)"})
         if self.data.get("nmr_cs"):
             self.nmr_cs: bool = True
             self.read_chemical_shielding()
@@ -2309,7 +2900,6 @@ class Outcar:
         else:
             self.nmr_cs = False
 
-        self.read_pattern({"nmr_efg": r"NMR quadrupolar parameters"})
         if self.data.get("nmr_efg"):
             self.nmr_efg: bool = True
             self.read_nmr_efg()
@@ -2317,39 +2907,88 @@ class Outcar:
         else:
             self.nmr_efg = False
 
-        self.read_pattern(
-            {"has_onsite_density_matrices": r"onsite density matrix"},
-            terminate_on_match=True,
-        )
         if "has_onsite_density_matrices" in self.data:
             self.has_onsite_density_matrices: bool = True
-            self.read_onsite_density_matrices()
+            if onsite_tables_present:
+                self.read_onsite_density_matrices()
+            else:
+                self.data["onsite_density_matrices"] = []
         else:
             self.has_onsite_density_matrices = False
 
         # Store the individual contributions to the final total energy
         final_energy_contribs = {}
-        for key in (
-            "PSCENC",
-            "TEWEN",
-            "DENC",
-            "EXHF",
-            "XCENC",
-            "PAW double counting",
-            "EENTRO",
-            "EBANDS",
-            "EATOM",
-            "Ediel_sol",
-        ):
-            if key == "PAW double counting":
-                self.read_pattern({key: rf"{key}\s+=\s+([\.\-\d]+)\s+([\.\-\d]+)"})
-            else:
-                self.read_pattern({key: rf"{key}\s+=\s+([\d\-\.]+)"})
-            if not self.data[key]:
-                continue
-            final_energy_contribs[key] = sum(map(float, self.data[key][-1]))
+        if "final_energy_contribs" in sections:
+            for key in (
+                "PSCENC",
+                "TEWEN",
+                "DENC",
+                "EXHF",
+                "XCENC",
+                "PAW double counting",
+                "EENTRO",
+                "EBANDS",
+                "EATOM",
+                "Ediel_sol",
+            ):
+                if not self.data[key]:
+                    continue
+                final_energy_contribs[key] = sum(map(float, self.data[key][-1]))
         self.final_energy_contribs = final_energy_contribs
 
+    def _scan(
+        self,
+        patterns: dict[str, tuple[str, str, Callable, bool]],
+        head_footer: str | None = None,
+        tail_marker: str | None = None,
+    ) -> tuple[list[str], list[str]]:
+        """Search many patterns in a single pass through the OUTCAR. Lines are first
+        checked for the markers of all patterns at once, and only the patterns whose
+        marker a line contains are searched in it.
+
+        Args:
+            patterns (dict[str, tuple[str, str, Callable, bool]]): Patterns as
+                {key: (marker, pattern, postprocess, first_only)}. The groups of the
+                matches are stored in self.data[key] like in read_pattern, for the
+                first matching line only if first_only is True.
+            head_footer (str | None): Marker of the line ending the head to return.
+            tail_marker (str | None): Marker of the line starting the tail to return.
+
+        Returns:
+            tuple[list[str], list[str]]: The lines up to the first line containing
+                head_footer and the lines from the last line containing tail_marker.
+        """
+        compiled = [
+            (key, marker, re.compile(pattern), postprocess, first_only)
+            for key, (marker, pattern, postprocess, first_only) in patterns.items()
+        ]
+        markers = {marker for marker, *_ in patterns.values()}
+        markers.update(marker for marker in (head_footer, tail_marker) if marker is not None)
+        any_marker = re.compile("|".join(re.escape(marker) for marker in sorted(markers)))
+        matches: dict[str, list] = {key: [] for key in patterns}
+        head_lines: list[str] = []
+        tail_lines: list[str] = []
+        in_head = head_footer is not None
+        in_tail = False
+        with zopen(self.filename, mode="rt", encoding="utf-8") as file:
+            for line in file:
+                has_marker = any_marker.search(line) is not None
+                if in_head:
+                    head_lines.append(line)
+                    in_head = not (has_marker and head_footer in line)  # type:ignore[operator]
+                if has_marker and tail_marker is not None and tail_marker in line:
+                    tail_lines = [line]
+                    in_tail = True
+                elif in_tail:
+                    tail_lines.append(line)
+                if not has_marker:
+                    continue
+                for key, marker, regex, postprocess, first_only in compiled:
+                    if marker in line and not (first_only and matches[key]) and (match := regex.search(line)):
+                        matches[key].append([postprocess(group) for group in match.groups()])
+        self.data |= matches
+        return head_lines, tail_lines
+
     @staticmethod
     def _parse_sci_notation(line: str) -> list[float]:
         """
@@ -2524,6 +3163,22 @@ class Outcar:
 
         with zopen(self.filename, mode="rt", encoding="utf-8") as file:
             text: str = file.read()  # type:ignore[assignment]
+        tables = self._parse_tables(text, header_pattern, row_pattern, footer_pattern, postprocess, first_one_only)
+        retained_data = tables[-1] if last_one_only or first_one_only else tables
+        if attribute_name is not None:
+            self.data[attribute_name] = retained_data
+        return retained_data
+
+    @staticmethod
+    def _parse_tables(
+        text: str,
+        header_pattern: str,
+        row_pattern: str,
+        footer_pattern: str,
+        postprocess: Callable = str,
+        first_one_only: bool = False,
+    ) -> list:
+        """Parse all tables in text, see read_table_pattern."""
         table_pattern_text = header_pattern + r"\s*^(?P<table_body>(?:\s+" + row_pattern + r")+)\s+" + footer_pattern
         table_pattern = re.compile(table_pattern_text, re.MULTILINE | re.DOTALL)
         rp = re.compile(row_pattern)
@@ -2547,10 +3202,7 @@ class Outcar:
             tables.append(table_contents)
             if first_one_only:
                 break
-        retained_data: list[TableData] | TableData = tables[-1] if last_one_only or first_one_only else tables
-        if attribute_name is not None:
-            self.data[attribute_name] = retained_data
-        return retained_data
+        return tables
 
     def read_electrostatic_potential(self) -> None:
         """Parse the eletrostatic potential for the last ionic step.
@@ -2560,19 +3212,16 @@ class Outcar:
             sampling_radii (list[float, float, float]): Test charge radii.
             electrostatic_potential (list[float]): The eletrostatic potential.
         """
-        pattern = {"ngf": r"\s+dimension x,y,z NGXF=\s+([\.\-\d]+)\sNGYF=\s+([\.\-\d]+)\sNGZF=\s+([\.\-\d]+)"}
-        self.read_pattern(pattern, postprocess=int)
-        self.ngf = self.data.get("ngf", [[]])[0]
+        self.read_pattern({"ngf": self._NGF_PATTERN}, postprocess=int)
+        self.read_pattern({"radii": self._RADII_PATTERN}, reverse=True, terminate_on_match=True, postprocess=str)
+        self._set_electrostatic_potential(self.read_table_pattern(*self._ELECTROSTATIC_TABLE))
 
-        pattern = {"radii": r"the test charge radii are((?:\s+[\.\-\d]+)+)"}
-        self.read_pattern(pattern, reverse=True, terminate_on_match=True, postprocess=str)
+    def _set_electrostatic_potential(self, pot_patterns: list) -> None:
+        """Set the electrostatic potential attributes from the parsed "ngf" and "radii"
+        data and the last table of potentials.
+        """
+        self.ngf = self.data.get("ngf", [[]])[0]
         self.sampling_radii = [*map(float, self.data["radii"][0][0].split())]
-
-        header_pattern = r"\(the norm of the test charge is\s+[\.\-\d]+\)"
-        table_pattern = r"((?:\s+\d+\s*[\.\-\d]+)+)"
-        footer_pattern = r"\s+E-fermi :"
-
-        pot_patterns: list = self.read_table_pattern(header_pattern, table_pattern, footer_pattern)
         pot_patterns_str: str = "".join(itertools.chain.from_iterable(pot_patterns))
         pots: list = re.findall(r"\s+\d+\s*([\.\-\d]+)+", pot_patterns_str)
 
@@ -3695,6 +4344,52 @@ class Outcar:
         self.data["fermi_contact_shift"] = fc_shift_table
 
 
+def _read_volumetric_grid(lines: Iterator[str], dim: list[int]) -> tuple[NDArray, list[str]]:
+    """Read one grid of volumetric data following its dimension line.
+
+    VASP writes the grid with x as the fastest index, followed by y then z, with a fixed
+    number of values per line. The lines holding the grid are therefore read at once and
+    converted in bulk. Grids with irregular lines are read line by line instead.
+
+    Args:
+        lines (Iterator[str]): Lines of the file, starting at the first line of the grid.
+        dim (list[int]): Dimensions of the grid.
+
+    Returns:
+        tuple[NDArray, list[str]]: The grid and the lines that were read past its end.
+    """
+    n_points = dim[0] * dim[1] * dim[2]
+    first_line = next(lines, "")
+    per_line = max(len(first_line.split()), 1)
+    block = [first_line, *itertools.islice(lines, -(-n_points // per_line) - 1)]
+
+    values = None
+    with warnings.catch_warnings():
+        # older numpy warns instead of raising on unparsable text
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            values = np.fromstring("".join(block), sep=" ")
+        except (ValueError, DeprecationWarning):
+            pass
+
+    leftover: list[str] = []
+    if values is not None and len(values) - len(block[-1].split()) < n_points <= len(values):
+        # the grid ends on the last line, whose extra values are ignored
+        values = values[:n_points]
+    else:
+        chunks, count = [], 0
+        for idx, line in enumerate(itertools.chain(block, lines)):
+            chunk = np.array(line.split(), dtype=np.float64)[: n_points - count]
+            chunks.append(chunk)
+            count += len(chunk)
+            if count >= n_points:
+                leftover = block[idx + 1 :]
+                break
+        values = np.concatenate(chunks)
+
+    return np.ascontiguousarray(values.reshape(dim, order="F")), leftover
+
+
 class VolumetricData(BaseVolumetricData):
     """Container for volumetric data that allows
     for reading/writing with Poscar-type data.
@@ -3714,63 +4409,40 @@ class VolumetricData(BaseVolumetricData):
         """
         poscar_read = False
         poscar_string: list[str] = []
-        dataset: NDArray = np.zeros((1, 1, 1))
         all_dataset: list[NDArray] = []
         # for holding any strings in input that are not Poscar
         # or VolumetricData (typically augmentation charges)
         all_dataset_aug: dict[int, list[str]] = {}
         dim: list[int] = []
         dimline = ""
-        read_dataset = False
-        ngrid_pts = 0
-        data_count = 0
         poscar = None
         with zopen(filename, mode="rt", encoding="utf-8") as file:
-            for line in file:
-                original_line = line
-                line = line.strip()
-                if read_dataset:
-                    for tok in line.split():
-                        if data_count < ngrid_pts:
-                            # This complicated procedure is necessary because
-                            # VASP outputs x as the fastest index, followed by y
-                            # then z.
-                            no_x = data_count // dim[0]
-                            dataset[data_count % dim[0], no_x % dim[1], no_x // dim[1]] = float(tok)
-                            data_count += 1
-                    if data_count >= ngrid_pts:
-                        read_dataset = False
-                        data_count = 0
-                        all_dataset.append(dataset)
-
-                elif not poscar_read:
+            lines: Iterator[str] = iter(file)
+            while (original_line := next(lines, None)) is not None:
+                line = original_line.strip()
+                if not poscar_read:
                     if line != "" or len(poscar_string) == 0:
-                        poscar_string.append(line)  # type:ignore[arg-type]
+                        poscar_string.append(line)
                     elif line == "":
                         poscar = Poscar.from_str("\n".join(poscar_string))
                         poscar_read = True
 
-                elif not dim:
-                    dim = [int(i) for i in line.split()]
-                    ngrid_pts = dim[0] * dim[1] * dim[2]
-                    dimline = line  # type:ignore[assignment]
-                    read_dataset = True
-                    dataset = np.zeros(dim)
-
-                elif line == dimline:
+                elif not dim or line == dimline:
                     # when line == dimline, expect volumetric data to follow
-                    # so set read_dataset to True
-                    read_dataset = True
-                    dataset = np.zeros(dim)
+                    if not dim:
+                        dim = [int(i) for i in line.split()]
+                        dimline = line
+                    dataset, leftover = _read_volumetric_grid(lines, dim)
+                    all_dataset.append(dataset)
+                    if leftover:
+                        # lines read past the end of the grid, handled as usual
+                        lines = itertools.chain(leftover, lines)
 
                 else:
                     # store any extra lines that were not part of the
                     # volumetric data so we know which set of data the extra
                     # lines are associated with
-                    key = len(all_dataset) - 1
-                    if key not in all_dataset_aug:
-                        all_dataset_aug[key] = []
-                    all_dataset_aug[key].append(original_line)  # type:ignore[arg-type]
+                    all_dataset_aug.setdefault(len(all_dataset) - 1, []).append(original_line)
 
             if len(all_dataset) == 4:
                 data = {
@@ -4049,15 +4721,38 @@ class Procar(MSONable):
         xyz_data (dict): The PROCAR projections data along the x,y and z magnetisation projection
             directions, with is_soc = True (see VASP wiki for more info).
             {'x'/'y'/'z': np.array accessed with (k-point index, band index, ion index, orbital index)}
+        ions (list[int] | None): The indices of the loaded ions, which the ion index of data,
+            phase_factors and xyz_data refers to, or None if all ions are loaded.
+        orbitals (list[str]): The names of the loaded orbitals, which the orbital index refers to.
+        dtype (np.dtype): The float type of data and xyz_data.
     """
 
-    def __init__(self, filename: PathLike | list[PathLike]):
+    def __init__(
+        self,
+        filename: PathLike | list[PathLike],
+        ions: Sequence[int] | None = None,
+        orbitals: Sequence[str] | None = None,
+        dtype: DTypeLike = np.float64,
+    ):
         """
         Args:
             filename: The path to PROCAR(.gz) file to read, or list of paths.
+            ions (Sequence[int] | None): 0-based indices of the ions to load the
+                projections of, in this order. The ion axis of data, phase_factors
+                and xyz_data then runs over these ions. Defaults to None, which loads
+                all ions.
+            orbitals (Sequence[str] | None): Names of the orbitals to load the
+                projections of, in this order, e.g. ["s", "px"]. Defaults to None,
+                which loads all orbitals.
+            dtype (DTypeLike): Float type to store the projections in, e.g.
+                np.float32 to halve the memory of large PROCARs. The phase factors
+                are stored as the matching complex type. Defaults to np.float64.
         """
         # get PROCAR filenames list to parse:
         filenames = filename if isinstance(filename, list) else [filename]
+        self.ions = None if ions is None else list(ions)
+        self._orbital_selection = None if orbitals is None else list(orbitals)
+        self.dtype = np.dtype(dtype)
         self.nions: int | None = None  # used to check for consistency in files later
         self.nspins: int | None = None  # used to check for consistency in files later
         self.is_soc: bool | None = None  # used to check for consistency in files later
@@ -4184,6 +4879,10 @@ class Procar(MSONable):
     def _read(self, filename: PathLike, parsed_kpoints: set[tuple[Kpoint]] | None = None):
         """Main function for reading in the PROCAR projections data.
 
+        The projection lines of a k-point are collected per band and converted in one
+        numeric block per kind of projection (total, x/y/z with SOC and phase factors)
+        once the k-point has been read.
+
         Args:
             filename (PathLike): Path to PROCAR file to read.
             parsed_kpoints (set[tuple[Kpoint]]): Set of tuples of already-parsed kpoints (e.g. from multiple
@@ -4198,7 +4897,6 @@ class Procar(MSONable):
             band_expr = re.compile(r"^band\s+(\d+)")
             ion_expr = re.compile(r"^ion.*")
             total_expr = re.compile(r"^tot.*")
-            expr = re.compile(r"^([0-9]+)\s+")
             current_kpoint = 0
             current_band = 0
             spin = Spin.down  # switched to Spin.up for first block
@@ -4209,6 +4907,9 @@ class Procar(MSONable):
             n_ions = None
             weights: NDArray[np.float64] | None = None
             headers = None
+            orbitals: list[str] | None = None
+            orbital_indices: list[int] = []
+            ion_positions: NDArray[np.int64] | None = None  # position of each ion in the loaded ions, or -1
             data: dict[Spin, NDArray] = {}
             eigenvalues: dict[Spin, NDArray] | None = None
             occupancies: dict[Spin, NDArray] | None = None
@@ -4245,15 +4946,53 @@ class Procar(MSONable):
                 raise ValueError("Mismatch in SOC setting (LSORBIT) in supplied PROCARs!")
             self.is_soc = is_soc
 
+            def store_projections(kpoint_bands: list[tuple[int, list[list[str]]]]) -> None:
+                """Convert the projection lines of all bands of the current k-point,
+                in one block per kind: 0 for the projections, 1-3 for the x, y and z
+                projections with SOC and 4 for the phase factors.
+                """
+                for kind in range(5):
+                    blocks = [(band, rows[kind]) for band, rows in kpoint_bands if rows[kind]]
+                    if not blocks:
+                        continue
+                    values = _parse_vasp_rows([row for _band, rows in blocks for row in rows])
+                    band_indices = np.repeat([band for band, _rows in blocks], [len(rows) for _band, rows in blocks])
+                    n_orbitals = len(headers)  # type:ignore[arg-type]
+                    if kind < 4:
+                        target = data[spin] if kind == 0 else xyz_data["xyz"[kind - 1]]  # type:ignore[index]
+                        projections = values[:, 1 : n_orbitals + 1]
+                    elif values.shape[1] > n_orbitals + 1:  # note no xyz projected phase factors with SOC
+                        # New format of PROCAR (VASP 5.4.4), real and imaginary parts side by side
+                        target = phase_factors[spin]  # type:ignore[index]
+                        projections = values[:, 1 : 2 * n_orbitals + 1 : 2] + 1j * values[:, 2 : 2 * n_orbitals + 2 : 2]
+                    else:
+                        # Old format of PROCAR (VASP 5.4.1 and before), real and imaginary parts on alternate lines
+                        target = phase_factors[spin]  # type:ignore[index]
+                        projections = values[0::2, 1:] + 1j * values[1::2, 1:]
+                        values, band_indices = values[0::2], band_indices[0::2]
+
+                    ion_indices = ion_positions[values[:, 0].astype(int) - 1]  # type:ignore[index]
+                    loaded = ion_indices >= 0
+                    target[current_kpoint, band_indices[loaded], ion_indices[loaded]] = projections[loaded][
+                        :, orbital_indices
+                    ]
+
             skipping_kpoint = False  # true when skipping projections for a previously-parsed kpoint
-            ion_line_count = 0  # printed twice when phase factors present
             proj_data_parsed_for_band = 0  # 0 for non-SOC, 1-4 for SOC/phase factors
+            kind = 0  # kind of the projection lines being read, see store_projections
+            # band index and projection lines of each kind of the bands of the current k-point
+            kpoint_bands: list[tuple[int, list[list[str]]]] = []
             for line in file:  # type:ignore[assignment]
                 line = line.strip()  # type:ignore[assignment]
-                if ion_expr.match(line):
-                    ion_line_count += 1
-
-                if kpoint_expr.match(line):
+                if line[:1].isdigit():  # projections of an ion
+                    if not skipping_kpoint:
+                        if headers is None:
+                            raise ValueError("headers is None")
+                        kpoint_bands[-1][1][kind].append(line)
+
+                elif kpoint_expr.match(line):
+                    store_projections(kpoint_bands)
+                    kpoint_bands = []
                     kvec = self._parse_kpoint_line(line)
                     match = kpoint_expr.match(line)
                     current_kpoint = int(match[1]) - 1  # type: ignore[index]
@@ -4280,64 +5019,45 @@ class Procar(MSONable):
                     continue
 
                 elif band_expr.match(line):
-                    ion_line_count = 0  # printed a second time when phase factors present
                     match = band_expr.match(line)
                     current_band = int(match[1]) - 1  # type: ignore[index]
                     tokens = line.split()
                     eigenvalues[spin][current_kpoint, current_band] = float(tokens[4])  # type: ignore[index]
                     occupancies[spin][current_kpoint, current_band] = float(tokens[-1])  # type: ignore[index]
                     # keep track of parsed projections for each band (1x w/non-SOC, 4x w/SOC):
-                    proj_data_parsed_for_band = 0
+                    proj_data_parsed_for_band = kind = 0
+                    kpoint_bands.append((current_band, [[], [], [], [], []]))
 
                 elif headers is None and ion_expr.match(line):
                     headers = line.split()
                     headers.pop(0)
                     headers.pop(-1)
 
-                    data = defaultdict(lambda: np.zeros((n_kpoints, n_bands, n_ions, len(headers))))  # type:ignore[arg-type, type-var]
+                    orbitals = headers if self._orbital_selection is None else self._orbital_selection
+                    if unknown := set(orbitals) - set(headers):
+                        raise ValueError(f"Unknown orbitals {sorted(unknown)}, expected some of {headers}")
+                    orbital_indices = [headers.index(orbital) for orbital in orbitals]
+                    ions = range(n_ions) if self.ions is None else self.ions  # type:ignore[arg-type]
+                    if not set(ions) <= set(range(n_ions)):  # type:ignore[arg-type]
+                        raise ValueError(f"Ion indices must be in the range 0 to {n_ions - 1}, got {ions}")  # type:ignore[operator]
+                    ion_positions = np.full(n_ions, -1)  # type:ignore[arg-type]
+                    ion_positions[list(ions)] = np.arange(len(ions))
+                    shape = (n_kpoints, n_bands, len(ions), len(orbitals))
+
+                    data = defaultdict(lambda: np.zeros(shape, dtype=self.dtype))  # type:ignore[arg-type, type-var]
                     phase_factors = defaultdict(
                         lambda: np.full(  # type:ignore[type-var]
-                            (n_kpoints, n_bands, n_ions, len(headers)),  # type:ignore[arg-type]
+                            shape,  # type:ignore[arg-type]
                             np.nan,
-                            dtype=np.complex128,
+                            dtype=np.result_type(self.dtype, np.complex64),
                         )
                     )
                     if self.is_soc:  # dict keys are now "x", "y", "z" rather than Spin.up/down
-                        xyz_data = defaultdict(lambda: np.zeros((n_kpoints, n_bands, n_ions, len(headers))))  # type:ignore[arg-type, type-var]
-
-                elif expr.match(line):
-                    tokens = line.split()
-                    index = int(tokens.pop(0)) - 1
-                    if headers is None:
-                        raise ValueError("headers is None")
-                    num_data = np.array([float(t) for t in tokens[: len(headers)]])
-                    if phase_factors is None:
-                        raise ValueError("phase_factors is None")
-
-                    if proj_data_parsed_for_band == 0:
-                        data[spin][current_kpoint, current_band, index, :] = num_data
-
-                    elif self.is_soc and proj_data_parsed_for_band < 4:
-                        proj_direction = {1: "x", 2: "y", 3: "z"}[proj_data_parsed_for_band]
-                        if xyz_data is None:
-                            raise ValueError(f"{xyz_data=}")
-                        xyz_data[proj_direction][current_kpoint, current_band, index, :] = num_data
-
-                    elif len(tokens) > len(headers):  # note no xyz projected phase factors with SOC
-                        # New format of PROCAR (VASP 5.4.4)
-                        num_data = np.array([float(t) for t in tokens[: 2 * len(headers)]])
-                        for orb in range(len(headers)):
-                            phase_factors[spin][current_kpoint, current_band, index, orb] = complex(
-                                num_data[2 * orb], num_data[2 * orb + 1]
-                            )
-                    elif np.isnan(phase_factors[spin][current_kpoint, current_band, index, 0]):
-                        # Old format of PROCAR (VASP 5.4.1 and before)
-                        phase_factors[spin][current_kpoint, current_band, index, :] = num_data
-                    else:
-                        phase_factors[spin][current_kpoint, current_band, index, :] += 1j * num_data
+                        xyz_data = defaultdict(lambda: np.zeros(shape, dtype=self.dtype))  # type:ignore[arg-type, type-var]
 
                 elif total_expr.match(line):
                     proj_data_parsed_for_band += 1
+                    kind = proj_data_parsed_for_band if self.is_soc and proj_data_parsed_for_band < 4 else 4
 
                 elif preamble_expr.match(line):
                     match = preamble_expr.match(line)
@@ -4354,10 +5074,12 @@ class Procar(MSONable):
                     if self.nions is not None and self.nions != n_ions:  # parsing multiple PROCARs but nions mismatch!
                         raise ValueError(f"Mismatch in number of ions in supplied PROCARs: ({n_ions} vs {self.nions})!")
 
+            store_projections(kpoint_bands)
+
             self.nions = n_ions  # attributes that should be consistent between multiple files are set here
-            if self.orbitals is not None and self.orbitals != headers:  # multiple PROCARs but orbitals mismatch!
-                raise ValueError(f"Mismatch in orbital headers in supplied PROCARs: {headers} vs {self.orbitals}!")
-            self.orbitals = headers  # type:ignore[assignment]
+            if self.orbitals is not None and self.orbitals != orbitals:  # multiple PROCARs but orbitals mismatch!
+                raise ValueError(f"Mismatch in orbital headers in supplied PROCARs: {orbitals} vs {self.orbitals}!")
+            self.orbitals = orbitals  # type:ignore[assignment]
             if self.nspins is not None and self.nspins != len(data):  # parsing multiple PROCARs but nspins mismatch!
                 raise ValueError("Mismatch in number of spin channels in supplied PROCARs!")
             self.nspins = len(data)
@@ -4407,11 +5129,12 @@ class Procar(MSONable):
         for spin in self.data:
             elem_proj[spin] = [[defaultdict(float) for _ in range(self.nkpoints)] for _ in range(self.nbands)]
 
-        for iat in range(self.nions):
+        ions = range(self.nions) if self.ions is None else self.ions
+        for ion_pos, iat in enumerate(ions):
             name = structure.species[iat].symbol
             for spin, data in self.data.items():
                 for kpoint, band in itertools.product(range(self.nkpoints), range(self.nbands)):
-                    elem_proj[spin][band][kpoint][name] += np.sum(data[kpoint, band, iat, :])
+                    elem_proj[spin][band][kpoint][name] += np.sum(data[kpoint, band, ion_pos, :])
 
         return elem_proj
 
@@ -4435,11 +5158,12 @@ class Procar(MSONable):
         if self.orbitals is None:
             raise ValueError("orbitals is None")
         orbital_index = self.orbitals.index(orbital)
+        ion_pos = atom_index if self.ions is None else self.ions.index(atom_index)
 
         if self.data is None:
             raise ValueError("data is None")
         return {
-            spin: np.sum(data[:, :, atom_index, orbital_index] * self.weights[:, None])  # type: ignore[call-overload]
+            spin: np.sum(data[:, :, ion_pos, orbital_index] * self.weights[:, None])  # type: ignore[call-overload]
             for spin, data in self.data.items()
         }
 
@@ -4967,6 +5691,36 @@ def get_adjusted_fermi_level(
 # contrast when you write UNK files, the record length is written at the
 # beginning of each record. This allows you to use scipy.io.FortranFile. In
 # fortran, this amounts to using open(..., form='unformatted') [i.e. no recl=].
+class _LazyWavecarCoeffs(Sequence):
+    """Plane-wave coefficients of a Wavecar opened with lazy=True, indexed like
+    Wavecar.coeffs, i.e. [kpoint][band] or [spin][kpoint][band] for ISPIN = 2. The
+    coefficients of a band are read from the memory-mapped WAVECAR when it is indexed.
+    """
+
+    def __init__(self, wavecar: Wavecar, index: tuple[int, ...] = ()) -> None:
+        self._wavecar = wavecar
+        self._index = index
+        shape = (wavecar.spin, wavecar.nk, wavecar.nb) if wavecar.spin == 2 else (wavecar.nk, wavecar.nb)
+        self._shape = tuple(map(int, shape))
+
+    def __len__(self) -> int:
+        return self._shape[len(self._index)]
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(len(self))[idx]]
+        idx = range(len(self))[idx]
+        index = (*self._index, idx)
+        if len(index) < len(self._shape):
+            return type(self)(self._wavecar, index)
+        if len(index) == 2:
+            index = (0, *index)
+        return self._wavecar._read_coeffs(*index)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(shape={self._shape[len(self._index) :]})"
+
+
 class Wavecar:
     """
     Container for the (pseudo-) wavefunctions from VASP.
@@ -5009,7 +5763,8 @@ class Wavecar:
             For non-spin-polarized, the first index corresponds to the kpoint and the second corresponds to the band
             (e.g. self.coeffs[kp][b] corresponds to k-point kp and band b). For spin-polarized calculations,
             the first index is for the spin. If the calculation was non-collinear, then self.coeffs[kp][b] will have
-            two columns (one for each component of the spinor).
+            two columns (one for each component of the spinor). With lazy=True, this is a sequence that is
+            indexed the same way, but reads the coefficients of a band from the file only when it is accessed.
 
     Acknowledgments:
         This code is based upon the Fortran program, WaveTrans, written by
@@ -5026,6 +5781,7 @@ class Wavecar:
         verbose: bool = False,
         precision: Literal["normal", "accurate"] = "normal",
         vasp_type: Literal["std", "gam", "ncl"] | None = None,
+        lazy: bool = False,
     ) -> None:
         """Extract information from the given WAVECAR.
 
@@ -5036,6 +5792,10 @@ class Wavecar:
                 accurate), only the first letter matters.
             vasp_type (str): determines the VASP type that is used, allowed
                 values are {'std', 'gam', 'ncl'} (only first letter is required).
+            lazy (bool): Whether to only read the header of each k-point and memory-map
+                the file, so that the coefficients of a band are read when they are
+                accessed. This allows WAVECARs larger than the available memory to be
+                used with fft_mesh, evaluate_wavefunc and get_parchg. Defaults to False.
         """
         self.filename = filename
         valid_types = {"std", "gam", "ncl"}
@@ -5049,6 +5809,8 @@ class Wavecar:
         # c = 0.26246582250210965422
         # 2m/hbar^2 in agreement with VASP
         self._C = 0.262465831
+        # Indices of the G-points of each k-point in the flattened FFT mesh, see _get_mesh_indices
+        self._mesh_indices: dict[tuple[int, tuple[int, ...], bool], NDArray[np.intp]] = {}
         with open(self.filename, "rb") as file:
             # Read the header information
             recl, spin, rtag = np.fromfile(file, dtype=np.float64, count=3).astype(int)
@@ -5056,6 +5818,7 @@ class Wavecar:
                 print(f"{recl=}, {spin=}, {rtag=}")
             recl8 = int(recl / 8)
             self.spin = spin
+            self._recl = recl
 
             # Make sure we have correct precision
             valid_rtags = {45200, 45210, 53300, 53310}
@@ -5112,14 +5875,22 @@ class Wavecar:
             # Read records
             self.Gpoints = [None for _ in range(self.nk)]
             self.kpoints = []
+            # Offsets of the first coefficient record and number of plane waves of each k-point
+            self._coeff_offsets = np.zeros((spin, self.nk), dtype=np.int64)
+            self._nplanes = np.zeros(self.nk, dtype=np.int64)
+            self._extra_coeff_inds: list[NDArray[np.int64]] = [np.array([], dtype=np.int64)] * self.nk
             if spin == 2:
-                self.coeffs: list[list[list[None]]] | list[list[None]] = [
+                # Nested lists of coefficients, indexed by (spin,) kpoint and band,
+                # or a _LazyWavecarCoeffs sequence reading them on access
+                self.coeffs: Sequence[Any] = [
                     [[None for _ in range(self.nb)] for _ in range(self.nk)] for _ in range(spin)
                 ]
                 self.band_energy: list = [[] for _ in range(spin)]
             else:
                 self.coeffs = [[None for _ in range(self.nb)] for _ in range(self.nk)]
                 self.band_energy = []
+            if lazy:
+                self.coeffs = _LazyWavecarCoeffs(self)
 
             for i_spin in range(spin):
                 if verbose:
@@ -5177,36 +5948,69 @@ class Wavecar:
                         )
 
                     self.Gpoints[i_nk] = np.array(self.Gpoints[i_nk] + extra_gpoints, dtype=np.float64)  # type: ignore[arg-type, operator]
+                    self._coeff_offsets[i_spin, i_nk] = file.tell()
+                    self._nplanes[i_nk] = nplane
+                    self._extra_coeff_inds[i_nk] = np.array(extra_coeff_inds, dtype=np.int64)
+
+                    if rtag in (45200, 53300):
+                        self._coeff_dtype: type[np.complexfloating] = np.complex64
+                    elif rtag in (45210, 53310):
+                        # TODO: This should handle double precision coefficients,
+                        # but I don't have a WAVECAR to test it with
+                        self._coeff_dtype = np.complex128
+                    else:
+                        raise RuntimeError("Invalid rtag value.")
+
+                    if lazy:
+                        if nplane * np.dtype(self._coeff_dtype).itemsize > recl:
+                            raise ValueError(f"Coefficients of {i_nk=} exceed the record length {recl}")
+                        # Skip the coefficient records, one per band
+                        file.seek(self.nb * recl, os.SEEK_CUR)
+                        continue
 
                     # Extract coefficients
                     for inb in range(self.nb):
-                        if rtag in (45200, 53300):
-                            data = np.fromfile(file, dtype=np.complex64, count=nplane)
-                            np.fromfile(file, dtype=np.float64, count=recl8 - nplane)
-                        elif rtag in (45210, 53310):
-                            # TODO: This should handle double precision coefficients,
-                            # but I don't have a WAVECAR to test it with
-                            data = np.fromfile(file, dtype=np.complex128, count=nplane)
-                            np.fromfile(file, dtype=np.float64, count=recl8 - 2 * nplane)
+                        data = np.fromfile(file, dtype=self._coeff_dtype, count=nplane)
+                        np.fromfile(file, dtype=np.uint8, count=recl - data.nbytes)
+                        if spin == 2:
+                            self.coeffs[i_spin][i_nk][inb] = self._reconstruct_coeffs(data, i_nk)
                         else:
-                            raise RuntimeError("Invalid rtag value.")
+                            self.coeffs[i_nk][inb] = self._reconstruct_coeffs(data, i_nk)
 
-                        extra_coeffs = []
-                        if len(extra_coeff_inds) > 0:
-                            # Reconstruct extra coefficients missing from gamma-only executable WAVECAR
-                            for G_ind in extra_coeff_inds:
-                                # No idea where this factor of sqrt(2) comes from,
-                                # but empirically it appears to be necessary
-                                data[G_ind] /= np.sqrt(2)
-                                extra_coeffs.append(np.conj(data[G_ind]))
+        if lazy:
+            self._mmap = np.memmap(self.filename, dtype=np.uint8, mode="r")
 
-                        if spin == 2:
-                            self.coeffs[i_spin][i_nk][inb] = np.array(list(data) + extra_coeffs, dtype=np.complex64)  # type: ignore[index]
-                        else:
-                            self.coeffs[i_nk][inb] = np.array(list(data) + extra_coeffs, dtype=np.complex128)
+    def _reconstruct_coeffs(self, data: NDArray, kpoint: int) -> NDArray:
+        """Get the coefficients of a band from those stored in the WAVECAR, which
+        lack the coefficients of -G for gamma-only executables and hold both spinor
+        components for noncollinear ones.
 
-                        if self.vasp_type is not None and self.vasp_type.lower()[0] == "n":
-                            self.coeffs[i_nk][inb].shape = (2, nplane // 2)  # type: ignore[union-attr]
+        Args:
+            data (NDArray): Coefficients of the band in the WAVECAR. Modified in place.
+            kpoint (int): Index of the k-point of the band.
+
+        Returns:
+            NDArray: The coefficients, as in Wavecar.coeffs.
+        """
+        extra_coeff_inds = self._extra_coeff_inds[kpoint]
+        # Reconstruct extra coefficients missing from gamma-only executable WAVECAR
+        # No idea where this factor of sqrt(2) comes from, but empirically it appears to be necessary
+        data[extra_coeff_inds] /= np.sqrt(2)
+        coeffs = np.concatenate(
+            [data, np.conj(data[extra_coeff_inds])],
+            dtype=np.complex64 if self.spin == 2 else np.complex128,
+        )
+
+        if self.vasp_type is not None and self.vasp_type.lower()[0] == "n":
+            coeffs.shape = (2, len(data) // 2)
+        return coeffs
+
+    def _read_coeffs(self, spin: int, kpoint: int, band: int) -> NDArray:
+        """Read the coefficients of a band from the memory-mapped WAVECAR, for lazy=True."""
+        offset = self._coeff_offsets[spin, kpoint] + band * self._recl
+        n_bytes = self._nplanes[kpoint] * np.dtype(self._coeff_dtype).itemsize
+        data = np.array(self._mmap[offset : offset + n_bytes].view(self._coeff_dtype))
+        return self._reconstruct_coeffs(data, kpoint)
 
     def _generate_nbmax(self) -> None:
         """Helper function to determine maximum number of b vectors for
@@ -5331,14 +6135,69 @@ class Wavecar:
         v = self.Gpoints[kpoint] + self.kpoints[kpoint]
         u = np.dot(np.dot(v, self.b), r)
 
-        if self.vasp_type.lower()[0] == "n":
-            c = self.coeffs[kpoint][band][spinor, :]  # type: ignore[call-overload, index]
-        elif self.spin == 2:
-            c = self.coeffs[spin][kpoint][band]  # type: ignore[index]
-        else:
-            c = self.coeffs[kpoint][band]
+        c = self._get_band_coeffs(kpoint, band, spin, spinor)
         return np.sum(np.dot(c, np.exp(1j * u, dtype=np.complex64))) / np.sqrt(self.vol)
 
+    def _get_band_coeffs(self, kpoint: int, band: int, spin: int = 0, spinor: int = 0) -> NDArray:
+        """Get the coefficients of a band, of the given spinor component for
+        noncollinear WAVECARs and of the given spin for spin-polarized ones.
+        """
+        if self.vasp_type is None:
+            raise RuntimeError("vasp_type cannot be None.")
+
+        if self.vasp_type.lower()[0] == "n":
+            return self.coeffs[kpoint][band][spinor, :]
+        if self.spin == 2:
+            return self.coeffs[spin][kpoint][band]
+        return self.coeffs[kpoint][band]
+
+    def _get_mesh_indices(self, kpoint: int, ng: NDArray, shift: bool) -> NDArray[np.intp]:
+        """Get the indices of the G-points of a k-point in the flattened FFT mesh of
+        shape ng, which are cached as they are the same for all bands.
+
+        Args:
+            kpoint (int): Index of the k-point.
+            ng (NDArray): Shape of the FFT mesh.
+            shift (bool): Whether the zero frequency is at index (0, 0, 0) rather than
+                centered, see fft_mesh.
+
+        Returns:
+            NDArray: Index of each G-point.
+        """
+        key = (kpoint, tuple(map(int, ng)), shift)
+        if key not in self._mesh_indices:
+            # Centered mesh, where negative indices wrap around as in fft_mesh
+            indices = (self.Gpoints[kpoint].astype(int) + (ng / 2).astype(int)) % ng  # type: ignore[union-attr]
+            if shift:
+                # Equivalent to np.fft.ifftshift of the centered mesh
+                indices = (indices - ng // 2) % ng
+            self._mesh_indices[key] = np.ravel_multi_index(tuple(indices.T), tuple(ng))
+        return self._mesh_indices[key]
+
+    def _fft_meshes(
+        self,
+        kpoint: int,
+        bands: Sequence[int],
+        ng: NDArray,
+        *,
+        spin: int = 0,
+        spinor: int = 0,
+        shift: bool = True,
+    ) -> NDArray:
+        """Place the coefficients of several bands at a k-point onto a stack of FFT
+        meshes of shape ng, see fft_mesh.
+
+        Returns:
+            NDArray: Array of shape (len(bands), *ng).
+        """
+        indices = self._get_mesh_indices(kpoint, ng, shift)
+        meshes = np.zeros((len(bands), np.prod(ng)), dtype=np.complex128)
+        for mesh, band in zip(meshes, bands, strict=True):
+            coeffs = self._get_band_coeffs(kpoint, band, spin, spinor)
+            n_coeffs = min(len(coeffs), len(indices))
+            mesh[indices[:n_coeffs]] = coeffs[:n_coeffs]
+        return meshes.reshape(len(bands), *ng)
+
     def fft_mesh(
         self,
         kpoint: int,
@@ -5370,35 +6229,24 @@ class Wavecar:
         Returns:
             a numpy ndarray representing the 3D mesh of coefficients
         """
-        if self.vasp_type is None:
-            raise RuntimeError("vasp_type cannot be None.")
-
-        if self.vasp_type.lower()[0] == "n":
-            tcoeffs = self.coeffs[kpoint][band][spinor, :]  # type: ignore[call-overload, index]
-        elif self.spin == 2:
-            tcoeffs = self.coeffs[spin][kpoint][band]  # type: ignore[index]
-        else:
-            tcoeffs = self.coeffs[kpoint][band]
-
-        mesh = np.zeros(tuple(self.ng), dtype=np.complex128)
-        for gp, coeff in zip(self.Gpoints[kpoint], tcoeffs, strict=False):  # type: ignore[call-overload]
-            t = tuple(gp.astype(int) + (self.ng / 2).astype(int))
-            mesh[t] = coeff
-
-        return np.fft.ifftshift(mesh) if shift else mesh
+        return self._fft_meshes(kpoint, [band], self.ng, spin=spin, spinor=spinor, shift=shift)[0]
 
     def get_parchg(
         self,
         poscar: Poscar,
-        kpoint: int,
-        band: int,
+        kpoint: int | Sequence[int],
+        band: int | Sequence[int],
         spin: int | None = None,
         spinor: int | None = None,
         phase: bool = False,
         scale: int = 2,
+        *,
+        weights: Sequence[float] | None = None,
+        chunk_size: int | None = None,
+        n_workers: int = 1,
     ) -> Chgcar:
         """Generate a Chgcar object, which is the charge density of the specified
-        wavefunction.
+        wavefunction, or the sum of those of several bands and k-points.
 
         This function generates a Chgcar object with the charge density of the
         wavefunction specified by band and kpoint (and spin, if the WAVECAR
@@ -5408,6 +6256,10 @@ class Wavecar:
         sign of the wavefunction at that point in space. A warning is generated
         if the phase tag is on and the chosen kpoint is not Gamma.
 
+        For several bands or k-points, the densities are summed, with the k-points
+        weighted by weights. The bands are placed on stacks of FFT meshes of up to
+        chunk_size bands, which are transformed together.
+
         Note: Augmentation from the PAWs is NOT included in this function. The
         maximal charge density will differ from the PARCHG from VASP, but the
         qualitative shape of the charge density will match.
@@ -5415,8 +6267,10 @@ class Wavecar:
         Args:
             poscar (pymatgen.io.vasp.inputs.Poscar): Poscar object that has the
                 structure associated with the WAVECAR file
-            kpoint (int): the index of the kpoint for the wavefunction
-            band (int): the index of the band for the wavefunction
+            kpoint (int | Sequence[int]): the index of the kpoint for the wavefunction,
+                or the indices of several kpoints
+            band (int | Sequence[int]): the index of the band for the wavefunction,
+                or the indices of several bands
             spin (int): optional argument to specify the spin. If the Wavecar
                 has ISPIN = 2, spin is None generates a Chgcar with total spin
                 and magnetization, and spin == {0, 1} specifies just the spin
@@ -5429,56 +6283,107 @@ class Wavecar:
                 wavefunctions.
             scale (int): scaling for the FFT grid. The default value of 2 is at
                 least as fine as the VASP default.
+            weights (Sequence[float] | None): weight of each kpoint, e.g. the
+                normalized k-point weights of the calculation for a VASP-like
+                band-decomposed density. Defaults to None, which weights all
+                kpoints by 1.
+            chunk_size (int | None): maximum number of bands that are transformed
+                at once, which need chunk_size times the memory of a single FFT mesh.
+                Defaults to None, which chunks up to 2**21 mesh points (32 MB), as
+                larger stacks are no faster to transform.
+            n_workers (int): number of threads that transform chunks concurrently.
+                Defaults to 1.
 
         Returns:
             A Chgcar object.
         """
-        if phase and not np.allclose(self.kpoints[kpoint], 0.0):
+        kpoints = [kpoint] if isinstance(kpoint, int | np.integer) else list(kpoint)
+        bands = [band] if isinstance(band, int | np.integer) else list(band)
+        if not kpoints or not bands:
+            raise ValueError("At least one kpoint and one band are required")
+        weights = [1.0] * len(kpoints) if weights is None else list(weights)
+        if len(weights) != len(kpoints):
+            raise ValueError(f"Got {len(weights)} weights for {len(kpoints)} kpoints")
+
+        if phase and not all(np.allclose(self.kpoints[idx], 0.0) for idx in kpoints):
             warnings.warn(
                 "phase is True should only be used for the Gamma kpoint! I hope you know what you're doing!",
                 stacklevel=2,
             )
 
-        # Scaling of ng for the fft grid, need to restore value at the end
-        temp_ng = self.ng
-        self.ng = self.ng * scale
-        N = np.prod(self.ng)
+        # Scaling of ng for the fft grid
+        ng = self.ng * scale
+        density_kwargs = {"ng": ng, "chunk_size": chunk_size, "n_workers": n_workers}
 
         data = {}
         if self.spin == 2:
             if spin is not None:
-                wfr = np.fft.ifftn(self.fft_mesh(kpoint, band, spin=spin)) * N
-                den = np.abs(np.conj(wfr) * wfr)
-                if phase:
-                    den = np.sign(np.real(wfr)) * den
-                data["total"] = den
+                data["total"] = self._get_density(kpoints, bands, weights, spin=spin, phase=phase, **density_kwargs)
             else:
-                wfr = np.fft.ifftn(self.fft_mesh(kpoint, band, spin=0)) * N
-                denup = np.abs(np.conj(wfr) * wfr)
-                wfr = np.fft.ifftn(self.fft_mesh(kpoint, band, spin=1)) * N
-                dendn = np.abs(np.conj(wfr) * wfr)
+                denup = self._get_density(kpoints, bands, weights, spin=0, **density_kwargs)
+                dendn = self._get_density(kpoints, bands, weights, spin=1, **density_kwargs)
                 data["total"] = denup + dendn
                 data["diff"] = denup - dendn
         else:
-            if spinor is not None:
-                wfr = np.fft.ifftn(self.fft_mesh(kpoint, band, spinor=spinor)) * N
-                den = np.abs(np.conj(wfr) * wfr)
-            else:
-                wfr = np.fft.ifftn(self.fft_mesh(kpoint, band, spinor=0)) * N
-                wfr_t = np.fft.ifftn(self.fft_mesh(kpoint, band, spinor=1)) * N
-                den = np.abs(np.conj(wfr) * wfr)
-                den += np.abs(np.conj(wfr_t) * wfr_t)
-
             if self.vasp_type is None:
                 raise RuntimeError("vasp_type cannot be None.")
 
-            if phase and (self.vasp_type.lower()[0] != "n" or spinor is not None):
-                den = np.sign(np.real(wfr)) * den
+            if spinor is not None:
+                den = self._get_density(kpoints, bands, weights, spinor=spinor, phase=phase, **density_kwargs)
+            elif self.vasp_type.lower()[0] == "n":
+                den = self._get_density(kpoints, bands, weights, spinor=0, **density_kwargs)
+                den += self._get_density(kpoints, bands, weights, spinor=1, **density_kwargs)
+            else:
+                # fft_mesh ignores the spinor here, so the density is that of both spinors
+                den = 2 * self._get_density(kpoints, bands, weights, phase=phase, **density_kwargs)
             data["total"] = den
 
-        self.ng = temp_ng
         return Chgcar(poscar, data)
 
+    def _get_density(
+        self,
+        kpoints: list[int],
+        bands: list[int],
+        weights: list[float],
+        *,
+        ng: NDArray,
+        spin: int = 0,
+        spinor: int = 0,
+        phase: bool = False,
+        chunk_size: int | None = None,
+        n_workers: int = 1,
+    ) -> NDArray:
+        """Sum the densities |psi|^2 of bands at kpoints on an FFT grid of shape ng, for
+        get_parchg. The densities are multiplied by the sign of the real part of the
+        wavefunction if phase, and by the weight of their kpoint.
+        """
+        n_grid = np.prod(ng)
+        chunk_size = chunk_size or max(1, 2**21 // n_grid)
+
+        def get_chunk_density(chunk: tuple[int, float, list[int]]) -> NDArray:
+            kpoint, weight, chunk_bands = chunk
+            meshes = self._fft_meshes(kpoint, chunk_bands, ng, spin=spin, spinor=spinor)
+            wfr = np.fft.ifftn(meshes, axes=(1, 2, 3)) * n_grid
+            den = np.abs(np.conj(wfr) * wfr)
+            if phase:
+                den = np.sign(np.real(wfr)) * den
+            if weight != 1:
+                den *= weight
+            return den.sum(axis=0)
+
+        chunks = [
+            (kpoint, weight, bands[start : start + chunk_size])
+            for kpoint, weight in zip(kpoints, weights, strict=True)
+            for start in range(0, len(bands), chunk_size)
+        ]
+        density = np.zeros(tuple(ng))
+        with ThreadPoolExecutor(n_workers) as executor:
+            # Transform n_workers chunks at a time to bound the memory
+            for start in range(0, len(chunks), n_workers):
+                for chunk_density in executor.map(get_chunk_density, chunks[start : start + n_workers]):
+                    density += chunk_density
+        return density
+
     def write_unks(self, directory: PathLike) -> None:
         """Write the UNK files to the given directory.
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import numpy as np
+import pytest
 from numpy.testing import assert_allclose
 from plotly.graph_objects import Figure
 from pytest import approx
@@ -308,7 +309,10 @@ class TestChemicalPotentialDiagram(MatSciTest):
         for formula, domain in formal_domains.items():
             dom = self.cpd_ternary_formal.domains[formula]
             dom = dom.round(6)  # to get rid of numerical errors from qhull
-            assert_allclose(dom, domain, atol=1e-5)
+            actual_domain_sorted = dom[np.lexsort((dom[:, 2], dom[:, 1], dom[:, 0]))]
+            domain = np.array(domain).round(6)
+            domain_sorted = domain[np.lexsort((domain[:, 2], domain[:, 1], domain[:, 0]))]
+            assert_allclose(actual_domain_sorted, domain_sorted, atol=1e-5)
 
     def test_formal_chempots_get_plot(self):
         elems = [Element("Fe"), Element("O")]
@@ -320,3 +324,29 @@ class TestChemicalPotentialDiagram(MatSciTest):
 
         assert max(filter(bool, fig_2d.data[0].y)) == approx(-4.2582781)
         assert max(filter(bool, fig_2d_formal.data[0].y)) == approx(0)
+
+    def test_get_slice_domains(self):
+        slice_domains = self.cpd_ternary_formal.get_slice_domains({"Li": -3})
+        # cached, but callers get their own dict of read-only arrays
+        cached_domains = self.cpd_ternary_formal.get_slice_domains({Element("Li"): -3.0})
+        assert cached_domains is not slice_domains
+        assert all(cached_domains[formula] is pts for formula, pts in slice_domains.items())
+        assert not any(pts.flags.writeable for pts in slice_domains.values())
+
+        li_idx = self.cpd_ternary_formal.elements.index(Element("Li"))
+        hyperplanes = self.cpd_ternary_formal.hyperplanes
+        for formula, pts in slice_domains.items():
+            assert_allclose(pts[:, li_idx], -3)
+            # every vertex lies on the hyperplane of its entry and below all others
+            entry = self.cpd_ternary_formal.entry_dict[formula]
+            plane = hyperplanes[self.cpd_ternary_formal.hyperplane_entries.index(entry)]
+            assert_allclose(pts @ plane[:-1] + plane[-1], 0, atol=1e-6)
+            assert np.all(pts @ hyperplanes[:, :-1].T + hyperplanes[:, -1] <= 1e-6)
+
+        assert "Li" not in slice_domains
+        assert "Li2FeO3" in slice_domains
+        # only Li-free phases remain at low enough Li chemical potential
+        assert set(self.cpd_ternary_formal.get_slice_domains({"Li": -10})) == {"Fe", "FeO", "Fe2O3", "Fe3O4", "O2"}
+
+        with pytest.raises(ValueError, match="At least two elements must have free chemical potentials"):
+            self.cpd_ternary_formal.get_slice_domains({"Li": -3, "Fe": -1})
@@ -440,6 +440,34 @@ class TestInterfaceReaction:
         for inter_react, expected in zip(self.irs, answer, strict=False):
             assert_allclose(inter_react.minimum, expected, atol=1e-7)
 
+    def test_get_kinks_batch(self):
+        irs = [ir for ir in self.irs if not ir.grand]
+        for norm, use_hull_energy in [(False, False), (True, False), (False, True), (True, True)]:
+            pairs = [(ir.c1_original, ir.c2_original) for ir in irs]
+            expected = [
+                InterfacialReactivity(c1, c2, self.pd, norm=norm, use_hull_energy=use_hull_energy) for c1, c2 in pairs
+            ]
+            for n_jobs in (1, 2):
+                all_kinks = InterfacialReactivity.get_kinks_batch(
+                    pairs, self.pd, norm=norm, use_hull_energy=use_hull_energy, n_jobs=n_jobs
+                )
+                for kinks, ir in zip(all_kinks, expected, strict=True):
+                    expected_kinks = ir.get_kinks()
+                    assert len(kinks) == len(expected_kinks)
+                    for kink, expected_kink in zip(kinks, expected_kinks, strict=True):
+                        assert kink[0] == expected_kink[0]
+                        assert kink[1:3] == pytest.approx(expected_kink[1:3])
+                        assert kink[3] == expected_kink[3]
+                        assert kink[4] == pytest.approx(expected_kink[4])
+
+                minima = InterfacialReactivity.get_minimum_batch(
+                    pairs, self.pd, norm=norm, use_hull_energy=use_hull_energy, n_jobs=n_jobs
+                )
+                assert_allclose(minima[:, 1], [ir.minimum[1] for ir in expected], atol=1e-7)
+
+        with pytest.raises(TypeError, match="Batch screening is only implemented"):
+            InterfacialReactivity.get_kinks_batch([(Composition("Li2O2"), Composition("Li"))], self.gpd)
+
     def test_get_no_mixing_energy(self):
         answer = [
             [("MnO2 (eV/f.u.)", 0.0), ("Mn (eV/f.u.)", 0.0)],
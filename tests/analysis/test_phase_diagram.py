@@ -15,6 +15,8 @@ from pytest import approx
 
 from pymatgen.analysis.phase_diagram import (
     CompoundPhaseDiagram,
+    EntryTable,
+    EntryView,
     GrandPotentialPhaseDiagram,
     GrandPotPDEntry,
     PatchedPhaseDiagram,
@@ -310,6 +312,31 @@ class TestPhaseDiagram(MatSciTest):
             assert isinstance(e_ah, Number)
             assert e_ah >= 0
 
+    def test_get_e_above_hull_batch(self):
+        entries = list(self.pd.all_entries)
+        expected = [self.pd.get_e_above_hull(entry) for entry in entries]
+        assert_allclose(self.pd.get_e_above_hull_batch(entries), expected, atol=1e-12)
+
+        bad_entries = [PDEntry("U", 0), PDEntry("Li", -1e6), *entries[:2]]
+        with pytest.raises(ValueError, match="Unable to get decomposition for 1 of 4 compositions"):
+            self.pd.get_e_above_hull_batch(bad_entries)
+        e_above_hull = self.pd.get_e_above_hull_batch(bad_entries, on_error="ignore")
+        assert np.isnan(e_above_hull[:2]).all()
+        assert_allclose(e_above_hull[2:], expected[:2], atol=1e-12)
+        e_above_hull = self.pd.get_e_above_hull_batch(bad_entries[1:], allow_negative=True)
+        assert e_above_hull[0] < -1e5
+
+    def test_get_decomposition_batch(self):
+        comps = [entry.composition for entry in self.pd.all_entries] + [Composition("Li3Fe7O11")]
+        weights = self.pd.get_decomposition_batch(comps)
+        assert weights.shape == (len(comps), len(self.pd.qhull_entries))
+        for idx, comp in enumerate(comps):
+            row = weights[[idx]].tocoo()
+            decomp = {self.pd.qhull_entries[col]: amt for col, amt in zip(row.col, row.data, strict=True)}
+            expected = self.pd.get_decomposition(comp)
+            assert decomp.keys() == expected.keys()
+            assert list(decomp.values()) == approx([expected[entry] for entry in decomp])
+
     def test_get_decomp_and_e_above_hull_on_error(self):
         for method, expected in (
             (self.pd.get_e_above_hull, None),
@@ -649,6 +676,27 @@ class TestPhaseDiagram(MatSciTest):
         assert pd.elements == self.pd.elements
         assert {*pd.as_dict()} == {*self.pd.as_dict()}
 
+    def test_to_from_npz(self):
+        self.pd.to_npz(f"{self.tmp_path}/pd.npz")
+        pd = PhaseDiagram.from_npz(f"{self.tmp_path}/pd.npz")
+        assert pd.elements == self.pd.elements
+        assert_allclose(pd.qhull_data, self.pd.qhull_data)
+
+        # entries are only decoded on access
+        comp = Composition("Li3Fe7O11")
+        assert pd.get_hull_energy_per_atom(comp) == approx(self.pd.get_hull_energy_per_atom(comp))
+        n_decoded = sum(entry is not None for entry in pd.all_entries._store._entries)
+        assert n_decoded <= len(pd.el_refs) + 3 < len(pd.all_entries)
+
+        assert pd.stable_entries == self.pd.stable_entries
+        assert list(pd.all_entries) == list(self.pd.all_entries)
+        for entry in self.pd.all_entries:
+            assert pd.get_e_above_hull(entry) == approx(self.pd.get_e_above_hull(entry))
+        assert PhaseDiagram.from_dict(pd.as_dict()).stable_entries == self.pd.stable_entries
+
+        with pytest.raises(TypeError, match="to_npz\\(\\) is not supported for GrandPotentialPhaseDiagram"):
+            GrandPotentialPhaseDiagram(self.entries, {Element("O"): -5}).to_npz(f"{self.tmp_path}/gpd.npz")
+
     def test_el_refs(self):
         # Create an imitation of pre_computed phase diagram with el_refs keys being
         # tuple[str, PDEntry] instead of tuple[Element, PDEntry].
@@ -665,6 +713,44 @@ class TestPhaseDiagram(MatSciTest):
                 PhaseDiagram(entries=entries)
 
 
+class TestEntryTable:
+    def setup_method(self):
+        self.entries = list(EntrySet.from_csv(f"{TEST_DIR}/pd_entries_test.csv"))
+        self.table = EntryTable.from_entries(self.entries)
+        self.pd = PhaseDiagram(self.entries)
+
+    def test_from_entries(self):
+        assert len(self.table) == len(self.entries)
+        assert self.table.elements == [Element("Li"), Element("Fe"), Element("O")]
+        assert_allclose(self.table.energies_per_atom, [entry.energy_per_atom for entry in self.entries])
+        view = self.table[3]
+        assert isinstance(view, EntryView)
+        assert view is self.table[3]
+        assert view.composition == self.entries[3].composition
+        assert view.energy == approx(self.entries[3].energy)
+        assert view.entry_id is None
+        assert view.as_dict()["@class"] == "ComputedEntry"
+
+        with pytest.raises(ValueError, match="All columns of an EntryTable must have the same length"):
+            EntryTable(["Li"], [[1], [2]], [-1])
+
+    def test_phase_diagram_from_entry_table(self):
+        pd = PhaseDiagram.from_entry_table(self.table)
+        assert pd.all_entries is self.table
+        assert {entry.formula for entry in pd.stable_entries} == {entry.formula for entry in self.pd.stable_entries}
+        assert all(isinstance(entry, EntryView) for entry in pd.stable_entries)
+        comp = Composition("Li3Fe7O11")
+        assert pd.get_hull_energy_per_atom(comp) == approx(self.pd.get_hull_energy_per_atom(comp))
+
+        expected = self.pd.get_e_above_hull_batch(self.entries)
+        assert_allclose(pd.get_e_above_hull_batch(self.table), expected, atol=1e-10)
+        assert_allclose(self.pd.get_e_above_hull_batch(self.table), expected, atol=1e-10)
+
+        no_li = EntryTable.from_entries([entry for entry in self.entries if entry.composition.reduced_formula != "Li"])
+        with pytest.raises(ValueError, match=r"Missing terminal entries for elements \['Li'\]"):
+            PhaseDiagram.from_entry_table(no_li)
+
+
 class TestGrandPotentialPhaseDiagram:
     def setup_method(self):
         self.entries = EntrySet.from_csv(f"{TEST_DIR}/pd_entries_test.csv")
@@ -700,6 +786,31 @@ class TestGrandPotentialPhaseDiagram:
             "Fe-Li GrandPotentialPhaseDiagram with chempots = 'mu_O = -5.0000'5 stable phases: "
         )
 
+    def test_get_grand_potential_stability(self):
+        pd = PhaseDiagram(self.entries)
+        comps = [Composition("LiFe"), Composition("Li2FeO3"), Composition("Fe"), Composition("O2")]
+        mus = [-9, -6, -5, -3.5]  # includes mu_O above the elemental reference
+        stable_entries, hull_energies = pd.get_grand_potential_stability({Element("O"): mus}, comps=comps)
+        assert hull_energies.shape == (len(mus), len(comps))
+        assert np.isnan(hull_energies[:, 3]).all()
+        for idx, mu in enumerate(mus):
+            gpd = GrandPotentialPhaseDiagram(self.entries, {Element("O"): mu})
+            assert set(stable_entries[idx]) == {entry.original_entry for entry in gpd.stable_entries}
+            expected = [
+                gpd.get_hull_energy_per_atom(Composition("LiFe")),
+                gpd.get_hull_energy_per_atom(Composition("Li2Fe")),
+            ]
+            assert_allclose(hull_energies[idx, :2], expected)
+
+        stable_entries, hull_energies = pd.get_grand_potential_stability({"O": [-5, -6], "Li": [-3, -2]}, grid=True)
+        assert hull_energies is None
+        assert len(stable_entries) == 4
+        gpd = GrandPotentialPhaseDiagram(self.entries, {Element("O"): -6, Element("Li"): -2})
+        assert set(stable_entries[3]) == {entry.original_entry for entry in gpd.stable_entries}
+
+        with pytest.raises(ValueError, match="At least one element of the phase diagram must not be open"):
+            pd.get_grand_potential_stability({"O": -5, "Li": -3, "Fe": -8})
+
 
 class TestCompoundPhaseDiagram:
     def setup_method(self):
@@ -773,6 +884,44 @@ class TestPatchedPhaseDiagram:
             decomp_ppd = self.ppd.get_decomposition(comp)
             assert decomp_pd == approx(decomp_ppd)
 
+    def test_n_jobs(self):
+        ppd = PatchedPhaseDiagram(entries=self.entries, n_jobs=2)
+        assert list(ppd.pds) == list(self.ppd.pds)
+        assert ppd.stable_entries == self.ppd.stable_entries
+        for space, pd in ppd.pds.items():
+            serial_pd = self.ppd.pds[space]
+            assert pd.elements == serial_pd.elements
+            assert pd.qhull_entries == serial_pd.qhull_entries
+            assert pd.el_refs == serial_pd.el_refs
+            assert_allclose(pd.qhull_data, serial_pd.qhull_data, rtol=0, atol=0)
+            assert [list(facet) for facet in pd.facets] == [list(facet) for facet in serial_pd.facets]
+
+    def test_to_from_npz(self, tmp_path):
+        self.ppd.to_npz(tmp_path / "ppd.npz", compress=True)
+        ppd = PatchedPhaseDiagram.from_npz(tmp_path / "ppd.npz")
+        assert ppd.spaces == self.ppd.spaces
+        assert ppd.stable_entries == self.ppd.stable_entries
+        assert len(ppd.all_entries) == len(self.ppd.all_entries)
+        for comp in self.novel_comps:
+            assert ppd.get_hull_energy_per_atom(comp) == approx(self.ppd.get_hull_energy_per_atom(comp))
+        for entry in self.entries:
+            assert ppd.get_e_above_hull(entry) == approx(self.ppd.get_e_above_hull(entry))
+
+    def test_get_hull_energy_per_atom_batch(self):
+        comps = [entry.composition for entry in self.entries] + self.novel_comps
+        expected = [self.pd.get_hull_energy_per_atom(comp) for comp in comps]
+        assert_allclose(self.ppd.get_hull_energy_per_atom_batch(comps), expected, atol=1e-7)
+        assert_allclose(self.pd.get_hull_energy_per_atom_batch(comps), expected, atol=1e-12)
+
+        table = EntryTable.from_entries([*self.entries, *self.novel_entries])
+        expected = [self.pd.get_hull_energy_per_atom(entry.composition) for entry in table]
+        assert_allclose(self.ppd.get_hull_energy_per_atom_batch(table), expected, atol=1e-7)
+        assert_allclose(
+            self.ppd.get_e_above_hull_batch(table, allow_negative=True),
+            table.energies_per_atom - expected,
+            atol=1e-7,
+        )
+
     def test_get_phase_separation_energy(self):
         for entry in self.novel_entries:
             e_phase_sep_pd = self.pd.get_phase_separation_energy(entry)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import multiprocessing
 
 import matplotlib.pyplot as plt
@@ -246,6 +247,25 @@ class TestPourbaixDiagram:
         entry = self.pbx.get_stable_entry(0, 0)
         assert entry.entry_id == "ion-0"
 
+    def test_get_stable_entry_map(self):
+        ph, v = np.meshgrid(np.linspace(-2, 16, 25), np.linspace(-3, 3, 20))
+        stable_map = self.pbx.get_stable_entry_map(ph, v)
+        assert stable_map.shape == ph.shape
+        for (row, col), idx in np.ndenumerate(stable_map):
+            energies = [
+                entry.normalized_energy_at_conditions(ph[row, col], v[row, col]) for entry in self.pbx.stable_entries
+            ]
+            assert idx == np.argmin(energies)
+
+    def test_get_decomposition_energies(self):
+        entries = self.test_data["Zn"]
+        ph, v = np.meshgrid(np.linspace(0, 14, 8), np.linspace(-2, 2, 6))
+        energies = self.pbx_no_filter.get_decomposition_energies(entries, ph, v)
+        assert energies.shape == (len(entries), *ph.shape)
+        for entry, e_decomp in zip(entries, energies, strict=True):
+            assert e_decomp == approx(self.pbx_no_filter.get_decomposition_energy(entry, ph, v))
+        assert (energies >= -1e-8).all()
+
     def test_multielement_parallel(self):
         # Simple test to ensure that multiprocessing is working
         test_entries = self.test_data["Ag-Te-N"]
@@ -253,6 +273,25 @@ class TestPourbaixDiagram:
         pbx = PourbaixDiagram(test_entries, filter_solids=True, nproc=nproc)
         assert len(pbx.stable_entries) == 49
 
+    def test_get_multientries(self):
+        pbx = PourbaixDiagram(self.test_data["Ag-Te"], filter_solids=True)
+        entries = pbx._filtered_entries
+        prod_comp = Composition(pbx._elt_comp)
+        combos = [combo for size in (1, 2) for combo in itertools.combinations(range(len(entries)), size)]
+
+        expected = []
+        for combo in combos:
+            multi_entry = PourbaixDiagram.process_multientry([entries[idx] for idx in combo], prod_comp)
+            if multi_entry is not None:
+                expected.append(multi_entry)
+
+        for nproc in (None, 2):
+            multi_entries = PourbaixDiagram._get_multientries(entries, combos, prod_comp, nproc=nproc)
+            assert len(multi_entries) == len(expected)
+            for multi_entry, expected_entry in zip(multi_entries, expected, strict=True):
+                assert multi_entry.entry_id == expected_entry.entry_id
+                assert multi_entry.weights == approx(expected_entry.weights)
+
     def test_solid_filter(self):
         entries = self.test_data["Zn"]
         pbx = PourbaixDiagram(entries, filter_solids=False)
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import os
+import shutil
+import sqlite3
+from multiprocessing.pool import ThreadPool
+
+import pytest
 from pytest import approx
 
+from pymatgen.apps.borg import queen as borg_queen
 from pymatgen.apps.borg.hive import VaspToComputedEntryDrone
 from pymatgen.apps.borg.queen import BorgQueen
+from pymatgen.entries.entry_io import iter_entries
 from pymatgen.util.testing import TEST_FILES_DIR
 
 __author__ = "Shyue Ping Ong"
@@ -22,8 +30,98 @@ class TestBorgQueen:
         assert len(data) == 1
         assert data[0].energy == approx(0.5559329, 1e-6)
 
+    def test_scan_workers(self, tmp_path):
+        for idx in range(3):
+            os.makedirs(tmp_path / f"run{idx}")
+            shutil.copy(f"{TEST_DIR}/vasprun.xml.xe.gz", tmp_path / f"run{idx}")
+        drone = VaspToComputedEntryDrone()
+        walked = BorgQueen(drone)._get_valid_paths(tmp_path)
+        scanned = BorgQueen(drone, scan_workers=2)._get_valid_paths(tmp_path)
+        assert sorted(walked) == scanned == [str(tmp_path / f"run{idx}") for idx in range(3)]
+
     def test_load_data(self):
         drone = VaspToComputedEntryDrone()
         queen = BorgQueen(drone)
         queen.load_data(f"{TEST_DIR}/assimilated.json")
         assert len(queen.get_data()) == 1
+
+    def test_stream_assimilate(self, tmp_path):
+        for idx in range(4):
+            os.makedirs(tmp_path / "runs" / f"run{idx}")
+            shutil.copy(f"{TEST_DIR}/vasprun.xml.xe.gz", tmp_path / "runs" / f"run{idx}")
+        runs_dir = tmp_path / "runs"
+        filename = tmp_path / "assimilated.jsonl"
+
+        # pretend that a previous run was interrupted after the first directory
+        checkpoint = tmp_path / "assimilated.jsonl.checkpoint"
+        checkpoint.write_text(f"{runs_dir / 'run0'}\n")
+
+        queen = BorgQueen(VaspToComputedEntryDrone(), number_of_drones=2)
+        assert queen.stream_assimilate(runs_dir, filename) == 3
+        assert queen.get_data() == []
+        entries = list(iter_entries(filename))
+        assert len(entries) == 3
+        assert entries[0].energy == approx(0.5559329, 1e-6)
+        assert sorted(checkpoint.read_text().split()) == [str(runs_dir / f"run{idx}") for idx in range(4)]
+
+        # everything is done, so nothing is assimilated again
+        assert BorgQueen(VaspToComputedEntryDrone()).stream_assimilate(runs_dir, filename) == 0
+        assert len(list(iter_entries(filename))) == 3
+
+    @pytest.mark.parametrize("n_drones", [1, 2])
+    def test_manifest(self, tmp_path, monkeypatch, n_drones):
+        for idx in range(3):
+            os.makedirs(tmp_path / "runs" / f"run{idx}")
+            shutil.copy(f"{TEST_DIR}/vasprun.xml.xe.gz", tmp_path / "runs" / f"run{idx}")
+        runs_dir = tmp_path / "runs"
+        manifest = tmp_path / "manifest.sqlite"
+
+        assimilated = []
+        assimilate = VaspToComputedEntryDrone.assimilate
+
+        def counting_assimilate(drone, path):
+            assimilated.append(path)
+            return assimilate(drone, path)
+
+        monkeypatch.setattr(VaspToComputedEntryDrone, "assimilate", counting_assimilate)
+        # assimilate in threads to count the assimilated paths of parallel_assimilate
+        monkeypatch.setattr(borg_queen, "Pool", ThreadPool)
+
+        def get_data(drone=None):
+            return BorgQueen(drone or VaspToComputedEntryDrone(), runs_dir, n_drones, manifest=manifest).get_data()
+
+        data = get_data()
+        assert len(data) == 3
+        assert len(assimilated) == 3
+        assert manifest.is_file()
+
+        # nothing changed, so everything is loaded from the manifest
+        assimilated.clear()
+        cached_data = get_data()
+        assert assimilated == []
+        assert [entry.as_dict() for entry in cached_data] == [entry.as_dict() for entry in data]
+
+        # touching a hashed file does not change its content
+        os.utime(runs_dir / "run0" / "vasprun.xml.xe.gz", ns=(0, 0))
+        get_data()
+        assert assimilated == []
+
+        # only new and modified directories are assimilated again
+        (runs_dir / "run1" / "INCAR").write_text("ISPIN = 2\n")
+        shutil.copytree(runs_dir / "run2", runs_dir / "run3")
+        shutil.rmtree(runs_dir / "run2")
+        data = get_data()
+        assert len(data) == 3
+        assert sorted(assimilated) == [str(runs_dir / "run1"), str(runs_dir / "run3")]
+
+        # records of paths that are gone are dropped
+        conn = sqlite3.connect(manifest)
+        for table in ("fingerprints", "data"):
+            paths = sorted(path for (path,) in conn.execute(f"SELECT path FROM {table}"))  # noqa: S608
+            assert paths == [str(runs_dir / f"run{idx}") for idx in (0, 1, 3)]
+        conn.close()
+
+        # a different drone invalidates the cached data
+        assimilated.clear()
+        get_data(VaspToComputedEntryDrone(inc_structure=True))
+        assert len(assimilated) == 3
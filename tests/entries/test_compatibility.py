@@ -1315,6 +1315,25 @@ class TestMaterialsProjectCompatibility2020:
         processed_entry = compat.process_entry(self.entry_many_anions)
         assert processed_entry.energy == -1
 
+    def test_process_entries_shared_composition(self):
+        # entries with identical compositions reuse the cached corrections, but must still
+        # get their own oxidation states and be checked for invalid U values individually
+        params = {"hubbards": {"Fe": 5.3, "O": 0}, "run_type": "GGA+U"}
+        entries = [ComputedEntry("Fe2O3", -1 - idx, parameters=params, entry_id=idx) for idx in range(3)]
+        bad_u_entry = ComputedEntry("Fe2O3", -1, parameters={"hubbards": {"Fe": 4}, "run_type": "GGA+U"})
+        compat = MaterialsProject2020Compatibility(check_potcar=False)
+
+        processed = compat.process_entries([*entries, bad_u_entry], inplace=False)
+        assert [entry.entry_id for entry in processed] == [0, 1, 2]
+        for idx, entry in enumerate(processed):
+            assert entry.correction == approx(-6.572999)
+            assert entry.energy == approx(-1 - idx - 6.572999)
+            assert entry.data["oxidation_states"] == {"Fe": 3.0, "O": -2.0}
+        assert processed[0].data["oxidation_states"] is not processed[1].data["oxidation_states"]
+
+        with pytest.raises(CompatibilityError, match="Invalid U value of 4.0 on Fe"):
+            compat.process_entry(bad_u_entry, on_error="raise")
+
 
 class TestMITCompatibility:
     def setup_method(self):
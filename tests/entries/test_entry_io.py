@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from monty.serialization import loadfn
+
+from pymatgen.entries.computed_entries import ComputedEntry, ComputedStructureEntry
+from pymatgen.entries.entry_io import iter_entries, load_entries, write_entries
+from pymatgen.util.testing import TEST_FILES_DIR, MatSciTest
+
+TEST_DIR = f"{TEST_FILES_DIR}/entries"
+
+
+class TestEntryIO(MatSciTest):
+    def setup_method(self):
+        self.entries = loadfn(f"{TEST_DIR}/Li-Fe-P-O_entries.json")
+        self.structure_entries = loadfn(f"{TEST_DIR}/TiO2_entries.json")
+
+    def test_round_trip(self):
+        for filename in ("entries.jsonl", "entries.jsonl.gz"):
+            assert write_entries(self.entries, filename) == len(self.entries)
+            entries = load_entries(filename)
+            assert entries == self.entries
+            assert all(isinstance(entry, ComputedEntry) for entry in entries)
+
+        assert write_entries(iter(self.structure_entries), "entries.jsonl.gz", append=True) == len(
+            self.structure_entries
+        )
+        entries = list(iter_entries("entries.jsonl.gz"))
+        assert entries == self.entries + self.structure_entries
+        assert isinstance(entries[-1], ComputedStructureEntry)
+        assert entries[-1].structure == self.structure_entries[-1].structure
+
+    def test_as_dict(self):
+        write_entries((entry.as_dict() for entry in self.entries), "entries.jsonl")
+        dcts = load_entries("entries.jsonl", as_dict=True)
+        assert dcts == [entry.as_dict() for entry in self.entries]
+
+    def test_filters(self):
+        write_entries(self.entries, "entries.jsonl.gz")
+
+        entries = load_entries("entries.jsonl.gz", chemsys="Li-O")
+        assert entries == [entry for entry in self.entries if {el.symbol for el in entry.elements} <= {"Li", "O"}]
+        assert load_entries("entries.jsonl.gz", chemsys=["O", "Li"]) == entries
+
+        entries = load_entries("entries.jsonl.gz", formula="Fe2O3")
+        assert len(entries) > 0
+        assert entries == [entry for entry in self.entries if entry.reduced_formula == "Fe2O3"]
+
+    def test_parallel(self):
+        write_entries(self.entries, "entries.jsonl")
+        assert load_entries("entries.jsonl", n_workers=2, chunk_size=50) == self.entries
+        assert load_entries("entries.jsonl", chemsys="Fe-O", n_workers=2, chunk_size=7) == load_entries(
+            "entries.jsonl", chemsys="Fe-O"
+        )
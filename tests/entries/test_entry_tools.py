@@ -23,6 +23,14 @@ class TestFunc(MatSciTest):
         # Make sure no entries are left behind
         assert sum(len(g) for g in groups) == len(entries)
 
+        # groups are ordered by their first entry, and parallel grouping gives the same result
+        first_indices = [entries.index(group[0]) for group in groups]
+        assert first_indices == sorted(first_indices)
+        parallel_groups = group_entries_by_structure(entries, ncpus=2)
+        assert [[entry.entry_id for entry in group] for group in parallel_groups] == [
+            [entry.entry_id for entry in group] for group in groups
+        ]
+
     def test_group_entries_by_composition(self):
         entries = [
             *starmap(
@@ -67,6 +75,36 @@ class TestEntrySet(MatSciTest):
         ):
             self.entry_set.get_subset_in_chemsys(["Fe", "F"])
 
+    def test_get_subset_after_add_discard(self):
+        def brute_force(chemsys):
+            return {ent for ent in self.entry_set if {el.symbol for el in ent.composition} <= set(chemsys)}
+
+        li_o = self.entry_set.get_subset_in_chemsys(["Li", "O"])
+        assert set(li_o) == brute_force(["Li", "O"])
+        assert set(self.entry_set.get_subset_in_chemsys(["Li", "Fe", "P", "O"])) == set(self.entry_set)
+
+        new_entry = ComputedEntry("Li3O2", -30)
+        self.entry_set.add(new_entry)
+        assert new_entry in self.entry_set.get_subset_in_chemsys(["O", "Li"])
+        assert new_entry not in self.entry_set.get_subset_in_chemsys(["Fe", "O"])
+
+        for entry in list(li_o):
+            self.entry_set.discard(entry)
+        assert set(self.entry_set.get_subset_in_chemsys(["Li", "O"])) == {new_entry}
+        assert set(self.entry_set.get_subset_in_chemsys(["Li", "Fe", "O"])) == brute_force(["Li", "Fe", "O"])
+
+        self.entry_set.add(ComputedEntry("FeF3", -10))
+        assert self.entry_set.chemsys == {"Fe", "F", "Li", "O", "P"}
+        assert len(self.entry_set.get_subset_in_chemsys(["Fe", "F"])) == len(brute_force(["Fe", "F"]))
+
+        # MutableSet methods go through add and discard
+        li_entry = ComputedEntry("Li2O", -20)
+        self.entry_set |= {li_entry}
+        self.entry_set.remove(new_entry)
+        assert set(self.entry_set.get_subset_in_chemsys(["Li", "O"])) == {li_entry}
+        self.entry_set.discard(li_entry)
+        assert set(self.entry_set.get_subset_in_chemsys(["Li", "O"])) == brute_force(["Li", "O"])
+
     def test_remove_non_ground_states(self):
         length = len(self.entry_set)
         self.entry_set.remove_non_ground_states()
@@ -80,6 +118,7 @@ class TestEntrySet(MatSciTest):
     def test_ground_states(self):
         ground_states = self.entry_set.ground_states
         assert len(ground_states) < len(self.entry_set)
+        assert all(self.entry_set.is_ground_state(gs) for gs in ground_states)
 
         # Check if ground states have the lowest energy per atom for each composition
         for gs in ground_states:
@@ -87,3 +126,36 @@ class TestEntrySet(MatSciTest):
                 ent for ent in self.entry_set if ent.composition.reduced_formula == gs.composition.reduced_formula
             ]
             assert gs.energy_per_atom <= min(entry.energy_per_atom for entry in same_comp_entries)
+
+        # ground states are updated when entries are added
+        lowest = min(ground_states, key=lambda e: e.energy_per_atom)
+        new_gs = ComputedEntry(lowest.composition, lowest.energy - 1)
+        self.entry_set.add(new_gs)
+        assert new_gs in self.entry_set.ground_states
+        assert not self.entry_set.is_ground_state(lowest)
+
+        # and when they are removed
+        higher = ComputedEntry(lowest.composition, lowest.energy + 1)
+        self.entry_set.add(higher)
+        assert self.entry_set.is_ground_state(new_gs)
+        self.entry_set.remove(new_gs)
+        assert self.entry_set.is_ground_state(lowest)
+        self.entry_set.remove(lowest)
+        assert not any(self.entry_set.is_ground_state(entry) for entry in (new_gs, lowest))
+        assert self.entry_set.ground_states == {
+            min(group, key=lambda e: e.energy_per_atom)
+            for group in group_entries_by_composition(self.entry_set, sort_by_e_per_atom=False)
+        }
+
+    def test_entries_read_only(self):
+        entries = self.entry_set.entries
+        assert len(entries) == len(self.entry_set)
+        assert not hasattr(entries, "add")
+        assert not hasattr(entries, "discard")
+
+        # the view follows changes made through the EntrySet
+        new_entry = ComputedEntry("Li2O", -20)
+        self.entry_set.add(new_entry)
+        assert new_entry in entries
+        self.entry_set.discard(new_entry)
+        assert new_entry not in entries
@@ -108,6 +108,7 @@ import pandas as pd
 import pytest
 from monty.json import MontyDecoder
 from numpy.testing import assert_allclose
+from pytest import approx
 
 from pymatgen.analysis.phase_diagram import PhaseDiagram
 from pymatgen.analysis.structure_matcher import StructureMatcher
@@ -2039,6 +2040,41 @@ class TestMaterialsProjectDFTMixingSchemeArgs:
         with pytest.raises(KeyError, match="potcar_symbols"):
             MaterialsProjectDFTMixingScheme(check_potcar=True).process_entries(ms_complete.all_entries)
 
+    def test_process_entries_by_chemsys(self, mixing_scheme_no_compat, ms_gga_1_scan):
+        # a second, independent chemical system obtained by substituting Sn -> Pb and Br -> I
+        pb_i_entries = []
+        for entry in ms_gga_1_scan.all_entries:
+            struct = entry.structure.copy()
+            struct.replace_species({"Sn": "Pb", "Br": "I"})
+            pb_i_entries.append(
+                ComputedStructureEntry(
+                    struct, entry.energy - 1, parameters=entry.parameters, entry_id=f"Pb-I-{entry.entry_id}"
+                )
+            )
+        all_entries = copy.deepcopy(ms_gga_1_scan.all_entries) + pb_i_entries
+
+        def get_energies(entries):
+            return {entry.entry_id: entry.energy for entry in entries}
+
+        for n_workers in (1, 2):
+            processed = mixing_scheme_no_compat.process_entries_by_chemsys(
+                copy.deepcopy(all_entries), n_workers=n_workers
+            )
+            assert list(processed) == ["Br-Sn", "I-Pb"]
+            for entries in (ms_gga_1_scan.all_entries, pb_i_entries):
+                expected = mixing_scheme_no_compat.process_entries(entries, inplace=False)
+                chemsys = "-".join(sorted({el.symbol for entry in entries for el in entry.elements}))
+                assert get_energies(processed[chemsys]) == approx(get_energies(expected))
+                assert any(entry.correction != 0 for entry in processed[chemsys])
+
+        # subsystems can be requested explicitly, and entries are mixed independently in each
+        processed = mixing_scheme_no_compat.process_entries_by_chemsys(all_entries, chemsys=["Br", "Sn-Br"])
+        assert list(processed) == ["Br", "Br-Sn"]
+        br_entries = [entry for entry in all_entries if entry.composition.chemical_system == "Br"]
+        expected = mixing_scheme_no_compat.process_entries(br_entries, inplace=False)
+        assert get_energies(processed["Br"]) == approx(get_energies(expected))
+        assert processed["Br"][0] is not processed["Br-Sn"][0]
+
 
 class TestMaterialsProjectDFTMixingSchemeStates:
     """
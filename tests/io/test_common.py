@@ -2,11 +2,21 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pytest
+from numpy.testing import assert_allclose, assert_array_equal
 
+from pymatgen.electronic_structure.core import Spin
+from pymatgen.io import common
 from pymatgen.io.common import PMGDir, VolumetricData
+from pymatgen.io.vasp.outputs import Chgcar
 from pymatgen.util.testing import TEST_FILES_DIR
 
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
 if TYPE_CHECKING:
     from pathlib import Path
 
@@ -24,6 +34,64 @@ def test_cube_io_faithful(tmp_path: Path) -> None:
     assert cube_file.structure == out_cube.structure
 
 
+class TestOutOfCoreVolumetricData:
+    def setup_method(self):
+        self.chgcar = Chgcar.from_file(f"{TEST_FILES_DIR}/io/vasp/outputs/CHGCAR.spin.gz")
+
+    def check_out_of_core(self, vol_data, monkeypatch):
+        # process the 48x48x48 grids in many blocks
+        monkeypatch.setattr(common, "_BLOCK_SIZE", 1000)
+        chgcar = self.chgcar
+        assert vol_data.is_out_of_core
+        assert not chgcar.is_out_of_core
+
+        for ind in range(3):
+            assert_allclose(vol_data.get_average_along_axis(ind), chgcar.get_average_along_axis(ind), rtol=1e-12)
+        assert_array_equal(vol_data.get_integrated_diff(0, 1.5, 3), chgcar.get_integrated_diff(0, 1.5, 3))
+        assert_allclose(
+            vol_data.linear_slice([0, 0, 0], [1, 0.7, 0.3], 50), chgcar.linear_slice([0, 0, 0], [1, 0.7, 0.3], 50)
+        )
+        for spin in Spin:
+            assert_array_equal(vol_data.spin_data[spin], chgcar.spin_data[spin])
+
+        vol_sum = vol_data + vol_data
+        assert vol_sum.is_out_of_core
+        assert vol_sum.value_at(0.3, 0.2, 0.1) == pytest.approx(2 * chgcar.value_at(0.3, 0.2, 0.1))
+        vol_diff = vol_data - chgcar
+        for key, val in (chgcar + chgcar).data.items():
+            assert_array_equal(vol_sum.data[key], val)
+            assert not np.any(vol_diff.data[key])
+
+        vol_copy = vol_data.copy()
+        vol_copy.scale(2)
+        assert_array_equal(vol_copy.data["total"], 2 * chgcar.data["total"])
+        assert_array_equal(vol_data.data["total"], chgcar.data["total"])
+
+    def test_memmap(self, tmp_path, monkeypatch):
+        data = {}
+        for key, val in self.chgcar.data.items():
+            np.save(f"{tmp_path}/{key}.npy", val)
+            data[key] = np.load(f"{tmp_path}/{key}.npy", mmap_mode="r")
+        self.check_out_of_core(Chgcar(self.chgcar.poscar, data, data_aug=self.chgcar.data_aug), monkeypatch)
+
+    @pytest.mark.skipif(h5py is None, reason="h5py required for HDF5 support.")
+    def test_hdf5(self, tmp_path, monkeypatch):
+        self.chgcar.to_hdf5(f"{tmp_path}/chgcar.h5", chunks=True)
+        chgcar = Chgcar.from_hdf5(f"{tmp_path}/chgcar.h5", lazy=True)
+        assert isinstance(chgcar.data["total"], h5py.Dataset)
+        assert list(chgcar.data) == list(self.chgcar.data)
+        for key, val in self.chgcar.data.items():
+            assert_array_equal(chgcar.data[key], val)
+        self.check_out_of_core(chgcar, monkeypatch)
+
+        # out-of-core data is written block by block
+        (chgcar + chgcar).to_hdf5(f"{tmp_path}/chgcar_sum.h5")
+        chgcar_sum = Chgcar.from_hdf5(f"{tmp_path}/chgcar_sum.h5")
+        assert not chgcar_sum.is_out_of_core
+        assert list(chgcar_sum.data) == list(self.chgcar.data)
+        assert_array_equal(chgcar_sum.data["total"], 2 * self.chgcar.data["total"])
+
+
 class TestPMGDir:
     def test_getitem(self):
         # Some simple testing of loading and reading since all these were tested in other classes.
@@ -13,7 +13,7 @@ import numpy as np
 import pytest
 from monty.io import zopen
 from monty.shutil import decompress_file
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_array_equal
 from pytest import approx
 
 from pymatgen.core import Element
@@ -43,6 +43,8 @@ from pymatgen.io.vasp.outputs import (
     Wavecar,
     Waveder,
     Xdatcar,
+    _parse_fixed_decimals,
+    _parse_vasp_rows,
 )
 from pymatgen.io.wannier90 import Unk
 from pymatgen.util.testing import FAKE_POTCAR_DIR, TEST_FILES_DIR, VASP_IN_DIR, VASP_OUT_DIR, MatSciTest
@@ -521,6 +523,93 @@ class TestVasprun(MatSciTest):
         ]
         assert vasp_run.as_dict()["input"]["nkpoints"] == 24
 
+    def test_lazy(self, monkeypatch):
+        with gzip.open(f"{VASP_OUT_DIR}/vasprun.xml.gz", mode="rb") as src, open("vasprun.xml", mode="wb") as dst:
+            copyfileobj(src, dst)
+        vasp_run = Vasprun("vasprun.xml", parse_potcar_file=False, parse_projected_eigen=True)
+
+        parse_eigen = Vasprun._parse_eigen
+        parsed_eigen = []
+
+        def spy_parse_eigen(elem):
+            parsed_eigen.append(elem)
+            return parse_eigen(elem)
+
+        monkeypatch.setattr(Vasprun, "_parse_eigen", staticmethod(spy_parse_eigen))
+        lazy_run = Vasprun("vasprun.xml", parse_potcar_file=False, lazy=True, cache_index=True)
+        assert os.path.isfile("vasprun.xml.index.json")
+        # the eigenvalues are only parsed on first access
+        assert parsed_eigen == []
+
+        assert "tdos" not in vars(lazy_run)
+        assert len(lazy_run._lazy_blocks) == 3
+        assert lazy_run.nionic_steps == len(lazy_run.ionic_steps) == vasp_run.nionic_steps == 29
+        assert lazy_run.final_energy == approx(vasp_run.final_energy)
+        assert lazy_run.ionic_steps[3]["e_wo_entrp"] == approx(vasp_run.ionic_steps[3]["e_wo_entrp"])
+        assert lazy_run.structures == vasp_run.structures
+
+        assert lazy_run.efermi == approx(vasp_run.efermi)
+        assert "tdos" in vars(lazy_run)
+        assert lazy_run.complete_dos.as_dict() == vasp_run.complete_dos.as_dict()
+        for spin, eigenvalues in vasp_run.eigenvalues.items():
+            assert_array_equal(lazy_run.eigenvalues[spin], eigenvalues)
+            assert_array_equal(lazy_run.projected_eigenvalues[spin], vasp_run.projected_eigenvalues[spin])
+        assert len(parsed_eigen) == 1
+        assert lazy_run.projected_magnetisation is None
+        assert lazy_run._lazy_blocks == {}
+
+        # Reopening uses the cached index
+        cached_run = Vasprun("vasprun.xml", parse_potcar_file=False, lazy=True, cache_index=True)
+        assert cached_run.as_dict() == lazy_run.as_dict()
+
+        with pytest.raises(ValueError, match="lazy cannot be combined with ionic_step_skip"):
+            Vasprun("vasprun.xml", lazy=True, ionic_step_skip=2)
+
+    @pytest.mark.parametrize("filename", ["vasprun.r2scan.xml.gz", "vasprun.lvel.Si2H.xml.gz"])
+    def test_lazy_eigenvalues(self, filename):
+        # the eigenvalues with occupations of <projected> and not those of the band velocities
+        vasp_run = Vasprun(f"{VASP_OUT_DIR}/{filename}", parse_potcar_file=False, parse_projected_eigen=True)
+        lazy_run = Vasprun(f"{VASP_OUT_DIR}/{filename}", parse_potcar_file=False, lazy=True)
+        for spin, eigenvalues in vasp_run.eigenvalues.items():
+            assert_array_equal(lazy_run.eigenvalues[spin], eigenvalues)
+        assert lazy_run.eigenvalue_band_properties == vasp_run.eigenvalue_band_properties
+        assert lazy_run.as_dict() == vasp_run.as_dict()
+
+    def test_iter_ionic_steps(self):
+        filepath = f"{VASP_OUT_DIR}/vasprun.md.xml.gz"
+        vasp_run = Vasprun(filepath, parse_potcar_file=False)
+        steps = list(Vasprun.iter_ionic_steps(filepath))
+        assert len(steps) == len(vasp_run.ionic_steps) == 10
+        for step, ionic_step in zip(steps, vasp_run.ionic_steps, strict=True):
+            assert step["species"] == vasp_run.atomic_symbols
+            assert_allclose(step["lattice"], ionic_step["structure"].lattice.matrix)
+            assert_allclose(step["frac_coords"], ionic_step["structure"].frac_coords)
+            assert_allclose(step["forces"], ionic_step["forces"])
+            assert_allclose(step["stress"], ionic_step["stress"])
+            assert step["kinetic"] == approx(ionic_step["kinetic"])
+            assert step["e_fr_energy"] == approx(ionic_step["e_fr_energy"])
+
+        steps = list(Vasprun.iter_ionic_steps(filepath, ionic_step_skip=3, ionic_step_offset=1))
+        assert [step["total"] for step in steps] == approx([step["total"] for step in vasp_run.ionic_steps[1::3]])
+
+        traj = Vasprun.read_trajectory(filepath, memmap_dir=".")
+        assert len(traj) == 10
+        assert_allclose(np.load("coords.npy", mmap_mode="r"), traj.coords)
+        assert_allclose(traj.coords[-1], vasp_run.ionic_steps[-1]["structure"].frac_coords)
+        assert_allclose(traj.site_properties[-1]["forces"], vasp_run.ionic_steps[-1]["forces"])
+        assert traj.frame_properties[-1]["e_0_energy"] == approx(vasp_run.final_energy)
+
+        # A run that is still going
+        with gzip.open(filepath, mode="rb") as file:
+            content = file.read()
+        with open("vasprun.xml", mode="wb") as file:
+            file.write(content[: len(content) // 2])
+        with pytest.raises(xml.etree.ElementTree.ParseError):
+            Vasprun.read_trajectory("vasprun.xml")
+        with pytest.warns(UserWarning, match="XML is malformed"):
+            traj = Vasprun.read_trajectory("vasprun.xml", exception_on_bad_xml=False)
+        assert 0 < len(traj) < 10
+
     def test_get_band_structure(self):
         filepath = f"{VASP_OUT_DIR}/vasprun_Si_bands.xml.gz"
         vasp_run = Vasprun(filepath, parse_projected_eigen=True, parse_potcar_file=False)
@@ -661,6 +750,28 @@ class TestVasprun(MatSciTest):
         assert np.isnan(elec_step["e_fr_energy"])
         assert np.isnan(first_ionic_step["forces"]).any()
 
+    def test_parse_vasp_rows(self):
+        rows = ["  -42.2718    1.0000 ", "    0.0031   -0.0000 ", "  123.4567    0.5000 "]
+        values = _parse_fixed_decimals(rows)
+        assert_array_equal(values, [[float(val) for val in row.split()] for row in rows])
+        assert np.signbit(values[1, 1])
+        assert_array_equal(_parse_vasp_rows(rows), values)
+
+        out = np.empty((3, 2))
+        assert _parse_vasp_rows(rows, out=out) is out
+        assert_array_equal(out, values)
+
+        # not fixed-width, or with overflowed values
+        rows = ["  1.0 -2.5e-03 ", "  3.0  4.0 "]
+        assert _parse_fixed_decimals(rows) is None
+        assert_array_equal(_parse_vasp_rows(rows), [[1, -0.0025], [3, 4]])
+        rows = ["    1.0000 ********* "]
+        assert _parse_fixed_decimals(rows) is None
+        with pytest.warns(UserWarning, match="Float overflow"):
+            values = _parse_vasp_rows(rows)
+        assert values[0, 0] == 1
+        assert np.isnan(values[0, 1])
+
     def test_update_potcar(self):
         filepath = f"{VASP_OUT_DIR}/vasprun.xml.gz"
         potcar_path = f"{VASP_IN_DIR}/POTCAR_LiFePO4.gz"
@@ -1312,6 +1423,22 @@ class TestOutcar:
         assert len(outcar.drift) == 79
         assert np.sum(outcar.drift) == approx(0.448010)
 
+    def test_sections(self):
+        full = Outcar(f"{VASP_OUT_DIR}/OUTCAR.lepsilon.gz")
+        outcar = Outcar(f"{VASP_OUT_DIR}/OUTCAR.lepsilon.gz", sections=["nbands", "final_energy_contribs"])
+        assert outcar.data["nbands"] == full.data["nbands"]
+        assert outcar.final_energy_contribs == full.final_energy_contribs
+        assert outcar.final_energy == full.final_energy
+        assert outcar.magnetization == full.magnetization
+        assert full.lepsilon
+        assert not outcar.lepsilon
+        assert outcar.drift == []
+        assert outcar.electrostatic_potential is None
+        assert "nplwvs_at_kpoints" not in outcar.data
+
+        with pytest.raises(ValueError, match="Unknown sections"):
+            Outcar(f"{VASP_OUT_DIR}/OUTCAR.gz", sections=["nbands", "phonons"])
+
     def test_electrostatic_potential(self):
         outcar = Outcar(f"{VASP_OUT_DIR}/OUTCAR.gz")
         assert outcar.ngf == [54, 30, 54]
@@ -1606,6 +1733,27 @@ class TestChgcar(MatSciTest):
                 if idx in (22130, 44255):
                     assert line == "augmentation occupancies   1  15\n"
 
+    def test_parse_irregular_lines(self):
+        # grids are read in bulk, but any number of values per line is supported
+        self.chgcar_spin.write_file(out_path := f"{self.tmp_path}/CHGCAR_pmg")
+        expected = Chgcar.from_file(out_path)
+        with open(out_path, encoding="utf-8") as file:
+            lines = file.readlines()
+        start = lines.index("   48   48   48\n") + 1
+        n_lines = -(-(48**3) // 5)
+        values = "".join(lines[start : start + n_lines]).split()
+        # fewer values on the first line than on the others
+        regrouped = [" ".join(values[:2]) + "\n"]
+        regrouped += [" ".join(values[start : start + 3]) + "\n" for start in range(2, len(values), 3)]
+        lines[start : start + n_lines] = regrouped
+        with open(out_path, mode="w", encoding="utf-8") as file:
+            file.writelines(lines)
+
+        chgcar = Chgcar.from_file(out_path)
+        for key in ("total", "diff"):
+            assert_array_equal(chgcar.data[key], expected.data[key])
+            assert chgcar.data_aug[key] == expected.data_aug[key]
+
     def test_soc_chgcar(self):
         assert set(self.chgcar_NiO_soc.data) == {
             "total",
@@ -1788,6 +1936,36 @@ class TestProcar(MatSciTest):
 
         assert procar.phase_factors[Spin.up][0, 1, 0, 0] == approx(-0.159 + 0.295j)
 
+    def test_selective_loading(self):
+        filepath = f"{VASP_OUT_DIR}/PROCAR.split1.gz"
+        procar = Procar(filepath)
+        selected = Procar(filepath, ions=[3, 1], orbitals=["px", "s"], dtype=np.float32)
+        assert selected.ions == [3, 1]
+        assert selected.orbitals == ["px", "s"]
+        assert selected.data[Spin.up].dtype == selected.xyz_data["x"].dtype == np.float32
+        assert selected.phase_factors[Spin.up].dtype == np.complex64
+        assert selected.data[Spin.up].shape == (procar.nkpoints, procar.nbands, 2, 2)
+
+        orbital_indices = [procar.orbitals.index("px"), procar.orbitals.index("s")]
+        expected = procar.data[Spin.up][:, :, [3, 1]][..., orbital_indices]
+        assert_allclose(selected.data[Spin.up], expected)
+        expected = procar.xyz_data["z"][:, :, [3, 1]][..., orbital_indices]
+        assert_allclose(selected.xyz_data["z"], expected)
+        expected = procar.phase_factors[Spin.up][:, :, [3, 1]][..., orbital_indices]
+        assert_allclose(selected.phase_factors[Spin.up], expected, atol=1e-6)
+        assert selected.get_occupation(1, "s")[Spin.up] == approx(procar.get_occupation(1, "s")[Spin.up])
+
+        structure = Structure(Lattice.cubic(5), ["Si", "Si", "O", "C"], np.eye(4, 3) / 2)
+        elem_proj = selected.get_projection_on_elements(structure)[Spin.up][0][0]
+        assert elem_proj == approx(
+            {"C": selected.data[Spin.up][0, 0, 0].sum(), "Si": selected.data[Spin.up][0, 0, 1].sum()}
+        )
+
+        with pytest.raises(ValueError, match=r"Unknown orbitals \['fz'\]"):
+            Procar(filepath, orbitals=["fz"])
+        with pytest.raises(ValueError, match="Ion indices must be in the range 0 to 3"):
+            Procar(filepath, ions=[4])
+
     def test_phase_factors(self):
         filepath = f"{VASP_OUT_DIR}/PROCAR.phase.gz"
         procar = Procar(filepath)
@@ -2071,6 +2249,32 @@ class TestWavecar(MatSciTest):
         v2_ncl = self.w_ncl.evaluate_wavefunc(ik, ib, r2)
         assert np.abs(mesh_ncl[p1]) / np.abs(mesh_ncl[p2]) == approx(np.abs(v1_ncl) / np.abs(v2_ncl), abs=1e-6)
 
+    def test_lazy(self):
+        poscar = Poscar.from_file(f"{VASP_IN_DIR}/POSCAR")
+        for filename in ("WAVECAR.N2.spin", "WAVECAR.H2_low_symm.gamma", "WAVECAR.H2.ncl"):
+            wavecar = Wavecar(f"{VASP_OUT_DIR}/{filename}")
+            lazy_wavecar = Wavecar(f"{VASP_OUT_DIR}/{filename}", lazy=True)
+            assert lazy_wavecar.vasp_type == wavecar.vasp_type
+            assert len(lazy_wavecar.coeffs) == len(wavecar.coeffs)
+            assert len(lazy_wavecar.coeffs[-1]) == len(wavecar.coeffs[-1])
+            if wavecar.spin == 2:
+                assert_array_equal(lazy_wavecar.coeffs[1][0][3], wavecar.coeffs[1][0][3])
+            else:
+                for lazy_coeffs, coeffs in zip(lazy_wavecar.coeffs[0], wavecar.coeffs[0], strict=True):
+                    assert lazy_coeffs.dtype == coeffs.dtype
+                    assert_array_equal(lazy_coeffs, coeffs)
+
+            assert_array_equal(lazy_wavecar.fft_mesh(0, 1), wavecar.fft_mesh(0, 1))
+            r = np.array([0.1, 0.2, 0.3])
+            assert lazy_wavecar.evaluate_wavefunc(0, 1, r) == approx(wavecar.evaluate_wavefunc(0, 1, r))
+            chgcar = lazy_wavecar.get_parchg(poscar, 0, 1, scale=1)
+            assert_allclose(chgcar.data["total"], wavecar.get_parchg(poscar, 0, 1, scale=1).data["total"])
+
+        with pytest.raises(IndexError):
+            lazy_wavecar.coeffs[0][5]
+        with pytest.raises(ValueError, match="exceed the record length"):
+            Wavecar(f"{VASP_OUT_DIR}/WAVECAR.N2.45210", lazy=True)
+
     def test_get_parchg(self):
         poscar = Poscar.from_file(f"{VASP_IN_DIR}/POSCAR")
 
@@ -2107,6 +2311,22 @@ class TestWavecar(MatSciTest):
         assert chgcar.data["total"].size == np.prod(wavecar.ng * 2)
         assert not np.all(chgcar.data["total"] > 0.0)
 
+        # Several bands and k-points are summed, with the k-points weighted
+        wavecar = Wavecar(f"{VASP_OUT_DIR}/WAVECAR.N2.spin")
+        chgcars = [wavecar.get_parchg(poscar, 0, band) for band in range(4)]
+        for chunk_size, n_workers in [(None, 1), (3, 2)]:
+            chgcar = wavecar.get_parchg(
+                poscar, [0, 0], range(4), weights=[0.25, 0.75], chunk_size=chunk_size, n_workers=n_workers
+            )
+            for key in ("total", "diff"):
+                assert_allclose(chgcar.data[key], sum(chg.data[key] for chg in chgcars), atol=1e-12)
+        with pytest.raises(ValueError, match="Got 1 weights for 2 kpoints"):
+            wavecar.get_parchg(poscar, [0, 0], 0, weights=[1])
+        with pytest.raises(ValueError, match="At least one kpoint and one band are required"):
+            wavecar.get_parchg(poscar, [], 0)
+        with pytest.raises(ValueError, match="At least one kpoint and one band are required"):
+            wavecar.get_parchg(poscar, 0, [], spin=0)
+
         wavecar = self.w_ncl
         wavecar.coeffs.append([np.ones((2, 100))])
         chgcar = wavecar.get_parchg(poscar, -1, 0, phase=False, spinor=None)